@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Invalidation of the shared caches used by the UI.
+
+Vocabularies and community memberships are mostly changed through the REST API,
+so the listeners invalidating the caches are registered in both the UI and the API
+application. This module must not import the UI stack, so that API processes
+do not have to load it.
+
+See :mod:`oarepo_rdm.ui.vocabularies` and :mod:`oarepo_rdm.ui.memberships` for the caches.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app
+from invenio_cache import current_cache
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper
+
+VOCABULARIES_VERSION_KEY = "oarepo_rdm:vocabularies-version"
+"""Key in the shared cache holding the token of the current vocabularies version."""
+
+VOCABULARIES_CHANGED = "oarepo_rdm_vocabularies_changed"
+"""Key in session info marking that vocabularies were changed in the transaction."""
+
+MEMBERSHIPS_KEY_PREFIX = "oarepo_rdm:community-memberships:"
+"""Prefix of the cache keys of user community memberships."""
+
+CHANGED_MEMBERSHIPS = "oarepo_rdm_changed_memberships"
+"""Key in session info collecting ids of users whose memberships changed in the transaction."""
+
+
+def vocabularies_version() -> Any:
+    """Return the token of the current vocabularies version."""
+    return current_cache.get(VOCABULARIES_VERSION_KEY)
+
+
+def bump_vocabularies_version() -> None:
+    """Replace the vocabularies version token, so that all processes drop their cached options."""
+    current_cache.set(VOCABULARIES_VERSION_KEY, uuid.uuid4().hex, timeout=0)
+
+
+def register_vocabulary_change_listeners() -> None:
+    """Bump the vocabularies version after a transaction changing vocabularies commits."""
+    from invenio_vocabularies.records.models import VocabularyMetadata, VocabularyScheme
+
+    for model in (VocabularyMetadata, VocabularyScheme):
+        for event_name in ("after_insert", "after_update", "after_delete"):
+            if not event.contains(model, event_name, _vocabulary_changed):
+                event.listen(model, event_name, _vocabulary_changed)
+    if not event.contains(Session, "after_commit", _bump_changed_vocabularies):
+        event.listen(Session, "after_commit", _bump_changed_vocabularies)
+        event.listen(Session, "after_rollback", _forget_changed_vocabularies)
+
+
+def _vocabulary_changed(_mapper: Mapper, _connection: Connection, target: Any) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[VOCABULARIES_CHANGED] = True
+
+
+def _bump_changed_vocabularies(session: Session) -> None:
+    if session.info.pop(VOCABULARIES_CHANGED, False):
+        bump_vocabularies_version()
+
+
+def _forget_changed_vocabularies(session: Session) -> None:
+    session.info.pop(VOCABULARIES_CHANGED, None)
+
+
+def memberships_cache_key(user_id: str | int) -> str:
+    """Return the cache key of the community memberships of the user."""
+    return f"{MEMBERSHIPS_KEY_PREFIX}{user_id}"
+
+
+def memberships_cache_enabled() -> bool:
+    """Return True if community memberships are cached."""
+    return bool(current_app.config.get("OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE", True))
+
+
+def invalidate_user_communities_memberships(user_ids: set[str | int]) -> None:
+    """Remove the cached memberships of the users."""
+    if user_ids and memberships_cache_enabled():
+        current_cache.delete_many(*(memberships_cache_key(user_id) for user_id in user_ids))
+
+
+def register_membership_change_listeners() -> None:
+    """Invalidate the cached memberships after a transaction changing them commits."""
+    from invenio_communities.members.records.models import MemberModel
+
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        if not event.contains(MemberModel, event_name, _membership_changed):
+            event.listen(MemberModel, event_name, _membership_changed)
+    if not event.contains(Session, "after_commit", _invalidate_changed_memberships):
+        event.listen(Session, "after_commit", _invalidate_changed_memberships)
+        event.listen(Session, "after_rollback", _forget_changed_memberships)
+
+
+def _membership_changed(_mapper: Mapper, _connection: Connection, target: Any) -> None:
+    session = object_session(target)
+    if session is not None and target.user_id is not None:
+        session.info.setdefault(CHANGED_MEMBERSHIPS, set()).add(target.user_id)
+
+
+def _invalidate_changed_memberships(session: Session) -> None:
+    invalidate_user_communities_memberships(session.info.pop(CHANGED_MEMBERSHIPS, set()))
+
+
+def _forget_changed_memberships(session: Session) -> None:
+    session.info.pop(CHANGED_MEMBERSHIPS, None)
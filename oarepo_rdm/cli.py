@@ -24,6 +24,10 @@ from invenio_rdm_records.proxies import current_rdm_records_service
 from oarepo_runtime.proxies import current_runtime
 from sqlalchemy import func
 
+from oarepo_rdm.oai.percolator import init_percolators
+from oarepo_rdm.oai.tasks import reconcile_oai_set_membership
+from oarepo_rdm.records.reindex import model_index_names, reindex_with_current_settings
+
 if TYPE_CHECKING:
     from uuid import UUID
 
@@ -76,6 +80,41 @@ def replace_owner(record_id: str, owner_email: str) -> None:
         uow.commit()
 
 
+@rdm_records.command("rebuild-oai-percolators")  # type: ignore[reportFunctionMemberAccess]
+@with_appcontext
+def rebuild_oai_percolators() -> None:
+    """Rebuild the OAI percolator index without interrupting OAI set membership."""
+    init_percolators()
+    click.secho("OAI percolator index rebuilt.", fg="green")
+
+
+@rdm_records.command("reconcile-oai-sets")  # type: ignore[reportFunctionMemberAccess]
+@click.argument("set-specs", nargs=-1)
+@with_appcontext
+def reconcile_oai_sets(set_specs: tuple[str, ...]) -> None:
+    """Reindex records to update their OAI set membership stored at index time.
+
+    If no set specs are given, all harvestable records are reindexed.
+    """
+    reconcile_oai_set_membership(list(set_specs) or None)
+    click.secho("Records scheduled for reindexing.", fg="green")
+
+
+@rdm_records.command("reindex-with-settings")  # type: ignore[reportFunctionMemberAccess]
+@click.argument("model-codes", nargs=-1)
+@click.option("--keep-old", is_flag=True, help="Keep the old indices, only move the aliases away from them.")
+@with_appcontext
+def reindex_with_settings(model_codes: tuple[str, ...], keep_old: bool) -> None:
+    """Rebuild record and draft indices of the models with the current mapping and index settings.
+
+    If no model codes are given, indices of all RDM models are rebuilt. Do not write
+    to the repository while the indices are being rebuilt.
+    """
+    for index_name in model_index_names(model_codes):
+        new_index = reindex_with_current_settings(index_name, delete_old=not keep_old)
+        click.secho(f"Index {index_name} rebuilt as {new_index}.", fg="green")
+
+
 @rdm_records.command("merge-records")  # type: ignore[reportFunctionMemberAccess]
 @click.argument("old-record-id")
 @click.argument("new-record-id")
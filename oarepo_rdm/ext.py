@@ -10,7 +10,7 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from invenio_records_resources.records.systemfields import IndexField
 from invenio_records_resources.records.systemfields.pid import PIDField
@@ -20,11 +20,15 @@ from oarepo_rdm.records.systemfields.pid import (
     OARepoPIDFieldContext,
 )
 from oarepo_rdm.services.search import MultiplexedSearchOptions
+from oarepo_rdm.utils import FrozenDict, FrozenList
 
 if TYPE_CHECKING:
     from flask import Flask
     from invenio_records_resources.services.records.config import SearchOptions
 
+    from oarepo_rdm.services.dispatch import DispatchSnapshot
+    from oarepo_rdm.services.projection_cache import ProjectionCache
+
 
 class OARepoRDM:
     """OARepo extension of Invenio-RDM."""
@@ -53,6 +57,11 @@ class OARepoRDM:
         app.config.setdefault("INFO_ENDPOINT_COMPONENTS", []).extend(config.INFO_ENDPOINT_COMPONENTS)
         app.config["RDM_RECORDS_ERROR_HANDLERS"].update(config.RDM_RECORDS_ERROR_HANDLERS)
 
+        if app.config.get("OAREPO_RDM_OAI_INDEX_TIME_SETS"):
+            from oarepo_rdm.oai.sets import init_index_time_oai_sets
+
+            init_index_time_oai_sets(app)
+
     @cached_property
     def search_options(self) -> SearchOptions:
         """Return search options."""
@@ -74,54 +83,130 @@ class OARepoRDM:
         return MultiplexedSearchOptions("search_all")
 
     @cached_property
-    def dynamic_rdm_facets(self) -> dict[str, dict[str, Any]]:
+    def dispatch(self) -> DispatchSnapshot:
+        """Return the snapshot of the registered models used to dispatch records to their model.
+
+        Built when the application is finalized, see :mod:`oarepo_rdm.services.dispatch`.
+        """
+        from oarepo_rdm.services.dispatch import build_dispatch_snapshot
+
+        return build_dispatch_snapshot()
+
+    @cached_property
+    def projection_cache(self) -> ProjectionCache | None:
+        """Return the cache of search hit projections, None if it is disabled.
+
+        See :mod:`oarepo_rdm.services.projection_cache`.
+        """
+        if not self.app.config.get("OAREPO_RDM_PROJECTION_CACHE", False):
+            return None
+        from oarepo_rdm.services.projection_cache import ProjectionCache
+
+        return ProjectionCache(
+            max_size=self.app.config.get("OAREPO_RDM_PROJECTION_CACHE_SIZE", 2048),
+            ttl=self.app.config.get("OAREPO_RDM_PROJECTION_CACHE_TTL", 60),
+        )
+
+    @cached_property
+    def dynamic_rdm_facets(self) -> FrozenDict:
         """Return a merged facet registry combining draft and published search options.
 
         Draft facets are listed first; a published facet with the same name overrides
         the draft entry. Each value has the shape expected by the InvenioRDM facet
         configuration API: ``{"facet": <instance>, "ui": {"field": <name>}}``.
+        The registry is read-only, copy it to customize it.
         """
         published = dict(self.search_options.facets)
         drafts = dict(self.draft_search_options.facets)
 
-        return {name: {"facet": facet, "ui": {"field": name}} for name, facet in {**drafts, **published}.items()}
+        return FrozenDict(
+            (name, FrozenDict(facet=facet, ui=FrozenDict(field=name)))
+            for name, facet in {**drafts, **published}.items()
+        )
 
     @cached_property
-    def dynamic_rdm_search(self) -> dict[str, Any]:
+    def dynamic_rdm_search(self) -> FrozenDict:
         """Return search configuration for published records.
 
         Includes facet names from the published search options and the standard sort
         order expected by the InvenioRDM UI (view/download counts are meaningful for
-        publicly visible records).
+        publicly visible records). The configuration is read-only, copy it to customize it.
         """
-        return {
-            "facets": list(self.search_options.facets.keys()),
-            "sort": [
-                "bestmatch",
-                "newest",
-                "oldest",
-                "version",
-                "mostviewed",
-                "mostdownloaded",
-            ],
-        }
+        return FrozenDict(
+            facets=FrozenList(self.search_options.facets.keys()),
+            sort=FrozenList(
+                [
+                    "bestmatch",
+                    "newest",
+                    "oldest",
+                    "version",
+                    "mostviewed",
+                    "mostdownloaded",
+                ]
+            ),
+        )
 
     @cached_property
-    def dynamic_rdm_search_drafts(self) -> dict[str, Any]:
+    def dynamic_rdm_search_drafts(self) -> FrozenDict:
         """Return search configuration for draft records.
 
         Includes facet names from the draft search options and sort options relevant
         to in-progress work. Update-time sorts are included; view/download count sorts
-        are excluded because drafts are not publicly visible.
+        are excluded because drafts are not publicly visible. The configuration is read-only.
+        """
+        return FrozenDict(
+            facets=FrozenList(self.draft_search_options.facets.keys()),
+            sort=FrozenList(["bestmatch", "updated-desc", "updated-asc", "newest", "oldest", "version"]),
+        )
+
+    def merge_search_options(self, app: Flask) -> None:
+        """Merge search options of all the RDM models and put the derived search configuration to app config.
+
+        Called from finalize_app, so the merge does not slow down the first request of each worker.
+        Configuration keys still holding the lazy defaults of initial_config are replaced with the merged,
+        read-only values; keys set to anything else in the application config are left untouched.
         """
-        return {
-            "facets": list(self.draft_search_options.facets.keys()),
-            "sort": ["bestmatch", "updated-desc", "updated-asc", "newest", "oldest", "version"],
+        from oarepo_rdm import initial_config
+
+        for name in ("search_options", "draft_search_options", "versions_search_options", "all_search_options"):
+            getattr(self, name)
+
+        merged_config = {
+            "RDM_FACETS": self.dynamic_rdm_facets,
+            "RDM_SEARCH": self.dynamic_rdm_search,
+            "RDM_SEARCH_DRAFTS": self.dynamic_rdm_search_drafts,
+            "COMMUNITIES_RECORDS_SEARCH": self.dynamic_rdm_search,
         }
+        for key, value in merged_config.items():
+            # identity check, comparing the LocalProxy would compare the merged value it resolves to
+            if app.config.get(key) is getattr(initial_config, key):
+                app.config[key] = value
+
+
+def finalize_app(app: Flask) -> None:
+    """Finalize UI app."""
+    api_finalize_app(app)
 
+    if app.config.get("OAREPO_RDM_VOCABULARY_OPTIONS_CACHE", True) and app.config.get(
+        "OAREPO_RDM_VOCABULARY_OPTIONS_PREWARM"
+    ):
+        from oarepo_rdm.ui.vocabularies import warm_vocabulary_options
 
-def finalize_app(_app: Flask) -> None:
-    """Finalize app."""
+        warm_vocabulary_options(app)
+
+    if app.config.get("OAREPO_RDM_UI_TIMED_HOOKS"):
+        from oarepo_rdm.ui.instrumentation import add_server_timing_header, register_query_counter
+
+        register_query_counter()
+        app.after_request(add_server_timing_header)
+
+
+def api_finalize_app(app: Flask) -> None:
+    """Finalize API app.
+
+    Also called when the UI app is finalized. Must not import the UI stack (oarepo_rdm.ui,
+    invenio_app_rdm.records_ui, oarepo_ui), so that API processes start faster.
+    """
     from invenio_rdm_records.records.api import RDMDraft as InvenioRDMDraft
     from invenio_rdm_records.records.api import RDMRecord as InvenioRDMRecord
     from oarepo_runtime.proxies import current_runtime
@@ -141,3 +226,51 @@ def finalize_app(_app: Flask) -> None:
         "never-used-for-indexing-drafts-search-alias-used-instead",
         search_alias=[*current_runtime.draft_indices],
     )
+
+    app.extensions["oarepo-rdm"].merge_search_options(app)
+    app.extensions["oarepo-rdm"].dispatch  # noqa: B018 # build the snapshot before the first request
+
+    if app.config.get("OAREPO_RDM_MISSING_PID_CACHE", True):
+        from oarepo_rdm.records.missing_pids import register_missing_pid_listeners
+
+        register_missing_pid_listeners()
+
+    # caches of the UI are invalidated by changes made through the API as well
+    if app.config.get("OAREPO_RDM_VOCABULARY_OPTIONS_CACHE", True):
+        from oarepo_rdm.cache_invalidation import register_vocabulary_change_listeners
+
+        register_vocabulary_change_listeners()
+
+    if app.config.get("OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE", True):
+        from oarepo_rdm.cache_invalidation import register_membership_change_listeners
+
+        register_membership_change_listeners()
+
+    from oarepo_rdm.oai.percolator import install_percolator_index_name
+
+    install_percolator_index_name()
+
+    if app.config.get("OAREPO_RDM_OAI_BATCH_SERIALIZATION", True) or app.config.get("OAREPO_RDM_OAI_INDEX_TIME_SETS"):
+        from oarepo_rdm.oai.response import install_oai_response_hooks
+
+        install_oai_response_hooks()
+
+    if app.config.get("OAREPO_RDM_OAI_UPDATE_PERCOLATORS", True):
+        from oarepo_rdm.oai.percolator import register_oai_set_percolator_listeners
+
+        register_oai_set_percolator_listeners()
+
+    if app.config.get("OAREPO_RDM_MODEL_DISCRIMINATOR_INDEX"):
+        from invenio_indexer.signals import before_record_index
+
+        from oarepo_rdm.records.discriminator import add_model_discriminator_before_index
+
+        before_record_index.connect(add_model_discriminator_before_index)
+
+    if app.config.get("OAREPO_RDM_OAI_INDEX_TIME_SETS"):
+        from invenio_indexer.signals import before_record_index
+
+        from oarepo_rdm.oai.sets import add_oai_sets_before_index, register_oai_set_change_listeners
+
+        before_record_index.connect(add_oai_sets_before_index)
+        register_oai_set_change_listeners()
@@ -50,17 +50,86 @@ RDM_RECORDS_COMMUNITY_RECORDS_SERVICE_CLASS = "oarepo_rdm.services.service:OARep
 
 OAISERVER_METADATA_FORMATS = OAIServerMetadataFormats()
 
+OAREPO_RDM_OAI_BATCH_SERIALIZATION = True
+"""Serialize ListRecords pages grouped by model in one pass instead of record by record."""
+
+OAREPO_RDM_OAI_UPDATE_PERCOLATORS = True
+"""Register the percolator queries of changed OAI sets after commit, queueing a rebuild of the index if needed."""
+
+OAREPO_RDM_OAI_INDEX_TIME_SETS = False
+"""Store OAI set membership on records when they are indexed instead of percolating them on each request.
+
+After enabling, run `invenio rdm-records reconcile-oai-sets` to store the sets on already indexed records.
+"""
+
 
 RDM_RECORDS_ERROR_HANDLERS = error_handlers
 APP_RDM_RECORD_LANDING_PAGE_TEMPLATE = "oarepo_rdm/record_detail_iframe.html"
 
+OAREPO_RDM_MISSING_PID_CACHE = True
+"""Remember record pid values that were not found, so that repeated requests do not query the database."""
+
+OAREPO_RDM_MISSING_PID_CACHE_TIMEOUT = 60
+"""Number of seconds a pid value that was not found is remembered."""
+
 APP_RDM_DEPOSIT_FORM_DEFAULTS = {
     "publication_date": lambda: datetime.now().strftime("%Y-%m-%d"),  # noqa: DTZ005
 }
 """Default values pre-filled in the deposit form for new records."""
 
+OAREPO_RDM_VOCABULARY_OPTIONS_CACHE = True
+"""Cache the vocabulary options of the deposit form per locale."""
+
+OAREPO_RDM_VOCABULARY_OPTIONS_CACHE_TIMEOUT = 3600
+"""Number of seconds the cached vocabulary options are used, even if vocabularies were not changed."""
+
+OAREPO_RDM_VOCABULARY_OPTIONS_PREWARM = False
+"""Fill the vocabulary options cache when the application is created.
+
+Needs the database and search cluster to be available at that time.
+"""
+
+OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE = True
+"""Cache community memberships of users shown in the deposit form."""
+
+OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE_TIMEOUT = 60
+"""Number of seconds the community memberships of a user are cached."""
+
+OAREPO_RDM_UI_PREFETCH_WORKERS = 0
+"""Number of threads loading data dependencies of UI components concurrently, 0 to load them one by one."""
+
+OAREPO_RDM_NEW_UPLOAD_PAGE_CACHE = True
+"""Cache the model list and the rendered model cards of the new upload page."""
+
+OAREPO_RDM_UI_TIMED_HOOKS = ()
+"""UI component hooks whose duration and number of SQL statements are measured for each component.
+
+Timing is disabled by default, set for example to ``("form_config", "empty_record", "before_ui_detail")``.
+"""
+
+OAREPO_RDM_UI_SERVER_TIMING = None
+"""Return the UI component measurements in the Server-Timing header, None to return them in debug mode only."""
+
+OAREPO_RDM_FAST_JSON = True
+"""Encode application/json responses of records with orjson, if it is installed."""
+
+OAREPO_RDM_PROJECTION_CACHE = False
+"""Cache the projections of search hits, see oarepo_rdm.services.projection_cache."""
+
+OAREPO_RDM_PROJECTION_CACHE_SIZE = 2048
+"""Maximum number of cached projections of search hits per process."""
+
+OAREPO_RDM_PROJECTION_CACHE_TTL = 60
+"""Number of seconds a projection of a search hit is cached."""
+
+OAREPO_RDM_MODEL_DISCRIMINATOR_INDEX = False
+"""Store the model code in the $model field of indexed RDM records, see oarepo_rdm.records.discriminator."""
+
+OAREPO_RDM_MODEL_DISCRIMINATOR_SEARCH = False
+"""Filter the multiplexed search on the $model field instead of $schema and add the model facet."""
+
 
-# dynamic rdm facets
+# dynamic rdm facets, replaced in finalize_app with the read-only values merged from all the RDM models
 RDM_FACETS = LocalProxy(lambda: current_oarepo_rdm.dynamic_rdm_facets)
 RDM_SEARCH = LocalProxy(lambda: current_oarepo_rdm.dynamic_rdm_search)
 RDM_SEARCH_DRAFTS = LocalProxy(lambda: current_oarepo_rdm.dynamic_rdm_search_drafts)
@@ -21,7 +21,9 @@ from oarepo_rdm.model.presets.rdm.records.draft_record_metadata import (
     RDMDraftRecordMetadataWithFilesPreset,
 )
 from oarepo_rdm.model.presets.rdm.records.parent_record import RDMParentRecordPreset
+from oarepo_rdm.model.presets.rdm.records.rdm_index_settings import RDMIndexSettingsPreset
 from oarepo_rdm.model.presets.rdm.records.rdm_mapping import RDMMappingPreset
+from oarepo_rdm.model.presets.rdm.records.rdm_model_discriminator import RDMModelDiscriminatorPreset
 from oarepo_rdm.model.presets.rdm.records.record import RDMRecordPreset
 from oarepo_rdm.model.presets.rdm.records.record_metadata import (
     RDMRecordMetadataWithFilesPreset,
@@ -89,6 +91,8 @@ from oarepo_rdm.model.presets.rdm_metadata.rdm_record_root_labels import (
 
 rdm_static_preset = [
     RDMMappingPreset,
+    RDMIndexSettingsPreset,
+    RDMModelDiscriminatorPreset,
     RDMDraftRecordPreset,
     RDMParentRecordPreset,
     RDMRecordPreset,
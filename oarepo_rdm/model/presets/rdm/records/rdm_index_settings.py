@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Preset for tuning the search index settings of RDM models.
+
+The settings are taken from the ``index_settings`` key of the model configuration:
+
+.. code-block:: python
+
+    model(
+        "mymodel",
+        presets=[rdm_complete_preset],
+        configuration={
+            "index_settings": {
+                "number_of_shards": 2,
+                "number_of_replicas": 1,
+                "refresh_interval": "5s",
+                "codec": "best_compression",
+                # index sorting, so that the default "newest" sort can terminate early
+                "sort": [("created", "desc")],
+                # keyword fields that are used in facets
+                "eager_global_ordinals": ["metadata.resource_type.id", "parent.communities.ids"],
+                # overrides for the draft index
+                "drafts": {"sort": [("updated", "desc")], "refresh_interval": "1s"},
+            }
+        },
+    )
+
+Static settings (shards, codec, sort) are applied only when the index is created; use
+``invenio rdm-records reindex-with-settings`` to apply them to existing indices.
+
+The ``eager_global_ordinals`` paths must point to fields that are already mapped
+when the preset is applied, otherwise building the model fails with a ValueError.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import partial
+from typing import TYPE_CHECKING, Any, override
+
+from oarepo_model.customizations import Customization, PatchJSONFile
+from oarepo_model.presets import Preset
+from oarepo_model.utils import readonly_dict_merger
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+INDEX_SETTINGS = ("number_of_shards", "number_of_replicas", "refresh_interval", "codec")
+"""Keys of the configuration copied to the index settings as they are."""
+
+
+def missing_field_paths(mapping: Mapping[str, Any], paths: Iterable[str]) -> list[str]:
+    """Return the dotted paths that do not point to a mapped leaf (non-object) field of the mapping."""
+    missing: list[str] = []
+    for path in paths:
+        field: Any = {"properties": mapping.get("mappings", {}).get("properties", {})}
+        for name in path.split("."):
+            properties = field.get("properties") if isinstance(field, Mapping) else None
+            field = properties.get(name) if isinstance(properties, Mapping) else None
+            if field is None:
+                break
+        if not isinstance(field, Mapping) or field.get("type", "object") in ("object", "nested"):
+            missing.append(path)
+    return missing
+
+
+def index_settings_patch(
+    configuration: Mapping[str, Any], *, draft: bool = False, mapping: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return a patch of the mapping file setting up the index according to the configuration.
+
+    :param configuration: the ``index_settings`` of the model configuration
+    :param draft: if True, the ``drafts`` overrides of the configuration are applied
+    :param mapping: content of the mapping file; if given, the ``eager_global_ordinals``
+        paths are checked to exist in it
+    :raises ValueError: if an ``eager_global_ordinals`` path is not mapped
+    """
+    configuration = {k: v for k, v in configuration.items() if k != "drafts"} | (
+        configuration.get("drafts", {}) if draft else {}
+    )
+
+    settings: dict[str, Any] = {key: configuration[key] for key in INDEX_SETTINGS if key in configuration}
+    sort = configuration.get("sort")
+    if sort:
+        if isinstance(sort, str):
+            sort = [(sort, "desc")]
+        settings["sort.field"] = [field for field, _order in sort]
+        settings["sort.order"] = [order for _field, order in sort]
+
+    if mapping is not None:
+        missing = missing_field_paths(mapping, configuration.get("eager_global_ordinals", ()))
+        if missing:
+            raise ValueError(
+                f"eager_global_ordinals in index_settings refer to fields that are not mapped: {', '.join(missing)}"
+            )
+
+    patch: dict[str, Any] = {}
+    if settings:
+        patch["settings"] = {"index": settings}
+    for path in configuration.get("eager_global_ordinals", ()):
+        properties = patch.setdefault("mappings", {}).setdefault("properties", {})
+        *parents, field = path.split(".")
+        for parent in parents:
+            properties = properties.setdefault(parent, {}).setdefault("properties", {})
+        properties.setdefault(field, {})["eager_global_ordinals"] = True
+    return patch
+
+
+class RDMIndexSettingsPreset(Preset):
+    """Preset setting the search index settings from the model configuration."""
+
+    modifies = ("draft-mapping", "record-mapping")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        configuration = model.configuration.get("index_settings")
+        if not configuration:
+            return
+
+        # the patches are computed from the current content of the mapping files, so that
+        # the eager_global_ordinals paths are validated against the fields mapped so far
+        if index_settings_patch(configuration):
+            yield PatchJSONFile("record-mapping", partial(_patch_mapping, configuration, draft=False))
+
+        if index_settings_patch(configuration, draft=True):
+            yield PatchJSONFile("draft-mapping", partial(_patch_mapping, configuration, draft=True))
+
+
+def _patch_mapping(configuration: Mapping[str, Any], mapping: dict[str, Any], *, draft: bool) -> dict[str, Any]:
+    """Return the mapping file content with the index settings applied."""
+    return readonly_dict_merger.merge(mapping, index_settings_patch(configuration, draft=draft, mapping=mapping))
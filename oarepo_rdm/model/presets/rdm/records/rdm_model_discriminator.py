@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Preset mapping the model discriminator field of RDM records.
+
+The field is a doc-valued keyword holding the code of the model, see
+:mod:`oarepo_rdm.records.discriminator`. With ``"constant_model_discriminator": True``
+in the model configuration, it is mapped as ``constant_keyword`` instead; the value is
+taken from the first indexed document, so each index must hold a single model.
+
+The preset also adds :class:`~oarepo_rdm.records.discriminator.ModelDiscriminatorDumperExt`
+to the record dumper, so that the field is dropped when records are loaded from the index.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from oarepo_model.customizations import AddToList, Customization, PatchJSONFile
+from oarepo_model.presets import Preset
+
+from oarepo_rdm.records.discriminator import MODEL_FIELD, ModelDiscriminatorDumperExt
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+
+class RDMModelDiscriminatorPreset(Preset):
+    """Preset adding the model discriminator field to the record and draft mappings."""
+
+    modifies = ("draft-mapping", "record-mapping", "record_dumper_extensions")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        if model.configuration.get("constant_model_discriminator"):
+            field_mapping: dict[str, Any] = {"type": "constant_keyword"}
+        else:
+            field_mapping = {"type": "keyword", "doc_values": True}
+        patch = {"mappings": {"properties": {MODEL_FIELD: field_mapping}}}
+
+        yield PatchJSONFile("draft-mapping", patch)
+        yield PatchJSONFile("record-mapping", patch)
+        yield AddToList("record_dumper_extensions", ModelDiscriminatorDumperExt())
@@ -13,32 +13,39 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, override
 
 from invenio_i18n import lazy_gettext as _
-from invenio_rdm_records.resources.config import csl_url_args_retriever
-from invenio_rdm_records.resources.serializers import (  # type: ignore[reportAttributeAccessIssue]
-    BibtexSerializer,  # type: ignore[reportAttributeAccessIssue]
-    CSLJSONSerializer,  # type: ignore[reportAttributeAccessIssue]
-    CSVRecordSerializer,  # type: ignore[reportAttributeAccessIssue]
-    DataCite43XMLSerializer,  # type: ignore[reportAttributeAccessIssue]
-    DataPackageSerializer,  # type: ignore[reportAttributeAccessIssue]
-    DCATSerializer,  # type: ignore[reportAttributeAccessIssue]
-    DublinCoreXMLSerializer,  # type: ignore[reportAttributeAccessIssue]
-    GeoJSONSerializer,  # type: ignore[reportAttributeAccessIssue]
-    MARCXMLSerializer,  # type: ignore[reportAttributeAccessIssue]
-    SchemaorgJSONLDSerializer,  # type: ignore[reportAttributeAccessIssue]
-    StringCitationSerializer,  # type: ignore[reportAttributeAccessIssue]
-)
 from oarepo_model.customizations import AddMetadataExport, Customization
 from oarepo_model.presets import Preset
 
+from oarepo_rdm.resources.records.serializers import lazy_serializer
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from flask_resources.serializers.base import BaseSerializer
     from oarepo_model.builder import InvenioModelBuilder
     from oarepo_model.model import InvenioModel
 
 
+SERIALIZERS = "invenio_rdm_records.resources.serializers"
+"""Module of the RDM serializers, imported when the first of them is used."""
+
+
+def _citation_serializer() -> BaseSerializer:
+    """Create the string citation serializer, importing it only when it is needed."""
+    from invenio_rdm_records.resources.config import csl_url_args_retriever
+    from invenio_rdm_records.resources.serializers import (  # type: ignore[reportAttributeAccessIssue]
+        StringCitationSerializer,  # type: ignore[reportAttributeAccessIssue]
+    )
+
+    return StringCitationSerializer(url_args_retriever=csl_url_args_retriever)  # type: ignore[no-any-return]
+
+
 class RDMCompleteExportsPreset(Preset):
-    """Preset for exporting RDM-complete models."""
+    """Preset for exporting RDM-complete models.
+
+    The serializers are lazy handles shared by all the models, see
+    :mod:`oarepo_rdm.resources.records.serializers`.
+    """
 
     modifies = ("exports",)
 
@@ -53,19 +60,20 @@ class RDMCompleteExportsPreset(Preset):
             code="jsonld",
             name=_("JSON-LD (schema.org)"),
             mimetype="application/ld+json",
-            serializer=SchemaorgJSONLDSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:SchemaorgJSONLDSerializer"),
         )
         yield AddMetadataExport(
             code="csv-full",
             name=_("CSV (full)"),
             mimetype="text/vnd.inveniordm.v1.full+csv",
-            serializer=CSVRecordSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:CSVRecordSerializer"),
         )
         yield AddMetadataExport(
             code="csv-simple",
             name=_("CSV (simple)"),
             mimetype="text/vnd.inveniordm.v1.simple+csv",
-            serializer=CSVRecordSerializer(
+            serializer=lazy_serializer(
+                f"{SERIALIZERS}:CSVRecordSerializer",
                 csv_included_fields=[
                     "id",
                     "created",
@@ -85,7 +93,7 @@ class RDMCompleteExportsPreset(Preset):
             code="marcxml",
             name=_("MARCXML"),
             mimetype="application/marcxml+xml",
-            serializer=MARCXMLSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:MARCXMLSerializer"),
             oai_metadata_prefix="marcxml",
             oai_schema="https://www.loc.gov/standards/marcxml/schema/MARC21slim.xsd",
             oai_namespace="https://www.loc.gov/standards/marcxml/",
@@ -94,19 +102,19 @@ class RDMCompleteExportsPreset(Preset):
             code="csl",
             name=_("CSL JSON"),
             mimetype="application/vnd.citationstyles.csl+json",
-            serializer=CSLJSONSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:CSLJSONSerializer"),
         )
         yield AddMetadataExport(
             code="geojson",
             name=_("GeoJSON"),
             mimetype="application/vnd.geo+json",
-            serializer=GeoJSONSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:GeoJSONSerializer"),
         )
         yield AddMetadataExport(
             code="datacite-xml",
             name=_("DataCite XML"),
             mimetype="application/vnd.datacite.datacite+xml",
-            serializer=DataCite43XMLSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:DataCite43XMLSerializer"),
             oai_metadata_prefix="datacite",
             oai_schema="http://schema.datacite.org/meta/kernel-4.5/metadata.xsd",
             oai_namespace="http://datacite.org/schema/kernel-4",
@@ -115,13 +123,13 @@ class RDMCompleteExportsPreset(Preset):
             code="datapackage",
             name=_("Data Package"),
             mimetype="application/vnd.datapackage.ld+json",
-            serializer=DataPackageSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:DataPackageSerializer"),
         )
         yield AddMetadataExport(
             code="dublincore",
             name=_("Dublin Core XML"),
             mimetype="application/x-dc+xml",
-            serializer=DublinCoreXMLSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:DublinCoreXMLSerializer"),
             oai_metadata_prefix="oai_dc",
             oai_schema="http://www.openarchives.org/OAI/2.0/oai_dc.xsd",
             oai_namespace="http://www.openarchives.org/OAI/2.0/oai_dc/",
@@ -130,19 +138,19 @@ class RDMCompleteExportsPreset(Preset):
             code="citation",
             name=_("Citation"),
             mimetype="text/x-bibliography",
-            serializer=StringCitationSerializer(url_args_retriever=csl_url_args_retriever),
+            serializer=lazy_serializer(_citation_serializer),
         )
         yield AddMetadataExport(
             code="bibtex",
             name=_("BibTeX"),
             mimetype="application/x-bibtex",
-            serializer=BibtexSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:BibtexSerializer"),
         )
         yield AddMetadataExport(
             code="dcat",
             name=_("DCAT XML"),
             mimetype="application/dcat+xml",
-            serializer=DCATSerializer(),
+            serializer=lazy_serializer(f"{SERIALIZERS}:DCATSerializer"),
             oai_metadata_prefix="dcat",
             oai_schema="http://schema.datacite.org/meta/kernel-4/metadata.xsd",
             oai_namespace="https://www.w3.org/ns/dcat",
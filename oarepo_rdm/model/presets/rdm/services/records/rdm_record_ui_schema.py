@@ -12,6 +12,8 @@ This preset modifies the RecordUISchema to remember the serialized record
 in a context variable during serialization. This is needed as we reuse
 Invenio RDM UI serialization functions that are called from within the metadata
 section of the record but they require access to the full serialized record.
+
+Lists of records (many=True) are dumped item by item, each with its own context.
 """
 
 from __future__ import annotations
@@ -56,13 +58,15 @@ class RDMRecordUISchemaPreset(Preset):
             @override
             def dump(self, obj: Any, *, many: bool | None = None) -> Any:
                 many = self.many if many is None else bool(many)
-                if many:
-                    raise NotImplementedError(  # pragma: no cover
-                        "ui_serialized_record contextvar not implemented for many=True"
-                    )
+                if not many:
+                    return self._dump_item(obj)
+                return [self._dump_item(item) for item in obj]
+
+            def _dump_item(self, obj: Any) -> dict[str, Any]:
+                """Dump a single record, with the record in the context."""
                 token = ui_serialized_record.set(obj)
                 try:
-                    ret = cast("dict", super().dump(obj, many=many))
+                    ret = cast("dict", super().dump(obj, many=False))
                     ui = ret.get("ui", {})
                     ui.pop("subjects", None)  # remove subjects as they are not present in original rdm
                     return ret
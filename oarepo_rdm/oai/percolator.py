@@ -12,33 +12,67 @@ InvenioRDM contains partial support for multiple percolators, that is not
 working in some places. We work around it by:
 
 1. Declaring a single alias, `OAISERVER_RECORD_INDEX`, that is present on all records
-2. During `invenio search init`, we create a single percolator index called
-   `{OAISERVER_RECORD_INDEX}-percolator` and merge mappings from all the models
-   into this single percolator index. This means that all models must have consistent
-   mappings for shared properties.
+2. During `invenio search init`, we create a single percolator index and merge
+   mappings from all the models into this single percolator index. This means that
+   all models must have consistent mappings for shared properties.
+   The index is created under a versioned name, filled with the queries of all OAI sets
+   and only then the `{OAISERVER_RECORD_INDEX}-percolators` alias is atomically switched
+   to it (and the previous index removed), so OAI set membership keeps working while the
+   index is rebuilt. Sets changed during the rebuild are synchronized afterwards. The rebuild
+   can also be triggered by `invenio rdm-records rebuild-oai-percolators`.
 3. If you do not have consistent models, add OAREPO_PERCOLATOR_MAPPING to your config.
    This should be a function receiving a list of models and returning a json mapping
-   with non-conflicting parts only.
+   with non-conflicting parts only. To keep only the fields used by OAI set queries
+   in the percolator index, set it to
+   `oarepo_rdm.oai.percolator_mapping.create_slim_percolator_mapping`.
 4. Invenio then continues as normal, using the merged percolator index for search
-   queries.
+   queries. invenio-oaiserver looks the index up through the alias, see
+   :func:`build_percolator_index_name`.
+5. invenio-oaiserver registers the query of a created or changed OAI set itself, but
+   it only logs a warning if the registration fails (with the slim mapping, when the
+   query uses a field that is not in the percolator index). After each commit changing
+   OAI sets, the queries are registered again and refreshed, so that the sets apply
+   immediately. If that fails, a rebuild of the percolator index is queued.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 from deepmerge import always_merger
 from flask import current_app
+from invenio_db import db
+from invenio_oaiserver.percolator import (
+    _build_percolator_index_name as oaiserver_build_percolator_index_name,  # noqa: PLC2701 # replaced below
+)
 from invenio_search import current_search_client
+from invenio_search.engine import search
 from invenio_search.utils import build_index_name
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from invenio_oaiserver.models import OAISet
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper
+
+log = logging.getLogger(__name__)
+
+CHANGED_OAI_SET_PERCOLATORS = "oarepo_rdm_changed_oai_set_percolators"
+"""Key in session info collecting search patterns of OAI sets changed in the transaction, by their spec."""
 
 
 def init_percolators() -> None:
     """Initialize OAI percolators.
 
-    This call will fetch all known indices from the opensearch, select the ones
-    that should be merged into the percolated index. It will also add prefixes
-    to the `oaisource` aliases.
+    This call will look up the indices carrying the `oaisource` alias and fetch
+    their mappings, which are merged into the percolated index. It will also add
+    prefixes to the `oaisource` aliases.
     """
     oaiserver_record_index = str(current_app.config["OAISERVER_RECORD_INDEX"])
     prefixed_oaiserver_record_index = build_index_name(oaiserver_record_index, suffix="", app=current_app)
@@ -69,24 +103,219 @@ def _generate_percolator_index(percolated_mappings: dict[str, dict]) -> None:
 
     mapping["mappings"]["properties"]["query"] = {"type": "percolator"}
 
+    percolator_alias = percolator_index_name()
+    percolator_index = f"{percolator_alias}-{datetime.now(UTC):%Y%m%d%H%M%S%f}"
+
+    # build the new index aside, fill it and only then switch the alias to it
+    current_search_client.indices.create(index=percolator_index, body=mapping)
+    _register_oai_set_queries(percolator_index)
+    current_search_client.indices.refresh(index=percolator_index)
+
+    _swap_percolator_alias(percolator_alias, percolator_index)
+
+    # sets changed while the new index was being filled went to the previous index
+    # through the alias, bring the new index up to date with the current sets
+    _sync_oai_set_queries(percolator_index)
+
+
+def percolator_index_name() -> str:
+    """Return the name of the alias pointing to the current percolator index."""
     record_index = str(current_app.config["OAISERVER_RECORD_INDEX"])
-    percolator_index = build_index_name(record_index + "-percolators", suffix="", app=current_app)
+    return build_index_name(record_index + "-percolators", suffix="", app=current_app)
 
-    # remove the previous percolator index and build it again
-    if current_search_client.indices.exists(percolator_index):
-        current_search_client.indices.delete(percolator_index)
 
-    current_search_client.indices.create(index=percolator_index, body=mapping)
+def build_percolator_index_name(index: str) -> str:
+    """Return the percolator index of an OAI record index.
 
+    Replaces ``_build_percolator_index_name`` of invenio-oaiserver, which checks on each
+    call that the percolator index maps the `query` field. It looks the field mapping up
+    under the name it was given, but the response is keyed by the concrete index behind
+    our alias, so the check never passed and the mapping was put again on every lookup.
+    The percolator index is always created with the `query` field, so the alias is returned
+    as it is. Other indices are left to invenio-oaiserver.
+    """
+    percolator_alias = percolator_index_name()
+    prefixed_index = build_index_name(str(index), suffix="", app=current_app)
+    if prefixed_index in (percolator_alias.removesuffix("-percolators"), percolator_alias) and (
+        current_search_client.indices.exists_alias(name=percolator_alias)
+    ):
+        return percolator_alias
+    return oaiserver_build_percolator_index_name(index)
 
-def _get_percolated_mappings(oaiserver_record_index: str, prefixed_oaiserver_record_index: str) -> dict[str, dict]:
-    indices = current_search_client.indices.get("*")
 
-    return {
-        index_name: index
-        for index_name, index in indices.items()
-        if (oaiserver_record_index in index["aliases"] or prefixed_oaiserver_record_index in index["aliases"])
+def install_percolator_index_name() -> None:
+    """Make invenio-oaiserver look up the percolator index by :func:`build_percolator_index_name`."""
+    from invenio_oaiserver import percolator
+
+    percolator._build_percolator_index_name = build_percolator_index_name  # noqa: SLF001 # no config option for it
+
+
+def _register_oai_set_queries(percolator_index: str) -> None:
+    """Index percolator queries of all the OAI sets into the given index."""
+    for spec, query in oai_set_queries():
+        current_search_client.index(
+            index=percolator_index,
+            id=f"oaiset-{spec}",
+            body={"query": query},
+        )
+
+
+def _sync_oai_set_queries(percolator_index: str) -> None:
+    """Register queries of all the OAI sets into the given index and remove queries of deleted sets."""
+    from invenio_search.engine import dsl
+
+    _register_oai_set_queries(percolator_index)
+    current_ids = {f"oaiset-{spec}" for spec, _query in oai_set_queries()}
+    registered_ids = {
+        hit.meta.id for hit in dsl.Search(using=current_search_client, index=percolator_index).source(False).scan()
     }
+    for stale_id in sorted(registered_ids - current_ids):
+        if stale_id.startswith("oaiset-"):
+            current_search_client.delete(index=percolator_index, id=stale_id, ignore=[404])
+    current_search_client.indices.refresh(index=percolator_index)
+
+
+def oai_set_queries(set_specs: Iterable[str] | None = None) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Return (spec, search query) of the OAI sets defined by a search pattern.
+
+    :param set_specs: specs of the sets to return, None to return all the sets
+    """
+    from invenio_oaiserver.models import OAISet
+    from invenio_oaiserver.query import query_string_parser
+
+    if not inspect(db.engine).has_table(OAISet.__tablename__):
+        return  # pragma: no cover # database not initialized yet
+
+    oaisets = OAISet.query.filter(OAISet.search_pattern.isnot(None))
+    if set_specs is not None:
+        oaisets = oaisets.filter(OAISet.spec.in_(list(set_specs)))
+    for oaiset in oaisets:
+        yield oaiset.spec, query_string_parser(search_pattern=oaiset.search_pattern).to_dict()
+
+
+def update_oai_set_percolators(search_patterns: Mapping[str, str | None]) -> None:
+    """Register the current queries of the given OAI sets and make them searchable.
+
+    The database is not read, so this can be called after a transaction commits.
+    If a query can not be registered because the percolator index does not map
+    its fields, a rebuild of the percolator index is queued.
+
+    :param search_patterns: search patterns of the changed sets by their spec,
+                            None for deleted sets or sets without a search pattern
+    """
+    from invenio_oaiserver.query import query_string_parser
+
+    percolator_alias = percolator_index_name()
+    if not current_search_client.indices.exists_alias(name=percolator_alias):
+        return  # percolators not initialized yet
+
+    try:
+        for spec, search_pattern in sorted(search_patterns.items()):
+            if search_pattern:
+                query = query_string_parser(search_pattern=search_pattern).to_dict()
+                current_search_client.index(index=percolator_alias, id=f"oaiset-{spec}", body={"query": query})
+            else:
+                current_search_client.delete(index=percolator_alias, id=f"oaiset-{spec}", ignore=[404])
+    except search.exceptions.RequestError as e:
+        from .tasks import rebuild_oai_percolators
+
+        log.info("Queueing rebuild of OAI percolator index, query of a set can not be registered: %s", e)
+        rebuild_oai_percolators.delay()
+        return
+    current_search_client.indices.refresh(index=percolator_alias)
+
+
+def register_oai_set_percolator_listeners() -> None:
+    """Update the percolator queries of OAI sets after a transaction changing them commits.
+
+    invenio-oaiserver registers the queries itself when the change is flushed, but only
+    logs a warning if that fails. The search patterns are collected when the change is
+    flushed and the queries registered and refreshed only after the commit, so that
+    rolled back changes do not reach the percolator index.
+    """
+    from invenio_oaiserver.models import OAISet
+
+    for event_name, listener in (
+        ("after_insert", _oai_set_percolator_changed),
+        ("after_update", _oai_set_percolator_changed),
+        ("after_delete", _oai_set_percolator_deleted),
+    ):
+        if not event.contains(OAISet, event_name, listener):
+            event.listen(OAISet, event_name, listener)
+    if not event.contains(Session, "after_commit", _update_changed_oai_set_percolators):
+        event.listen(Session, "after_commit", _update_changed_oai_set_percolators)
+        event.listen(Session, "after_rollback", _forget_changed_oai_set_percolators)
+
+
+def _oai_set_percolator_changed(_mapper: Mapper, _connection: Connection, target: OAISet) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CHANGED_OAI_SET_PERCOLATORS, {})[target.spec] = target.search_pattern
+
+
+def _oai_set_percolator_deleted(_mapper: Mapper, _connection: Connection, target: OAISet) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CHANGED_OAI_SET_PERCOLATORS, {})[target.spec] = None
+
+
+def _update_changed_oai_set_percolators(session: Session) -> None:
+    search_patterns = session.info.pop(CHANGED_OAI_SET_PERCOLATORS, None)
+    if search_patterns:
+        update_oai_set_percolators(search_patterns)
+
+
+def _forget_changed_oai_set_percolators(session: Session) -> None:
+    session.info.pop(CHANGED_OAI_SET_PERCOLATORS, None)
+
+
+def _swap_percolator_alias(percolator_alias: str, percolator_index: str) -> None:
+    """Atomically point the percolator alias to the new index and delete the previous indices.
+
+    The alias is added and the previous indices are removed in a single request, so the
+    percolator queries are always available under the alias.
+    """
+    if current_search_client.indices.exists_alias(name=percolator_alias):
+        previous_indices = list(current_search_client.indices.get_alias(name=percolator_alias).keys())
+    elif current_search_client.indices.exists(index=percolator_alias):
+        # percolator index created by a previous version of this library has the same
+        # name as the alias, it is replaced by the alias
+        previous_indices = [percolator_alias]
+    else:
+        previous_indices = []
+
+    current_search_client.indices.update_aliases(
+        body={
+            "actions": [
+                {"add": {"index": percolator_index, "alias": percolator_alias}},
+                *({"remove_index": {"index": index}} for index in previous_indices),
+            ]
+        }
+    )
+
+
+def _get_percolated_mappings(oaiserver_record_index: str, prefixed_oaiserver_record_index: str) -> dict[str, dict]:
+    """Fetch mappings and settings of all indices carrying the oaisource alias.
+
+    The indices are resolved through the alias API first, so that only their
+    definitions (and not those of all the indices in the cluster) are downloaded.
+    The definitions are then fetched in parallel.
+    """
+    # search client is a proxy bound to the app context, threads need the real object
+    search_client = current_search_client._get_current_object()  # type: ignore[attr-defined] # noqa: SLF001
+
+    index_names: set[str] = set()
+    for alias in (oaiserver_record_index, prefixed_oaiserver_record_index):
+        if search_client.indices.exists_alias(name=alias):
+            index_names.update(search_client.indices.get_alias(name=alias).keys())
+    if not index_names:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(index_names), current_app.config.get("OAREPO_PERCOLATOR_FETCH_WORKERS", 8))
+    ) as executor:
+        responses = executor.map(lambda index_name: search_client.indices.get(index=index_name), sorted(index_names))
+        return {index_name: index for response in responses for index_name, index in response.items()}
 
 
 def _create_default_percolator_mapping(mappings: dict[str, dict]) -> dict:
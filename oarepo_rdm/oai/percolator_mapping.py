@@ -0,0 +1,263 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Percolator mapping restricted to the fields used by OAI set queries.
+
+The default percolator mapping is a merge of complete mappings of all the models.
+Percolation cost and heap usage grow with the number of mapped fields, so if
+the OAI sets query only a handful of them, one can set
+
+```
+OAREPO_PERCOLATOR_MAPPING = create_slim_percolator_mapping
+```
+
+in the configuration. The percolator index then contains only the fields referenced
+by the registered OAI set queries together with the analyzers they use. If any of
+the queries can not be analyzed (for example it searches all fields) or references
+a field that is not mapped, the full mapping is used instead.
+
+The mapping is not dynamic, so percolated documents may contain fields that are not
+in the slim mapping. When an OAI set starts to query a field that was not used before,
+its query can not be registered and a rebuild of the percolator index is queued, see
+:func:`oarepo_rdm.oai.percolator.update_oai_set_percolators`.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import re
+from typing import Any
+
+from .percolator import _create_default_percolator_mapping, oai_set_queries
+
+log = logging.getLogger(__name__)
+
+# query types whose body is {field_name: query_on_that_field}
+FIELD_QUERY_TYPES = {
+    "term",
+    "terms",
+    "match",
+    "match_phrase",
+    "match_phrase_prefix",
+    "match_bool_prefix",
+    "prefix",
+    "wildcard",
+    "regexp",
+    "fuzzy",
+    "range",
+}
+
+# keys of field queries that are parameters, not field names
+FIELD_QUERY_PARAMETERS = {"boost", "_name"}
+
+# query types combining other queries
+COMPOUND_QUERY_KEYS = {"must", "should", "filter", "must_not", "query", "positive", "negative", "queries"}
+
+QUOTED_PHRASE = re.compile(r'"(?:[^"\\]|\\.)*"')
+QUERY_STRING_FIELD = re.compile(r"(?<![\w.\\])([A-Za-z_$@][\w.$@-]*)\s*:")
+QUERY_STRING_VALUE = re.compile(r"^\s*(\([^)]*\)|\[[^\]]*\]|\{[^}]*\}|\S+)")
+QUERY_STRING_OPERATORS = re.compile(r"\b(AND|OR|NOT)\b|&&|\|\||[!+\-()]")
+
+# mapping keys that add unknown fields of percolated documents or reject them
+DYNAMIC_MAPPING_KEYS = {"dynamic", "dynamic_templates"}
+
+ANALYSIS_REFERENCES = {
+    "analyzer": "analyzer",
+    "search_analyzer": "analyzer",
+    "search_quote_analyzer": "analyzer",
+    "normalizer": "normalizer",
+}
+
+
+class UnsupportedQueryError(ValueError):
+    """The fields used by the query can not be determined."""
+
+
+def create_slim_percolator_mapping(mappings: dict[str, dict]) -> dict:
+    """Create percolator mapping containing only the fields used by OAI set queries.
+
+    Falls back to the full merged mapping if the fields can not be determined.
+    """
+    full_mapping = _create_default_percolator_mapping(mappings)
+    try:
+        field_paths: set[str] = set()
+        for spec, query in oai_set_queries():
+            try:
+                field_paths |= query_field_paths(query)
+            except UnsupportedQueryError as e:
+                raise UnsupportedQueryError(f"OAI set {spec}: {e}") from e
+        slim_mapping = prune_mapping(full_mapping, field_paths)
+    except UnsupportedQueryError as e:
+        log.warning("Using full percolator mapping: %s", e)
+        return full_mapping
+
+    full_size = len(json.dumps(full_mapping))
+    slim_size = len(json.dumps(slim_mapping))
+    log.info(
+        "Slim percolator mapping has %d fields (%d bytes), full mapping has %d fields (%d bytes), %.0f%% reduction",
+        _count_fields(slim_mapping["mappings"].get("properties", {})),
+        slim_size,
+        _count_fields(full_mapping["mappings"].get("properties", {})),
+        full_size,
+        100 * (1 - slim_size / full_size) if full_size else 0,
+    )
+    return slim_mapping
+
+
+def query_field_paths(query: dict[str, Any]) -> set[str]:
+    """Return paths of all the fields referenced by the (json) search query."""
+    paths: set[str] = set()
+    for query_type, body in query.items():
+        if query_type in FIELD_QUERY_TYPES:
+            paths |= {field for field in body if field not in FIELD_QUERY_PARAMETERS}
+        elif query_type == "exists":
+            paths.add(body["field"])
+        elif query_type in ("query_string", "simple_query_string"):
+            paths |= _query_string_field_paths(body)
+        elif query_type == "multi_match":
+            paths |= _explicit_fields(body.get("fields"))
+        elif query_type in ("match_all", "match_none"):
+            continue
+        elif isinstance(body, dict) and query_type in ("bool", "nested", "constant_score", "boosting", "dis_max"):
+            if query_type == "nested":
+                paths.add(body["path"])
+            for key, subqueries in body.items():
+                if key not in COMPOUND_QUERY_KEYS:
+                    continue
+                for subquery in subqueries if isinstance(subqueries, list) else [subqueries]:
+                    paths |= query_field_paths(subquery)
+        else:
+            raise UnsupportedQueryError(f"unsupported query type {query_type}")
+    return paths
+
+
+def _explicit_fields(fields: list[str] | None) -> set[str]:
+    if not fields:
+        raise UnsupportedQueryError("query searches all fields")
+    # strip boosts, e.g. metadata.title^2
+    ret = {field.split("^", 1)[0] for field in fields}
+    if any("*" in field for field in ret):
+        raise UnsupportedQueryError("query uses wildcard fields")
+    return ret
+
+
+def _query_string_field_paths(body: dict[str, Any]) -> set[str]:
+    """Get fields used in the lucene query string syntax.
+
+    Terms without an explicit field would be searched in the default fields,
+    these are accepted only if the fields are listed in the query.
+    """
+    paths: set[str] = set()
+    remaining = QUOTED_PHRASE.sub(" ", body["query"])
+    while match := QUERY_STRING_FIELD.search(remaining):
+        paths.add(match.group(1))
+        value = QUERY_STRING_VALUE.match(remaining[match.end() :])
+        value_end = match.end() + (value.end() if value else 0)
+        remaining = remaining[: match.start()] + " " + remaining[value_end:]
+    if any("*" in path for path in paths):
+        raise UnsupportedQueryError("query uses wildcard fields")
+
+    if QUERY_STRING_OPERATORS.sub(" ", remaining).strip():
+        if "fields" in body:
+            return paths | _explicit_fields(body["fields"])
+        if "default_field" in body:
+            return paths | _explicit_fields([body["default_field"]])
+        raise UnsupportedQueryError("query searches all fields")
+    return paths
+
+
+def prune_mapping(full_mapping: dict[str, Any], field_paths: set[str]) -> dict[str, Any]:
+    """Keep only the given fields (and analyzers they use) in the mapping."""
+    mappings = full_mapping["mappings"]
+    properties: dict[str, Any] = {}
+    for path in sorted(field_paths):
+        _copy_field(mappings.get("properties", {}), properties, path.split("."), path)
+
+    # percolated documents contain all the fields of the record, those not in the slim
+    # mapping must be ignored instead of being rejected (strict) or added (dynamic templates)
+    slim_mappings = {
+        key: value for key, value in mappings.items() if key != "properties" and key not in DYNAMIC_MAPPING_KEYS
+    }
+    slim_mappings["dynamic"] = False
+    slim_mappings["properties"] = properties
+
+    return {
+        "mappings": copy.deepcopy(slim_mappings),
+        "settings": {"analysis": _used_analysis(full_mapping["settings"].get("analysis", {}), properties)},
+    }
+
+
+def _copy_field(source: dict[str, Any], target: dict[str, Any], segments: list[str], path: str) -> None:
+    """Copy the field at path (relative segments) from source properties to target properties."""
+    name, *rest = segments
+    if name not in source:
+        raise UnsupportedQueryError(f"field {path} is not mapped")
+    field = source[name]
+    if not rest:
+        target[name] = _static_field(field)
+        return
+    if "properties" in field:
+        target_field = target.setdefault(
+            name,
+            {key: value for key, value in field.items() if key != "properties" and key not in DYNAMIC_MAPPING_KEYS},
+        )
+        _copy_field(field["properties"], target_field.setdefault("properties", {}), rest, path)
+    elif "fields" in field and len(rest) == 1 and rest[0] in field["fields"]:
+        # multi-field, e.g. metadata.title.keyword - keep the field together with all its variants
+        target[name] = _static_field(field)
+    else:
+        raise UnsupportedQueryError(f"field {path} is not mapped")
+
+
+def _static_field(field: dict[str, Any]) -> dict[str, Any]:
+    """Return the field definition without the dynamic mapping settings of its (sub)objects."""
+    ret = {key: value for key, value in field.items() if key != "properties" and key not in DYNAMIC_MAPPING_KEYS}
+    if "properties" in field:
+        ret["properties"] = {name: _static_field(subfield) for name, subfield in field["properties"].items()}
+    return ret
+
+
+def _used_analysis(analysis: dict[str, Any], properties: dict[str, Any]) -> dict[str, Any]:
+    """Return the part of analysis settings used by the given properties."""
+    used: dict[str, set[str]] = {"analyzer": set(), "normalizer": set()}
+    _collect_analysis_references(properties, used)
+
+    ret: dict[str, dict[str, Any]] = {}
+    for kind, names in used.items():
+        for name in names:
+            definition = analysis.get(kind, {}).get(name)
+            if definition is None:
+                continue  # built-in analyzer
+            ret.setdefault(kind, {})[name] = definition
+            for component_kind, component_key in (
+                ("tokenizer", "tokenizer"),
+                ("filter", "filter"),
+                ("char_filter", "char_filter"),
+            ):
+                components = definition.get(component_key, [])
+                for component in components if isinstance(components, list) else [components]:
+                    if component in analysis.get(component_kind, {}):
+                        ret.setdefault(component_kind, {})[component] = analysis[component_kind][component]
+    return copy.deepcopy(ret)
+
+
+def _collect_analysis_references(properties: dict[str, Any], used: dict[str, set[str]]) -> None:
+    for field in properties.values():
+        for key, kind in ANALYSIS_REFERENCES.items():
+            if key in field:
+                used[kind].add(field[key])
+        _collect_analysis_references(field.get("properties", {}), used)
+        _collect_analysis_references(field.get("fields", {}), used)
+
+
+def _count_fields(properties: dict[str, Any]) -> int:
+    return sum(
+        1 + _count_fields(field.get("properties", {})) + len(field.get("fields", {})) for field in properties.values()
+    )
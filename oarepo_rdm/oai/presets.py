@@ -12,9 +12,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, override
 
-from oarepo_model.customizations import Customization, PatchJSONFile
+from oarepo_model.customizations import Customization, PatchJSONFile, PrependMixin
 from oarepo_model.presets import Preset
 
+from .sets import OAI_SETS_FIELD
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -70,4 +72,45 @@ class OAIDraftMappingAliasPreset(Preset):
         )
 
 
-oai_preset = [OAIMappingAliasPreset, OAIDraftMappingAliasPreset]
+class OAISetsMappingPreset(Preset):
+    """Add field for OAI set specs stored at index time to record mapping."""
+
+    modifies = ("record-mapping",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        yield PatchJSONFile(
+            "record-mapping",
+            {
+                "mappings": {"properties": {OAI_SETS_FIELD: {"type": "keyword"}}},
+            },
+        )
+
+
+class OAIHarvestableRecordMixin:
+    """Marks published records that are harvestable through OAI-PMH."""
+
+    oai_harvestable = True
+
+
+class OAIRecordPreset(Preset):
+    """Mark the record class as harvestable so that its OAI sets are stored at index time."""
+
+    modifies = ("Record",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        yield PrependMixin("Record", OAIHarvestableRecordMixin)
+
+
+oai_preset = [OAIMappingAliasPreset, OAIDraftMappingAliasPreset, OAISetsMappingPreset, OAIRecordPreset]
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Hook into the ListRecords and ListIdentifiers responses of invenio-oaiserver.
+
+Both verbs fetch the page of records and then look up the sets of all the records
+on the page at once by calling ``invenio_oaiserver.response.sets_search_all``, before
+the header and the metadata of each record are generated. invenio-oaiserver does not
+have a config option for this call, so the function is replaced in the response
+module by :func:`list_sets`, which
+
+* remembers the page for the batch serialization (``OAREPO_RDM_OAI_BATCH_SERIALIZATION``),
+  see :func:`oarepo_rdm.oai.serializer.collect_oai_page`,
+* and returns the sets stored at index time (``OAREPO_RDM_OAI_INDEX_TIME_SETS``),
+  see :mod:`oarepo_rdm.oai.sets`, or found by the percolator of invenio-oaiserver.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask import current_app
+from invenio_oaiserver.percolator import sets_search_all
+
+from .serializer import collect_oai_page
+from .sets import record_list_sets_fetcher
+
+
+def list_sets(records: list[dict[str, Any]]) -> list[list[str]]:
+    """Return set specs of the records on a ListRecords/ListIdentifiers page.
+
+    :param records: sources of the records on the page
+    :return: set specs for each of the records, in the order of the records
+    """
+    if current_app.config.get("OAREPO_RDM_OAI_BATCH_SERIALIZATION", True):
+        collect_oai_page(records)
+
+    if current_app.config.get("OAREPO_RDM_OAI_INDEX_TIME_SETS"):
+        return record_list_sets_fetcher(records)
+    return sets_search_all(records)
+
+
+def install_oai_response_hooks() -> None:
+    """Replace the lookup of the sets of list verbs by :func:`list_sets`."""
+    from invenio_oaiserver import response
+
+    response.sets_search_all = list_sets
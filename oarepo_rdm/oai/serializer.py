@@ -9,13 +9,26 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, cast
 
+from flask import g
+from flask_resources.serializers import MarshmallowSerializer
 from lxml import etree
-from oarepo_runtime import current_runtime
+
+from oarepo_rdm.proxies import current_oarepo_rdm
+from oarepo_rdm.resources.records.serializers import resolve_serializer
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    from flask_principal import Identity
     from flask_resources.serializers import BaseSerializer
+    from invenio_records.api import Record
 
 
 def multiplexing_oai_serializer(
@@ -26,16 +39,193 @@ def multiplexing_oai_serializer(
 ) -> etree._Element:
     """Multiplexing OAI serializer that dispatches to the correct model serializer.
 
+    If the record is a part of the ListRecords page collected by
+    :func:`collect_oai_page`, the whole page is serialized on the first
+    call (see :func:`serialize_oai_page`) and the pre-rendered elements are returned.
+
     :param pid: The PID of the record.
     :param record: The opensearch serialization of the record, [_source] is the record data.
     :param model_serializers: A mapping of JSON schema identifiers to their corresponding serializers.
     :param serializer_kwargs: Additional keyword arguments for the serializer, not used.
     """
-    source = record["_source"]
-    json_schema = source.get("$schema")
-    if not json_schema:
-        raise ValueError(f"Missing JSON schema on record {record}")
-    model = current_runtime.models_by_schema[json_schema]
-    loaded_record = model.record_cls.loads(source)
-    resp = cast("str", model_serializers[json_schema].serialize_object(loaded_record))
-    return etree.fromstring(resp.encode("utf-8"))
+    page = cast("_OAIPage | None", g.get("oarepo_rdm_oai_page"))
+    if page is not None:
+        prerendered = page.prerendered(record["_source"], model_serializers)
+        if prerendered is not None:
+            return prerendered
+    return serialize_oai_page([record], model_serializers)[0]
+
+
+def serialize_oai_page(
+    records: Iterable[dict[str, Any]],
+    model_serializers: dict[str, BaseSerializer],
+) -> list[etree._Element]:
+    """Serialize a page of OAI records, grouped by their model.
+
+    Records are partitioned by their ``$schema``, each group is loaded by
+    :func:`load_records` and dumped by the model's serializer in a single schema
+    pass (for marshmallow serializers). Vocabulary lookups of invenio-rdm-records
+    serializers are done once per page, see :func:`page_vocabulary_lookups`.
+    The returned elements are in the same order as the input records.
+
+    :param records: The opensearch hits, [_source] is the record data.
+    :param model_serializers: A mapping of JSON schema identifiers to their corresponding serializers.
+    """
+    sources = [record["_source"] for record in records]
+    groups: dict[str, list[int]] = defaultdict(list)
+    for idx, source in enumerate(sources):
+        json_schema = source.get("$schema")
+        if not json_schema:
+            raise ValueError(f"Missing JSON schema on record {source}")
+        groups[json_schema].append(idx)
+
+    # lazy serializers are constructed (and their modules imported) before the lookups are memoized
+    serializers = {json_schema: resolve_serializer(model_serializers[json_schema]) for json_schema in groups}
+
+    serialized: list[etree._Element | None] = [None] * len(sources)
+    record_classes = current_oarepo_rdm.dispatch.record_classes
+    with page_vocabulary_lookups():
+        for json_schema, indices in groups.items():
+            loaded_records = load_records(record_classes[json_schema], [sources[idx] for idx in indices])
+            for idx, resp in zip(indices, _serialize_records(serializers[json_schema], loaded_records), strict=True):
+                serialized[idx] = etree.fromstring(resp.encode("utf-8"))
+    return cast("list[etree._Element]", serialized)
+
+
+def _serialize_records(serializer: BaseSerializer, records: list[Any]) -> list[str]:
+    """Serialize the records each into its own document, dumping them at once if possible.
+
+    The serializer must already be resolved (see :func:`resolve_serializer`). The single
+    schema pass is used only for marshmallow serializers that do not customize the
+    serialization of a single object.
+    """
+    if (
+        isinstance(serializer, MarshmallowSerializer)
+        and type(serializer).serialize_object is MarshmallowSerializer.serialize_object
+        and type(serializer).dump_obj is MarshmallowSerializer.dump_obj
+    ):
+        dumped = serializer.object_schema.dump(records, many=True)
+        return [cast("str", serializer.format_serializer.serialize_object(item)) for item in dumped]
+    return [cast("str", serializer.serialize_object(record)) for record in records]
+
+
+def load_records(record_cls: type[Record], sources: list[dict[str, Any]]) -> list[Record]:
+    """Load records of a single model from their indexed form.
+
+    This is :meth:`invenio_records.api.Record.loads` for a list of sources: the
+    sources are copied in one pass and the loader and record extensions are looked
+    up once for the whole list. invenio records do not have a loader of several
+    records, so the dumper is still called for each of them.
+    """
+    loader = record_cls.dumper
+    extensions = record_cls._extensions  # noqa: SLF001 # loads() uses them the same way
+    records = []
+    for data in [loader._copy_data(source) for source in sources]:  # noqa: SLF001 # see Record.loads
+        for extension in extensions:
+            extension.pre_load(data, loader=loader)
+        record = loader.load(data, record_cls)
+        for extension in extensions:
+            extension.post_load(record, data, loader=loader)
+        records.append(record)
+    return records
+
+
+_page_vocabulary_results: ContextVar[dict[Hashable, Any] | None] = ContextVar(
+    "oarepo_rdm_oai_page_vocabulary_results", default=None
+)
+
+_RDM_SERIALIZERS_UTILS = "invenio_rdm_records.resources.serializers.utils"
+"""Module of invenio-rdm-records serializers looking up vocabulary items (get_vocabulary_props)."""
+
+
+class _PageMemoizingVocabularyService:
+    """Vocabulary service returning results of repeated read_all calls within an OAI page from memory."""
+
+    def __init__(self, service: Any) -> None:
+        self._service = service
+
+    def read_all(
+        self,
+        identity: Identity,
+        fields: list[str],
+        type: str,  # noqa: A002 # name of the argument of the vocabulary service
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Read vocabulary items, at most once per page for the same arguments."""
+        results = _page_vocabulary_results.get()
+        if results is None:
+            return self._service.read_all(identity, fields, type, *args, **kwargs)
+        key = (
+            id(identity),
+            type,
+            tuple(fields),
+            json.dumps(
+                [args, {k: v.to_dict() if hasattr(v, "to_dict") else v for k, v in kwargs.items()}],
+                sort_keys=True,
+                default=str,
+            ),
+        )
+        if key not in results:
+            results[key] = self._service.read_all(identity, fields, type, *args, **kwargs)
+        return results[key]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+
+@contextmanager
+def page_vocabulary_lookups() -> Iterator[None]:
+    """Look up each vocabulary item needed by invenio-rdm-records serializers once within the block.
+
+    The serializers (DataCite, Dublin Core, MARCXML, ...) look up the props of vocabulary
+    items (resource types, relation types, ...) for each record. Records on an OAI page
+    mostly share them, so the results are kept for the serialization of the page.
+    """
+    utils = sys.modules.get(_RDM_SERIALIZERS_UTILS)
+    if utils is not None and not isinstance(utils.vocabulary_service, _PageMemoizingVocabularyService):
+        utils.vocabulary_service = _PageMemoizingVocabularyService(utils.vocabulary_service)
+    token = _page_vocabulary_results.set({})
+    try:
+        yield
+    finally:
+        _page_vocabulary_results.reset(token)
+
+
+def _is_deleted(source: dict[str, Any]) -> bool:
+    """Return True if the indexed record is deleted or has a tombstone."""
+    return bool(source.get("is_deleted") or source.get("tombstone"))
+
+
+class _OAIPage:
+    """Records of the ListRecords page of the current request, serialized on first use."""
+
+    def __init__(self, sources: list[dict[str, Any]]) -> None:
+        # the serializer receives the same source objects, so they are identified by id()
+        self._sources = {id(source): source for source in sources}
+        self._elements: dict[int, etree._Element] | None = None
+
+    def prerendered(
+        self,
+        source: dict[str, Any],
+        model_serializers: dict[str, BaseSerializer],
+    ) -> etree._Element | None:
+        """Return the pre-rendered element of the source, None if it is not a part of the page."""
+        if self._sources.get(id(source)) is not source:
+            return None
+        if self._elements is None:
+            # deleted records are not pre-rendered, they are serialized (if ever) one by one
+            page = [page_source for page_source in self._sources.values() if not _is_deleted(page_source)]
+            elements = serialize_oai_page([{"_source": page_source} for page_source in page], model_serializers)
+            self._elements = {id(page_source): element for page_source, element in zip(page, elements, strict=True)}
+        return self._elements.pop(id(source), None)
+
+
+def collect_oai_page(sources: list[dict[str, Any]]) -> None:
+    """Remember the records of the ListRecords page of the current request for batch serialization.
+
+    Called with the sources of all the records on the page before the metadata serializer
+    is called for each of them, see :mod:`oarepo_rdm.oai.response`. The page is serialized
+    by :func:`multiplexing_oai_serializer` on its first call.
+    """
+    g.oarepo_rdm_oai_page = _OAIPage(sources)
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Index-time OAI set membership.
+
+By default, OAI set membership of records is computed by percolating the records
+against the percolator index each time an OAI response is generated. When
+`OAREPO_RDM_OAI_INDEX_TIME_SETS` is enabled:
+
+1. Published records of models using `oai_preset` are percolated once, when they
+   are indexed, and the matched set specs are stored in the `oai_sets` keyword field.
+2. OAI responses read the set specs from this field (GetRecord through
+   `OAISERVER_RECORD_SETS_FETCHER`, ListRecords/ListIdentifiers through
+   :func:`oarepo_rdm.oai.response.list_sets`) and restrict ListRecords/ListIdentifiers
+   with a `set` argument by a plain term filter.
+3. When a set definition changes, after the transaction commits, its percolator query
+   is registered and refreshed and the `reconcile_oai_set_membership` task reindexes
+   the records that were or will be in the set.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app
+from invenio_search import current_search_client
+from invenio_search.engine import dsl, search
+from invenio_search.utils import build_index_name
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from .percolator import percolator_index_name, register_oai_set_percolator_listeners
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from flask import Flask
+    from invenio_oaiserver.models import OAISet
+    from invenio_records.api import Record
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper
+
+log = logging.getLogger(__name__)
+
+OAI_SETS_FIELD = "oai_sets"
+"""Field of the indexed record document holding the set specs."""
+
+CHANGED_OAI_SETS = "oarepo_rdm_changed_oai_sets"
+"""Key in session info collecting specs of OAI sets changed in the transaction."""
+
+
+def percolate_oai_sets(records: list[dict[str, Any]]) -> list[list[str]]:
+    """Percolate the records against the OAI set queries.
+
+    :return: set specs for each of the records, in the order of the records
+    """
+    if not records:
+        return []
+    response = current_search_client.search(
+        index=percolator_index_name(),
+        body={
+            "query": {"percolate": {"field": "query", "documents": records}},
+            "_source": False,
+            "size": current_app.config.get("OAREPO_RDM_OAI_MAX_SETS", 10000),
+        },
+    )
+    sets: list[list[str]] = [[] for _ in records]
+    for hit in response["hits"]["hits"]:
+        spec = hit["_id"].removeprefix("oaiset-")
+        for slot in hit.get("fields", {}).get("_percolator_document_slot", [0]):
+            sets[slot].append(spec)
+    return [sorted(record_sets) for record_sets in sets]
+
+
+def record_sets_fetcher(record: dict[str, Any]) -> list[str]:
+    """Return set specs of a single record (OAISERVER_RECORD_SETS_FETCHER)."""
+    return record_list_sets_fetcher([record])[0]
+
+
+def record_list_sets_fetcher(records: list[dict[str, Any]]) -> list[list[str]]:
+    """Return set specs of the records on a ListRecords/ListIdentifiers page.
+
+    Records indexed before the index-time membership was enabled do not have
+    the set specs stored, these are percolated in a single request.
+    """
+    missing = [idx for idx, record in enumerate(records) if OAI_SETS_FIELD not in record]
+    sets = [list(record.get(OAI_SETS_FIELD, [])) for record in records]
+    for idx, record_sets in zip(missing, percolate_oai_sets([records[idx] for idx in missing]), strict=True):
+        sets[idx] = record_sets
+    return sets
+
+
+def set_records_query(set_spec: str) -> dsl.query.Query:
+    """Return query selecting records in the set (OAISERVER_SET_RECORDS_QUERY_FETCHER)."""
+    return dsl.Q("term", **{OAI_SETS_FIELD: set_spec})
+
+
+def add_oai_sets_before_index(
+    sender: Flask,  # noqa: ARG001 # signal api
+    json: dict[str, Any] | None = None,
+    record: Record | None = None,
+    **kwargs: Any,  # noqa: ARG001 # signal api
+) -> None:
+    """Store set specs on the indexed document of a harvestable record (before_record_index receiver)."""
+    if json is None or not getattr(record, "oai_harvestable", False):
+        return
+    try:
+        json[OAI_SETS_FIELD] = percolate_oai_sets([json])[0]
+    except search.exceptions.NotFoundError:
+        # percolator index not created yet, sets will be percolated when the record is harvested
+        log.warning("OAI percolator index does not exist, not storing OAI sets on record %s", json.get("id"))
+
+
+def init_index_time_oai_sets(app: Flask) -> None:
+    """Switch OAI set membership to the values stored at index time.
+
+    The sets of list verbs are switched by :func:`oarepo_rdm.oai.response.list_sets`.
+    """
+    app.config["OAISERVER_RECORD_SETS_FETCHER"] = record_sets_fetcher
+    app.config["OAISERVER_SET_RECORDS_QUERY_FETCHER"] = set_records_query
+
+
+def register_oai_set_change_listeners() -> None:
+    """Reconcile set membership of records after a transaction changing OAI sets commits."""
+    from invenio_oaiserver.models import OAISet
+
+    # the records are percolated again by the task, the queries of the changed sets
+    # must be registered and searchable by then
+    register_oai_set_percolator_listeners()
+
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        if not event.contains(OAISet, event_name, _oai_set_changed):
+            event.listen(OAISet, event_name, _oai_set_changed)
+    if not event.contains(Session, "after_commit", _reconcile_changed_oai_sets):
+        event.listen(Session, "after_commit", _reconcile_changed_oai_sets)
+        event.listen(Session, "after_rollback", _forget_changed_oai_sets)
+
+
+def _oai_set_changed(_mapper: Mapper, _connection: Connection, target: OAISet) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CHANGED_OAI_SETS, set()).add(target.spec)
+
+
+def _reconcile_changed_oai_sets(session: Session) -> None:
+    set_specs = session.info.pop(CHANGED_OAI_SETS, None)
+    if set_specs:
+        from .tasks import reconcile_oai_set_membership
+
+        reconcile_oai_set_membership.delay(sorted(set_specs))
+
+
+def _forget_changed_oai_sets(session: Session) -> None:
+    session.info.pop(CHANGED_OAI_SETS, None)
+
+
+def records_to_reconcile(set_specs: Iterable[str] | None) -> dict[str, list[str]]:
+    """Return ids of records whose membership in the given sets might have changed, grouped by $schema.
+
+    :param set_specs: specs of changed sets, None to select all harvestable records
+    """
+    from invenio_oaiserver.models import OAISet
+    from invenio_oaiserver.query import query_string_parser
+
+    records_search = dsl.Search(
+        using=current_search_client,
+        index=build_index_name(str(current_app.config["OAISERVER_RECORD_INDEX"]), suffix="", app=current_app),
+    )
+    if set_specs is not None:
+        set_specs = list(set_specs)
+        # records that were in the set ...
+        shoulds = [dsl.Q("terms", **{OAI_SETS_FIELD: set_specs})]
+        # ... and records that are in the set now
+        for oaiset in OAISet.query.filter(OAISet.spec.in_(set_specs), OAISet.search_pattern.isnot(None)):
+            shoulds.append(query_string_parser(search_pattern=oaiset.search_pattern))
+        records_search = records_search.query(dsl.Q("bool", should=shoulds, minimum_should_match=1))
+
+    ids_by_schema: dict[str, list[str]] = defaultdict(list)
+    for hit in records_search.source(["$schema"]).scan():
+        ids_by_schema[hit["$schema"]].append(hit.meta.id)
+    return ids_by_schema
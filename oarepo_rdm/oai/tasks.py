@@ -0,0 +1,37 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Celery tasks for OAI set membership."""
+
+from __future__ import annotations
+
+from celery import shared_task
+from oarepo_runtime import current_runtime
+
+from .percolator import init_percolators
+from .sets import records_to_reconcile
+
+
+@shared_task(ignore_result=True)
+def reconcile_oai_set_membership(set_specs: list[str] | None = None) -> None:
+    """Reindex records whose OAI set membership might have changed.
+
+    The records are percolated again when they are indexed, so that the stored
+    set specs reflect the current set definitions.
+
+    :param set_specs: specs of the changed sets, None to reconcile all harvestable records
+    """
+    for json_schema, record_ids in records_to_reconcile(set_specs).items():
+        model = current_runtime.models_by_schema[json_schema]
+        model.service.indexer.bulk_index(record_ids)
+
+
+@shared_task(ignore_result=True)
+def rebuild_oai_percolators() -> None:
+    """Rebuild the OAI percolator index from the current OAI sets, see :func:`init_percolators`."""
+    init_percolators()
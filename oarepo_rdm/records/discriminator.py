@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Model discriminator stored in the indexed documents of RDM records.
+
+The multiplexed search restricts the query of each model to the documents of that model.
+By default it filters on the ``$schema`` field. With the discriminator, the code of the
+model is stored at index time in the ``$model`` keyword field (see
+:class:`~oarepo_rdm.model.presets.rdm.records.rdm_model_discriminator.RDMModelDiscriminatorPreset`
+for the mapping). A model can map the field as ``constant_keyword``; the filters of the
+other models then match no documents in its index and the search engine skips its shards.
+
+Switching to the discriminator is done in two steps:
+
+1. Enable ``OAREPO_RDM_MODEL_DISCRIMINATOR_INDEX`` after the mapping of existing indices
+   has been updated (``invenio index update-mapping`` or
+   ``invenio rdm-records reindex-with-settings``), then reindex the records
+   (``invenio rdm-records rebuild-index``).
+2. Enable ``OAREPO_RDM_MODEL_DISCRIMINATOR_SEARCH`` to filter on the discriminator
+   and to add the ``model`` facet to the multiplexed search.
+
+The discriminator is not a part of the record. :class:`ModelDiscriminatorDumperExt`
+drops it when a record is loaded from the indexed document, whoever loads it
+(multiplexed and specialized search results, the OAI-PMH serializer).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from flask import current_app
+from invenio_i18n import lazy_gettext as _
+from invenio_records.dumpers import SearchDumperExt
+
+from oarepo_rdm.proxies import current_oarepo_rdm
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from invenio_records_resources.services.records.facets import TermsFacet
+
+MODEL_FIELD = "$model"
+"""Field of the indexed record document holding the code of the model."""
+
+MODEL_FACET = "model"
+"""Name of the facet of the multiplexed search aggregating the records by their model."""
+
+
+def discriminator_search_enabled() -> bool:
+    """Return True if the multiplexed search filters on the discriminator."""
+    return bool(current_app.config.get("OAREPO_RDM_MODEL_DISCRIMINATOR_SEARCH", False))
+
+
+def model_filter(schema: str) -> dict[str, Any]:
+    """Return a filter selecting the documents of the model with the given ``$schema``."""
+    if discriminator_search_enabled():
+        return {"term": {MODEL_FIELD: current_oarepo_rdm.dispatch.rdm_models[schema].model.code}}
+    return {"term": {"$schema": schema}}
+
+
+def model_facet() -> TermsFacet:
+    """Return the facet aggregating the records by their model."""
+    from invenio_records_resources.services.records.facets import TermsFacet
+    from oarepo_runtime import current_runtime
+
+    return TermsFacet(
+        field=MODEL_FIELD,
+        label=_("Model"),
+        value_labels={model.code: model.name for model in current_runtime.rdm_models},
+    )
+
+
+def add_model_discriminator_before_index(
+    sender: Flask,  # noqa: ARG001 # signal api
+    json: dict[str, Any] | None = None,
+    **kwargs: Any,  # noqa: ARG001 # signal api
+) -> None:
+    """Store the code of the model on the indexed document of an RDM record (before_record_index receiver)."""
+    if json is None:
+        return
+    model = current_oarepo_rdm.dispatch.rdm_models.get(json.get("$schema"))
+    if model is not None:
+        json[MODEL_FIELD] = model.model.code
+
+
+class ModelDiscriminatorDumperExt(SearchDumperExt):
+    """Dumper extension dropping the model discriminator when a record is loaded from the index."""
+
+    @override
+    def dump(self, record: Any, data: dict[str, Any]) -> None:
+        """Leave the dumped data as it is, the discriminator is added before the record is indexed."""
+
+    @override
+    def load(self, data: dict[str, Any], record_cls: type) -> None:
+        """Remove the discriminator from the indexed document."""
+        data.pop(MODEL_FIELD, None)
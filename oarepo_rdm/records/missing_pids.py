@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Negative cache of record pid values that do not exist.
+
+Crawlers request many invalid or long gone identifiers. Without the cache, each of the
+requests queries the pidstore before the error response is rendered. Pid values that
+were not found are remembered in the shared invenio cache for
+`OAREPO_RDM_MISSING_PID_CACHE_TIMEOUT` seconds, values that can not be stored in
+the pidstore at all are rejected right away.
+
+A lookup restricted to some pid types (for example those of the published records)
+says nothing about the other types, so the cache entry of a pid value holds the pid
+type scopes in which it was not found. A value missing from all the pid types is
+missing from any scope.
+
+When a persistent identifier is created or changed, its value is removed from the cache
+(immediately and again after the transaction commits), so a newly created record
+is never reported as missing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_pidstore.models import PersistentIdentifier
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper
+
+MISSING_PID_KEY_PREFIX = "oarepo_rdm:missing-pid:"
+"""Prefix of the cache keys of missing pid values."""
+
+CREATED_PIDS = "oarepo_rdm_created_pids"
+"""Key in session info collecting values of persistent identifiers created in the transaction."""
+
+MAX_PID_VALUE_LENGTH = PersistentIdentifier.pid_value.type.length
+"""Longer values can not be stored in the pidstore."""
+
+ALL_PID_TYPES = "*"
+"""Scope of a lookup not restricted to any pid types."""
+
+
+def _enabled() -> bool:
+    return bool(current_app.config.get("OAREPO_RDM_MISSING_PID_CACHE", True))
+
+
+def _cache_key(pid_value: str) -> str:
+    return f"{MISSING_PID_KEY_PREFIX}{pid_value}"
+
+
+def _scope(pid_types: Iterable[str] | None) -> str:
+    return ALL_PID_TYPES if pid_types is None else ",".join(sorted(set(pid_types)))
+
+
+def _too_long(pid_value: str) -> bool:
+    return bool(MAX_PID_VALUE_LENGTH) and len(pid_value) > MAX_PID_VALUE_LENGTH
+
+
+def check_missing_pid(pid_value: str, pid_types: Iterable[str] | None = None) -> None:
+    """Raise PIDDoesNotExistError if the pid value is known not to exist.
+
+    :param pid_types: pid types the lookup is restricted to, None for all pid types
+    """
+    if _too_long(pid_value):
+        raise PIDDoesNotExistError(None, pid_value)
+    if _enabled():
+        missing_in = current_cache.get(_cache_key(pid_value)) or ()
+        if ALL_PID_TYPES in missing_in or _scope(pid_types) in missing_in:
+            raise PIDDoesNotExistError(None, pid_value)
+
+
+def remember_missing_pid(pid_value: str, pid_types: Iterable[str] | None = None) -> None:
+    """Remember that no record of the given pid types has the pid value.
+
+    :param pid_types: pid types the lookup was restricted to, None for all pid types
+    """
+    if _enabled() and not _too_long(pid_value):
+        key = _cache_key(pid_value)
+        current_cache.set(
+            key,
+            {*(current_cache.get(key) or ()), _scope(pid_types)},
+            timeout=current_app.config.get("OAREPO_RDM_MISSING_PID_CACHE_TIMEOUT", 60),
+        )
+
+
+def forget_missing_pids(pid_values: set[str]) -> None:
+    """Remove the pid values from the cache."""
+    if pid_values and _enabled():
+        current_cache.delete_many(*(_cache_key(pid_value) for pid_value in pid_values))
+
+
+def register_missing_pid_listeners() -> None:
+    """Invalidate the cache when persistent identifiers are created or changed."""
+    for event_name in ("after_insert", "after_update"):
+        if not event.contains(PersistentIdentifier, event_name, _pid_changed):
+            event.listen(PersistentIdentifier, event_name, _pid_changed)
+    if not event.contains(Session, "after_commit", _forget_created_pids):
+        event.listen(Session, "after_commit", _forget_created_pids)
+        event.listen(Session, "after_rollback", _discard_created_pids)
+
+
+def _pid_changed(_mapper: Mapper, _connection: Connection, target: PersistentIdentifier) -> None:
+    forget_missing_pids({target.pid_value})
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CREATED_PIDS, set()).add(target.pid_value)
+
+
+def _forget_created_pids(session: Session) -> None:
+    # a concurrent request might have cached the value before the transaction was committed
+    forget_missing_pids(session.info.pop(CREATED_PIDS, set()))
+
+
+def _discard_created_pids(session: Session) -> None:
+    session.info.pop(CREATED_PIDS, None)
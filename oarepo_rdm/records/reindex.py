@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Rebuilding search indices with the current mapping and settings.
+
+Static index settings (number of shards, codec, index sorting) can not be changed
+on an existing index. To apply them, a new index is created from the current mapping
+file, the documents are copied to it with the reindex API and all the aliases of the
+old index (including those added at runtime, such as the OAI alias) are atomically
+moved to the new index. The old index is then deleted.
+
+The documents are copied by a reindex task running in the search cluster, which is
+polled until it completes, so large indices do not hit the request timeout. If the
+copying fails, the new index is deleted and the old index is left as it was.
+
+Documents written to the old index while the documents are copied are not transferred,
+so the rebuild should be run when the repository is not being written to.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from invenio_search import current_search, current_search_client
+from invenio_search.utils import build_alias_name
+from oarepo_runtime import current_runtime
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def model_index_names(model_codes: Iterable[str] | None = None) -> list[str]:
+    """Return names of the record and draft indices of the RDM models, all models if no codes are given."""
+    codes = set(model_codes or ())
+    index_names: list[str] = []
+    for model in current_runtime.rdm_models:
+        if codes and model.code not in codes:
+            continue
+        service = model.service
+        for record_cls in (service.record_cls, service.draft_cls):
+            index_name = record_cls.index._name  # noqa: SLF001 # name of the index before prefixing
+            if index_name not in index_names:
+                index_names.append(index_name)
+    return index_names
+
+
+def reindex_with_current_settings(index_name: str, *, delete_old: bool = True, poll_interval: float = 5) -> str:
+    """Move the documents of the index to a new index created from the current mapping file.
+
+    :param index_name: name of the index as registered in invenio-search (without prefix)
+    :param delete_old: delete the old index after the aliases are moved
+    :param poll_interval: number of seconds between checks of the reindex task
+    :return: name of the new index
+    :raises RuntimeError: if the reindex task failed; the new index is deleted
+    """
+    alias = build_alias_name(index_name)
+    if current_search_client.indices.exists_alias(name=alias):
+        old_indices = list(current_search_client.indices.get_alias(name=alias).keys())
+    else:
+        # index created without a suffix has the name of the alias, it has to be removed
+        # in the same request in which the alias is created
+        old_indices = [alias]
+        delete_old = True
+
+    suffix = f"-{datetime.now(UTC):%Y%m%d%H%M%S%f}"
+    (new_index, _), _ = current_search.create_index(index_name, suffix=suffix, create_write_alias=False)
+
+    try:
+        task = current_search_client.reindex(
+            body={
+                "source": {"index": old_indices},
+                "dest": {"index": new_index, "version_type": "external_gte"},
+            },
+            wait_for_completion=False,
+        )
+        _wait_for_task(task["task"], poll_interval)
+        current_search_client.indices.refresh(index=new_index)
+    except BaseException:
+        current_search_client.indices.delete(index=new_index, ignore_unavailable=True)
+        raise
+
+    actions: list[dict] = []
+    for old_index, definition in current_search_client.indices.get_alias(index=old_indices).items():
+        for alias_name, alias_options in definition["aliases"].items():
+            actions.append({"add": {"index": new_index, "alias": alias_name, **alias_options}})
+        if old_index == alias:
+            actions.append({"add": {"index": new_index, "alias": alias}})
+        if delete_old:
+            actions.append({"remove_index": {"index": old_index}})
+        else:
+            actions.extend(
+                {"remove": {"index": old_index, "alias": alias_name}} for alias_name in definition["aliases"]
+            )
+    current_search_client.indices.update_aliases(body={"actions": actions})
+    return new_index
+
+
+def _wait_for_task(task_id: str, poll_interval: float) -> dict[str, Any]:
+    """Poll the tasks API until the task completes and return its response.
+
+    :raises RuntimeError: if the task failed or some documents could not be copied
+    """
+    while True:
+        status = current_search_client.tasks.get(task_id=task_id)
+        if status.get("completed"):
+            break
+        time.sleep(poll_interval)
+
+    response = status.get("response") or {}
+    if status.get("error") or response.get("failures"):
+        raise RuntimeError(f"Reindex task {task_id} failed: {status.get('error') or response['failures']}")
+    return response
@@ -0,0 +1,276 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Resolution of record persistent identifiers across all RDM models.
+
+Resolving a pid value through a pid type lookup followed by the resolver of the
+specialized record class queries the pidstore twice and the record table once.
+The helpers here fetch the pid row together with the record row in a single query:
+the record table of each model is outer joined on the pid type and the object uuid,
+so a pid value is resolved with one round-trip whichever model it belongs to.
+
+The checks of the persistent identifier are those of :class:`invenio_pidstore.resolver.Resolver`,
+which is the resolver used by the pid fields of all RDM models. Records are constructed
+from the joined rows the same way as in :meth:`invenio_records.api.Record.get_record`,
+record classes overriding ``get_record`` are loaded through it.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from invenio_db import db
+from invenio_pidstore.errors import (
+    PersistentIdentifierError,
+    PIDDeletedError,
+    PIDDoesNotExistError,
+    PIDMissingObjectError,
+    PIDRedirectedError,
+    PIDUnregistered,
+)
+from invenio_pidstore.models import PersistentIdentifier
+from invenio_records.api import Record as InvenioRecord
+from oarepo_runtime import current_runtime
+from sqlalchemy import and_, tuple_
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.exc import NoResultFound  # type: ignore[reportPrivateImportUsage]
+
+from .missing_pids import check_missing_pid, remember_missing_pid
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from invenio_records_resources.records.api import Record
+
+RECORD_OBJECT_TYPE = "rec"
+"""Object type of the persistent identifiers of records (default of the pid field)."""
+
+
+def find_record_pid(pid_value: str, pid_types: Iterable[str]) -> PersistentIdentifier:
+    """Fetch the persistent identifier of a record in a single query.
+
+    :param pid_value: value of the persistent identifier
+    :param pid_types: pid types of the records that can be resolved
+    :raises PIDDoesNotExistError: if no record has the pid value
+    """
+    pid_types = list(pid_types)
+    check_missing_pid(pid_value, pid_types)
+    pid = find_record_pids([pid_value], pid_types).get(pid_value)
+    if pid is None:
+        remember_missing_pid(pid_value, pid_types)
+        raise PIDDoesNotExistError(None, pid_value)
+    return pid
+
+
+def find_pid_type(pid_value: str) -> str:
+    """Return pid type of the record with the pid value, skipping values known not to exist."""
+    check_missing_pid(pid_value)
+    try:
+        return current_runtime.find_pid_type_from_pid(pid_value)
+    except PIDDoesNotExistError:
+        remember_missing_pid(pid_value)
+        raise
+
+
+def find_record_pids(pid_values: Iterable[str], pid_types: Iterable[str]) -> dict[str, PersistentIdentifier]:
+    """Fetch persistent identifiers of records in a single query.
+
+    :param pid_values: values of the persistent identifiers
+    :param pid_types: pid types of the records that can be resolved
+    :return: persistent identifiers keyed by pid value, values that do not exist are left out
+    """
+    pids_by_value: dict[str, list[PersistentIdentifier]] = defaultdict(list)
+    for pid in PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_value.in_(set(pid_values)),
+        PersistentIdentifier.pid_type.in_(list(pid_types)),
+    ):
+        pids_by_value[pid.pid_value].append(pid)
+    return {pid_value: _winning_pid(pid_value, pids) for pid_value, pids in pids_by_value.items()}
+
+
+def find_records_by_pid(
+    pid_values: Iterable[str],
+    record_classes: Mapping[str, type[Record]],
+    with_deleted: bool = False,
+) -> dict[str, tuple[PersistentIdentifier, Record | None]]:
+    """Fetch persistent identifiers of records together with the records in a single query.
+
+    :param pid_values: values of the persistent identifiers
+    :param record_classes: record classes keyed by their pid type
+    :param with_deleted: if True, deleted records are returned as well
+    :return: (persistent identifier, record) keyed by pid value, values that do not exist
+             are left out, the record is None if the pid does not point to an existing record
+    """
+    models = {pid_type: aliased(record_cls.model_cls) for pid_type, record_cls in record_classes.items()}
+    query = db.session.query(PersistentIdentifier, *models.values())
+    for pid_type, model in models.items():
+        join_condition = [
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.object_type == RECORD_OBJECT_TYPE,
+            model.id == PersistentIdentifier.object_uuid,
+        ]
+        if not with_deleted:
+            join_condition.append(model.is_deleted != True)  # noqa: E712 # same filter as Record.get_record
+        query = query.outerjoin(model, and_(*join_condition))
+    query = query.filter(
+        PersistentIdentifier.pid_value.in_(set(pid_values)),
+        PersistentIdentifier.pid_type.in_(list(models)),
+    )
+
+    rows_by_value: dict[str, list[tuple[PersistentIdentifier, Record | None]]] = defaultdict(list)
+    with db.session.no_autoflush:
+        for pid, *model_objs in query:
+            record_cls = record_classes[pid.pid_type]
+            model_obj = next((obj for obj in model_objs if obj is not None), None)
+            rows_by_value[pid.pid_value].append((pid, _record_from_model(record_cls, pid, model_obj, with_deleted)))
+
+    ret: dict[str, tuple[PersistentIdentifier, Record | None]] = {}
+    for pid_value, rows in rows_by_value.items():
+        winner = _winning_pid(pid_value, [pid for pid, _record in rows])
+        ret[pid_value] = next(row for row in rows if row[0] is winner)
+    return ret
+
+
+def _winning_pid(pid_value: str, pids: list[PersistentIdentifier]) -> PersistentIdentifier:
+    """Return the pid of the record that owns the pid value."""
+    if len(pids) == 1:
+        return pids[0]
+    # the same value is used by more models, let the runtime decide which one wins
+    pid_type = current_runtime.find_pid_type_from_pid(pid_value)
+    return next(pid for pid in pids if pid.pid_type == pid_type)
+
+
+def _record_from_model(
+    record_cls: type[Record], pid: PersistentIdentifier, model_obj: object | None, with_deleted: bool
+) -> Record | None:
+    """Create the record from its joined database row, as Record.get_record does."""
+    get_record = getattr(record_cls.get_record, "__func__", None)
+    if get_record is not InvenioRecord.get_record.__func__:  # type: ignore[attr-defined]
+        # get_record is customized, load the record through it
+        try:
+            return record_cls.get_record(pid.object_uuid, with_deleted=with_deleted)
+        except NoResultFound:
+            return None
+    if model_obj is None:
+        return None
+    return record_cls(model_obj.data, model=model_obj)  # type: ignore[attr-defined]
+
+
+def find_external_pids(
+    pids: Iterable[tuple[str, str]], pid_types: Iterable[str]
+) -> dict[tuple[str, str], tuple[PersistentIdentifier, str | None]]:
+    """Fetch external persistent identifiers (such as DOIs) together with the pid type of their record.
+
+    The record's pid is joined on the object uuid, so the model owning the object
+    is known without another query.
+
+    :param pids: (scheme, value) pairs of the external persistent identifiers
+    :param pid_types: pid types of the records that can be resolved
+    :return: (external pid, record pid type) keyed by (scheme, value), the record pid type
+             is None if the pid is not assigned to a record (for example it points to a parent)
+    """
+    pairs = set(pids)
+    if not pairs:
+        return {}
+    record_pid = aliased(PersistentIdentifier)
+    rows = (
+        PersistentIdentifier.query.outerjoin(
+            record_pid,
+            and_(
+                record_pid.object_uuid == PersistentIdentifier.object_uuid,
+                record_pid.pid_type.in_(list(pid_types)),
+            ),
+        )
+        .filter(tuple_(PersistentIdentifier.pid_type, PersistentIdentifier.pid_value).in_(pairs))
+        .with_entities(PersistentIdentifier, record_pid.pid_type)
+    )
+    return {(pid.pid_type, pid.pid_value): (pid, record_pid_type) for pid, record_pid_type in rows}
+
+
+def resolve_record_pid(
+    record_classes: Mapping[str, type[Record]],
+    pid_value: str,
+    registered_only: bool = False,
+    with_deleted: bool = False,
+) -> Record:
+    """Resolve the pid value of a record of any model, fetching the pid and the record in one query.
+
+    :param record_classes: record classes keyed by their pid type
+    :raises PIDDoesNotExistError: if no record has the pid value
+    :raises PersistentIdentifierError: the errors of invenio_pidstore.resolver.Resolver
+    """
+    check_missing_pid(pid_value, record_classes.keys())
+    found = find_records_by_pid([pid_value], record_classes, with_deleted=with_deleted).get(pid_value)
+    if found is None:
+        remember_missing_pid(pid_value, record_classes.keys())
+        raise PIDDoesNotExistError(None, pid_value)
+    result = _checked_record(*found, registered_only=registered_only)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def resolve_record_pids(
+    record_classes: Mapping[str, type[Record]],
+    pid_values: Sequence[str],
+    registered_only: bool = False,
+    with_deleted: bool = False,
+) -> list[Record | Exception]:
+    """Resolve pid values of records of any model.
+
+    The persistent identifiers are fetched together with the records in one query.
+
+    A pid that exists but does not point to a record of the classes (for example the pid
+    of a draft that has not been published, resolved with the published record classes)
+    is reported as PIDDoesNotExistError, as pid values that do not exist at all.
+
+    :param record_classes: record classes keyed by their pid type
+    :param pid_values: values of the persistent identifiers
+    :return: a record or the resolution error for each of the pid values, in the same order
+    """
+    if not pid_values:
+        return []
+    found = find_records_by_pid(pid_values, record_classes, with_deleted=with_deleted)
+    ret: list[Record | Exception] = []
+    for pid_value in pid_values:
+        result = (
+            _checked_record(*found[pid_value], registered_only=registered_only)
+            if pid_value in found
+            else PIDDoesNotExistError(None, pid_value)
+        )
+        if isinstance(result, NoResultFound):
+            result = PIDDoesNotExistError(None, pid_value)
+        ret.append(result)
+    return ret
+
+
+def _checked_record(
+    pid: PersistentIdentifier,
+    record: Record | None,
+    registered_only: bool,
+) -> Record | PersistentIdentifierError | NoResultFound:
+    """Return the record, or the error invenio_pidstore.resolver.Resolver would raise for the pid."""
+    if (pid.is_new() or pid.is_reserved()) and registered_only:
+        return PIDUnregistered(pid)
+
+    if pid.is_deleted():
+        return PIDDeletedError(pid, record)
+
+    if pid.is_redirected():
+        return PIDRedirectedError(pid, pid.get_redirect())
+
+    if not pid.get_assigned_object(object_type=RECORD_OBJECT_TYPE):
+        return PIDMissingObjectError(pid.pid_type, pid.pid_value)
+
+    if record is None:
+        return NoResultFound(f"Record {pid.object_uuid} not found")
+
+    # keep the fetched pid on the record, so that record.pid does not query it again
+    record.pid = pid  # type: ignore[attr-defined]
+    return record
@@ -15,7 +15,11 @@ from typing import TYPE_CHECKING, override
 from invenio_records_resources.records.systemfields.pid import PIDFieldContext
 from oarepo_runtime import current_runtime
 
+from ..resolver import resolve_record_pid, resolve_record_pids
+
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from invenio_records_resources.records.api import Record
 
 
@@ -25,11 +29,32 @@ class OARepoPIDFieldContext(PIDFieldContext):
     Unlike normal pid context, this one returns specialized records by pid type.
     """
 
+    @property
+    def record_classes(self) -> Mapping[str, type[Record]]:
+        """Specialized record classes keyed by pid type."""
+        return current_runtime.record_class_by_pid_type
+
     @override
     def resolve(self, pid_value: str, registered_only: bool = False, with_deleted: bool = False) -> Record:
-        """Resolve identifier."""
-        record_cls = current_runtime.record_class_by_pid_type[current_runtime.find_pid_type_from_pid(pid_value)]
-        return record_cls.pid.resolve(pid_value, registered_only=registered_only, with_deleted=with_deleted)
+        """Resolve identifier.
+
+        The persistent identifier and the record are fetched in a single query.
+        """
+        return resolve_record_pid(
+            self.record_classes, pid_value, registered_only=registered_only, with_deleted=with_deleted
+        )
+
+    def resolve_many(
+        self, pid_values: Sequence[str], registered_only: bool = False, with_deleted: bool = False
+    ) -> list[Record | Exception]:
+        """Resolve identifiers of records of any model.
+
+        :return: the record or the resolution error (for example PIDDoesNotExistError
+                 or PIDDeletedError) for each of the pid values, in the same order
+        """
+        return resolve_record_pids(
+            self.record_classes, pid_values, registered_only=registered_only, with_deleted=with_deleted
+        )
 
 
 class OARepoDraftPIDFieldContext(OARepoPIDFieldContext):
@@ -38,8 +63,8 @@ class OARepoDraftPIDFieldContext(OARepoPIDFieldContext):
     Unlike normal pid context, this one returns specialized records by pid type.
     """
 
+    @property
     @override
-    def resolve(self, pid_value: str, registered_only: bool = False, with_deleted: bool = False) -> Record:
-        """Resolve identifier."""
-        record_cls = current_runtime.draft_class_by_pid_type[current_runtime.find_pid_type_from_pid(pid_value)]
-        return record_cls.pid.resolve(pid_value, registered_only=registered_only, with_deleted=with_deleted)
+    def record_classes(self) -> Mapping[str, type[Record]]:
+        """Specialized draft classes keyed by pid type."""
+        return current_runtime.draft_class_by_pid_type
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""JSON serializer encoding with orjson.
+
+The ``application/json`` responses of records are encoded by flask-resources'
+:class:`JSONSerializer`, which uses the pure python json encoder for everything
+that is not a plain string, number or container. For pages of records with
+large metadata, the encoding is a significant part of the response time.
+
+:class:`FastJSONSerializer` encodes the same values as the default serializer -
+lazy strings are translated, dates are encoded as http dates and decimals, uuids
+and dataclasses as flask does. The output is compact and not ascii-escaped, so it
+differs in whitespace and escaping but decodes to the same data. Values orjson
+can not encode (for example integers larger than 64 bits) fall back to the json
+module. orjson is an optional dependency (the ``orjson`` extra); without it,
+the default serializer is used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from flask_resources import MarshmallowSerializer
+from flask_resources.serializers.json import JSONEncoder, JSONSerializer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:
+    from flask_resources.serializers.base import BaseSerializer
+
+_ORJSON_OPTIONS = (
+    0
+    if orjson is None
+    else orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+"""Non-string keys are converted as by json, dates and dataclasses are encoded as by flask."""
+
+
+def fast_json_available() -> bool:
+    """Return True if orjson is installed."""
+    return orjson is not None
+
+
+_encode_default = JSONEncoder().default
+"""Encode values that orjson does not encode natively the same way as the default serializer."""
+
+
+class FastJSONSerializer(JSONSerializer):
+    """JSON serializer producing the same data as flask-resources' JSONSerializer, encoded with orjson."""
+
+    @override
+    def serialize_object(self, obj: Any) -> str:
+        """Dump the object into a json string."""
+        return self._dumps(obj)
+
+    @override
+    def serialize_object_list(self, obj_list: Any) -> str:
+        """Dump the object list into a json string."""
+        return self._dumps(obj_list)
+
+    def _dumps(self, obj: Any) -> str:
+        options = self.dumps_options
+        flags = _ORJSON_OPTIONS
+        if options:
+            if set(options) - {"indent", "sort_keys"} or options.get("indent") not in (None, 2):
+                return super().serialize_object(obj)
+            if options.get("indent"):
+                flags |= orjson.OPT_INDENT_2
+            if options.get("sort_keys"):
+                flags |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_encode_default, option=flags).decode()
+        except orjson.JSONEncodeError:
+            return super().serialize_object(obj)
+
+
+def uses_default_json_encoding(serializer: BaseSerializer) -> bool:
+    """Return True if the serializer dumps with marshmallow and encodes with the default JSONSerializer.
+
+    Only such serializers can be encoded with :class:`FastJSONSerializer` without changing the output.
+    """
+    if not isinstance(serializer, MarshmallowSerializer):
+        return False
+    format_serializer = serializer.format_serializer
+    return type(format_serializer) is JSONSerializer and format_serializer.encoder is JSONEncoder
@@ -14,6 +14,7 @@ import copy
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast, override
 
+from flask import current_app
 from flask_resources import MarshmallowSerializer, ResponseHandler
 from flask_resources.serializers.base import BaseSerializer
 from invenio_records_resources.resources.records.headers import etag_headers
@@ -21,6 +22,11 @@ from marshmallow import Schema
 from oarepo_runtime import current_runtime
 from werkzeug.exceptions import NotAcceptable
 
+from oarepo_rdm.proxies import current_oarepo_rdm
+
+from .fast_json import FastJSONSerializer, fast_json_available, uses_default_json_encoding
+from .serializers import resolve_serializer
+
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
@@ -31,8 +37,16 @@ def get_response_handlers() -> Mapping[str, ResponseHandler]:
     for model in current_runtime.rdm_models:
         for export in model.exports:
             mimetypes[export.mimetype].append(export.serializer)
+    fast_json = current_app.config.get("OAREPO_RDM_FAST_JSON", True) and fast_json_available()
     return {
-        mimetype: ResponseHandler(DelegatedSerializer(mimetype, serializers), headers=etag_headers)
+        mimetype: ResponseHandler(
+            DelegatedSerializer(
+                mimetype,
+                serializers,
+                json_serializer=FastJSONSerializer() if fast_json and mimetype == "application/json" else None,
+            ),
+            headers=etag_headers,
+        )
         for mimetype, serializers in mimetypes.items()
     }
 
@@ -49,10 +63,20 @@ class NoOpSchema(Schema):
 class DelegatedSerializer(BaseSerializer):
     """Response handler that delegates to the correct model's handler."""
 
-    def __init__(self, mimetype: str, serializers: list[BaseSerializer]) -> None:
-        """Initialize the delegated response handler."""
+    def __init__(
+        self,
+        mimetype: str,
+        serializers: list[BaseSerializer],
+        json_serializer: BaseSerializer | None = None,
+    ) -> None:
+        """Initialize the delegated response handler.
+
+        :param json_serializer: if set, it encodes the output of marshmallow serializers
+                                that would otherwise be encoded by the default JSONSerializer
+        """
         self.mimetype = mimetype
         self.serializers = serializers
+        self.json_serializer = json_serializer
 
     def serialize_object(self, obj: Any) -> Any:
         """Serialize a single object according to the response ctx."""
@@ -62,8 +86,17 @@ class DelegatedSerializer(BaseSerializer):
                 f"No export found for schema {obj.get('$schema', None)}, "
                 f"record id {obj.get('id', None)} and mimetype {self.mimetype}."
             )
+        if self.json_serializer is not None and uses_default_json_encoding(exporter):
+            return self.json_serializer.serialize_object(cast("MarshmallowSerializer", exporter).dump_obj(obj))
         return exporter.serialize_object(obj)
 
+    def _serialize_list(self, serializer: BaseSerializer, obj_list: Any) -> Any:
+        """Serialize the list with the serializer, encoding it with the json serializer if possible."""
+        if self.json_serializer is not None and uses_default_json_encoding(serializer):
+            dumped = cast("MarshmallowSerializer", serializer).dump_list(obj_list)
+            return self.json_serializer.serialize_object_list(dumped)
+        return serializer.serialize_object_list(obj_list)
+
     def _extract_hits(self, obj: Any) -> list[Any]:
         """Extract hits from the given object."""
         # note: this is hardcoded to opensearch results structure, we can not generalize it
@@ -92,11 +125,11 @@ class DelegatedSerializer(BaseSerializer):
 
         # 2. if no exporters found, return empty list serialization
         if not exporters:
-            return self.serializers[0].serialize_object_list(self._update_hits(obj_list, []))
+            return self._serialize_list(resolve_serializer(self.serializers[0]), self._update_hits(obj_list, []))
 
         # 3. if all exporters are the same instance, use it
         if all(exporter[1] is exporters[0][1] for exporter in exporters):
-            return exporters[0][1].serialize_object_list(self._update_hits(obj_list, [x[0] for x in exporters]))
+            return self._serialize_list(exporters[0][1], self._update_hits(obj_list, [x[0] for x in exporters]))
 
         # 4. if not, check if all exporters are instance of MarshmallowSerializer
         if not all(isinstance(exporter[1], MarshmallowSerializer) for exporter in exporters):
@@ -122,15 +155,12 @@ class DelegatedSerializer(BaseSerializer):
             raise NotImplementedError(  # pragma: no cover
                 "Cannot serialize list without list schema in mixed marshmallow serializers."
             )
-        return serializer.serialize_object_list(self._update_hits(obj_list, serialized_objects))
+        return self._serialize_list(serializer, self._update_hits(obj_list, serialized_objects))
 
     def _get_exporter(self, obj: Any) -> BaseSerializer | None:
         """Get the exporter for the given object."""
         schema = obj.get("$schema", None)
         if not schema:
             raise ValueError("Object does not have $schema defined.")  # pragma: no cover
-        rdm_model = current_runtime.rdm_models_by_schema[schema]
-        for export in rdm_model.exports:
-            if export.mimetype == self.mimetype:
-                return export.serializer
-        return None
+        serializer = current_oarepo_rdm.dispatch.rdm_models[schema].exports.get(self.mimetype)
+        return resolve_serializer(serializer) if serializer is not None else None
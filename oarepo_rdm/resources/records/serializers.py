@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Serializers built on first use and shared between models.
+
+Some of the RDM serializers load XSLT stylesheets, CSL styles or schemas when they are
+constructed and their modules are slow to import. A :class:`LazySerializer` handle
+defers both the import and the construction until the serializer is used for the
+first time. Handles created by :func:`lazy_serializer` with the same configuration
+are the same object, so all models exporting the same format share a single serializer.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, override
+
+from flask_resources.serializers.base import BaseSerializer
+from invenio_base.utils import obj_or_import_string
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+_handles: dict[Hashable, LazySerializer] = {}
+_handles_lock = threading.Lock()
+
+
+class LazySerializer(BaseSerializer):
+    """Handle of a serializer that is constructed on first use.
+
+    Serialization and all other attribute access is delegated to the constructed serializer.
+    Code checking the type of the serializer should call :func:`resolve_serializer` first.
+    """
+
+    def __init__(self, factory: str | Callable[..., BaseSerializer], **kwargs: Any) -> None:
+        """Create the handle.
+
+        :param factory: serializer class or a function returning the serializer,
+                        or an import string of either of them
+        :param kwargs: keyword arguments passed to the factory
+        """
+        self._factory = factory
+        self._kwargs = kwargs
+        self._serializer: BaseSerializer | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def serializer(self) -> BaseSerializer:
+        """Return the serializer, constructing it if needed."""
+        if self._serializer is None:
+            with self._lock:
+                if self._serializer is None:
+                    self._serializer = obj_or_import_string(self._factory)(**self._kwargs)
+        return self._serializer
+
+    @override
+    def serialize_object(self, obj: Any) -> Any:
+        """Serialize a single object."""
+        return self.serializer.serialize_object(obj)
+
+    @override
+    def serialize_object_list(self, obj_list: Any) -> Any:
+        """Serialize a list of objects."""
+        return self.serializer.serialize_object_list(obj_list)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate attribute access to the serializer."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.serializer, name)
+
+    @override
+    def __repr__(self) -> str:
+        factory = self._factory if isinstance(self._factory, str) else self._factory.__qualname__
+        return f"LazySerializer({factory}, {self._kwargs!r})"
+
+
+def lazy_serializer(factory: str | Callable[..., BaseSerializer], **kwargs: Any) -> LazySerializer:
+    """Return a shared handle of the serializer constructed by factory(**kwargs) on first use."""
+    key = (factory, _freeze(kwargs))
+    handle = _handles.get(key)
+    if handle is None:
+        with _handles_lock:
+            handle = _handles.setdefault(key, LazySerializer(factory, **kwargs))
+    return handle
+
+
+def resolve_serializer(serializer: BaseSerializer) -> BaseSerializer:
+    """Return the serializer behind a lazy handle, other serializers are returned as they are."""
+    if isinstance(serializer, LazySerializer):
+        return serializer.serializer
+    return serializer
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert the value to a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
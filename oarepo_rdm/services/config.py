@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast, override
 
 import marshmallow as ma
@@ -26,7 +27,6 @@ from invenio_records_resources.services.records.links import (
     RecordEndpointLink,
 )
 from marshmallow import types
-from oarepo_runtime import current_runtime
 
 from oarepo_rdm.proxies import current_oarepo_rdm
 
@@ -54,13 +54,11 @@ class MultiplexingLinks(LinksTemplate):
         if obj is None:
             return {}
 
-        schema = obj["$schema"]
-        delegated_model = current_runtime.rdm_models_by_schema[schema]
-        delegated_service = delegated_model.service
+        links_item_tpl = current_oarepo_rdm.dispatch.rdm_models[obj["$schema"]].links_item_tpl
         return cast(
             "dict[str, str]",
             # TODO: seems to be correct but what to do with kwargs?
-            delegated_service.links_item_tpl.expand(identity, obj),
+            links_item_tpl.expand(identity, obj),
         )
 
 
@@ -69,6 +67,12 @@ class MultiplexingSchema(ma.Schema):
 
     Based on the record being (de)serialized, the schema loading and dumping
     is delegated to the appropriate service.
+
+    With many=True, the items are partitioned by their ``$schema``. Each partition
+    is loaded by a single call of the delegated schema and the results are returned
+    in the order of the input. Dumping calls the delegated schema for each item,
+    because the item has to be passed in the context (field permission checks use it),
+    but the delegated schemas are looked up once per partition.
     """
 
     @override
@@ -81,11 +85,9 @@ class MultiplexingSchema(ma.Schema):
         unknown: str | None = None,
     ) -> Any:
         if many:
-            return [self.load(item, many=False, partial=partial, unknown=unknown) for item in data]  # type: ignore[union-attr, arg-type]
+            return self._load_many(cast("Iterable[Mapping[str, Any]]", data))
         schema = cast("Mapping[str, Any]", data)["$schema"]
-        delegated_model = current_runtime.rdm_models_by_schema[schema]
-        delegated_service = delegated_model.service
-        return delegated_service.schema.load(
+        return current_oarepo_rdm.dispatch.rdm_models[schema].schema.load(
             data,  # type: ignore[arg-type]
             schema_args={},  # type: ignore[arg-type]
             context=self.context,
@@ -95,11 +97,53 @@ class MultiplexingSchema(ma.Schema):
     @override
     def dump(self, obj: Any, *, many: bool | None = None) -> Any:
         if many:
-            return [self.dump(item, many=False) for item in obj]  # type: ignore[union-attr]
+            return self._dump_many(obj)
         schema = cast("Mapping[str, Any]", obj)["$schema"]
-        delegated_model = current_runtime.rdm_models_by_schema[schema]
-        delegated_service = delegated_model.service
-        return delegated_service.schema.dump(obj, schema_args={}, context={**self.context, "record": obj})  # type: ignore[arg-type]
+        return current_oarepo_rdm.dispatch.rdm_models[schema].schema.dump(  # type: ignore[arg-type]
+            obj, schema_args={}, context={**self.context, "record": obj}
+        )
+
+    def _load_many(self, data: Iterable[Mapping[str, Any]]) -> list[Any]:
+        items = list(data)
+        rdm_models = current_oarepo_rdm.dispatch.rdm_models
+        ret: list[Any] = [None] * len(items)
+        for schema, indices in _partition_by_schema(items).items():
+            try:
+                loaded, errors = rdm_models[schema].schema.load(
+                    [items[idx] for idx in indices],
+                    schema_args={"many": True},  # type: ignore[arg-type]
+                    context=self.context,
+                    raise_errors=True,
+                )
+            except ma.ValidationError as e:
+                # report the errors under the indices of the whole input
+                messages = e.messages
+                if isinstance(messages, dict):
+                    messages = {indices[k] if isinstance(k, int) else k: v for k, v in messages.items()}
+                raise ma.ValidationError(messages) from e
+            for idx, loaded_item in zip(indices, loaded, strict=True):
+                ret[idx] = (loaded_item, errors)
+        return ret
+
+    def _dump_many(self, obj: Iterable[Any]) -> list[Any]:
+        items = list(obj)
+        rdm_models = current_oarepo_rdm.dispatch.rdm_models
+        ret: list[Any] = [None] * len(items)
+        for schema, indices in _partition_by_schema(items).items():
+            delegated_schema = rdm_models[schema].schema
+            for idx in indices:
+                ret[idx] = delegated_schema.dump(  # type: ignore[arg-type]
+                    items[idx], schema_args={}, context={**self.context, "record": items[idx]}
+                )
+        return ret
+
+
+def _partition_by_schema(items: list[Any]) -> dict[str, list[int]]:
+    """Return indices of the items keyed by their $schema, in the order of first occurrence."""
+    partitions: dict[str, list[int]] = defaultdict(list)
+    for idx, item in enumerate(items):
+        partitions[item["$schema"]].append(idx)
+    return partitions
 
 
 class OARepoRDMServiceConfig(RDMRecordServiceConfig):
@@ -10,17 +10,20 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast, override
 
 from invenio_db.uow import UnitOfWork, unit_of_work
-from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_pidstore.models import PersistentIdentifier
+from invenio_pidstore.errors import PersistentIdentifierError, PIDDoesNotExistError
+from invenio_pidstore.models import PIDStatus
 from invenio_rdm_records.services.access.service import RecordAccessService
 from invenio_rdm_records.services.pids.service import PIDsService
 from invenio_rdm_records.services.review.service import ReviewService
+from invenio_records_resources.services.errors import PermissionDeniedError, RecordPermissionDeniedError
 from oarepo_runtime.proxies import current_runtime
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore[reportPrivateImportUsage]
 
+from oarepo_rdm.records.resolver import find_external_pids
 from oarepo_rdm.services.service import (
     DelegationToSpecializedServiceMixin,
     check_fully_overridden,
@@ -30,7 +33,11 @@ from oarepo_rdm.services.service import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from uuid import UUID
+
     from flask_principal import Identity
+    from invenio_pidstore.models import PersistentIdentifier
     from invenio_rdm_records.records.api import RDMDraft, RDMRecord
     from invenio_records_resources.services.records.results import RecordItem
 
@@ -128,8 +135,46 @@ class DelegatingPIDsService(DelegationToSpecializedServiceMixin, PIDsService):
     attribute_on_base_service = "pids"
 
     def resolve(self, identity: Identity, id_: str, scheme: str, expand: bool = False) -> RecordItem:
-        """Resolve any PID through the service of the model owning its object UUID."""
-        pid = PersistentIdentifier.get(pid_type=scheme, pid_value=id_)
+        """Resolve any PID through the service of the model owning its object UUID.
+
+        The PID is fetched in one query together with the pid type of the record it points
+        to, instead of fetching the PID and then looking up the model of its object.
+        If the specialized service does not override ``PIDsService.resolve``, the record is
+        then loaded and checked directly, with the same permission check and the same
+        errors as ``PIDsService.resolve``. Otherwise (and for PIDs that are not registered
+        or do not point to a record) the specialized service resolves the PID itself.
+        """
+        found = find_external_pids([(scheme, id_)], current_runtime.record_class_by_pid_type.keys()).get(
+            (scheme, id_)
+        )
+        if found is None:
+            raise PIDDoesNotExistError(scheme, id_)
+        pid, record_pid_type = found
+        specialized_service = self._fast_path_service(pid, record_pid_type)
+        if specialized_service is not None:
+            try:
+                record = specialized_service.record_cls.get_record(pid.object_uuid)
+            except NoResultFound:
+                pass  # deleted record, resolved to the latest published version below
+            else:
+                return self._resolved_item(specialized_service, identity, record, expand)
+        return self._resolve_through_object_uuid(identity, pid, id_, scheme, expand)
+
+    def _fast_path_service(self, pid: PersistentIdentifier, record_pid_type: str | None) -> PIDsService | None:
+        """Return the specialized service if the record of the PID can be loaded without calling its resolve."""
+        if record_pid_type is None or pid.status != PIDStatus.REGISTERED:
+            return None
+        specialized_service = cast("PIDsService", self._get_specialized_service_by_pid_type(record_pid_type))
+        if specialized_service is self:
+            return None
+        if getattr(specialized_service.resolve, "__func__", None) is not PIDsService.resolve:
+            return None  # resolve is customized, it must not be bypassed
+        return specialized_service
+
+    def _resolve_through_object_uuid(
+        self, identity: Identity, pid: PersistentIdentifier, id_: str, scheme: str, expand: bool
+    ) -> RecordItem:
+        """Resolve the PID by looking up the model of its object, falls back to the latest published version."""
         record_pid = current_runtime.find_pid_from_uuid(pid.object_uuid)  # type: ignore[reportArgumentType]
 
         specialized_service = cast("PIDsService", self._get_specialized_service(record_pid.pid_value))  # type: ignore[reportArgumentType]
@@ -157,3 +202,68 @@ class DelegatingPIDsService(DelegationToSpecializedServiceMixin, PIDsService):
                 expandable_fields=specialized_service.expandable_fields,
                 expand=expand,
             )
+
+    def resolve_many(
+        self, identity: Identity, pids: Sequence[tuple[str, str]], expand: bool = False
+    ) -> list[RecordItem | Exception]:
+        """Resolve (scheme, value) pairs of any PIDs to published records.
+
+        The PIDs together with the models owning their objects are fetched in one query,
+        records of each model are then loaded in one query per model. PIDs that can not
+        take the fast path of :meth:`resolve` (for example parent PIDs or PIDs that are
+        not registered) are resolved one by one.
+
+        :return: the result item or the resolution error (for example PIDDoesNotExistError
+                 or RecordPermissionDeniedError) for each of the pids, in the same order
+        """
+        found = find_external_pids(pids, current_runtime.record_class_by_pid_type.keys())
+        results: dict[tuple[str, str], RecordItem | Exception] = {}
+        uuids_by_type: dict[str, dict[UUID, list[tuple[str, str]]]] = defaultdict(lambda: defaultdict(list))
+        for scheme, value in pids:
+            if (scheme, value) not in found:
+                results[scheme, value] = PIDDoesNotExistError(scheme, value)
+                continue
+            pid, record_pid_type = found[scheme, value]
+            if self._fast_path_service(pid, record_pid_type) is not None:
+                uuids_by_type[record_pid_type][pid.object_uuid].append((scheme, value))  # type: ignore[index]
+
+        for pid_type, pairs_by_uuid in uuids_by_type.items():
+            specialized_service = cast("PIDsService", self._get_specialized_service_by_pid_type(pid_type))
+            for record in specialized_service.record_cls.get_records(list(pairs_by_uuid)):
+                try:
+                    item: RecordItem | Exception = self._resolved_item(specialized_service, identity, record, expand)
+                except RecordPermissionDeniedError as e:
+                    item = e
+                for pair in pairs_by_uuid[record.id]:  # type: ignore[index]
+                    results[pair] = item
+
+        for scheme, value in pids:
+            if (scheme, value) not in results:
+                try:
+                    results[scheme, value] = self.resolve(identity, value, scheme, expand=expand)
+                except (
+                    PersistentIdentifierError,
+                    NoResultFound,
+                    PermissionDeniedError,
+                    RecordPermissionDeniedError,
+                ) as e:
+                    results[scheme, value] = e
+        return [results[pair] for pair in pids]
+
+    @staticmethod
+    def _resolved_item(
+        specialized_service: PIDsService, identity: Identity, record: RDMRecord, expand: bool
+    ) -> RecordItem:
+        """Check the read permission and return the result item, as ``PIDsService.resolve`` does."""
+        try:
+            specialized_service.require_permission(identity, "read", record=record)
+        except PermissionDeniedError:
+            raise RecordPermissionDeniedError(action_name="read", record=record) from None
+        return specialized_service.result_item(
+            specialized_service,
+            identity,
+            record,
+            links_tpl=specialized_service.links_item_tpl,
+            expandable_fields=specialized_service.expandable_fields,
+            expand=expand,
+        )
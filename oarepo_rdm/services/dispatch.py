@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Snapshot of the registered models used to dispatch records to their model.
+
+The multiplexing schema, links, result list, serializers and OAI serialization find
+the model of each record by its ``$schema``. Going through ``current_runtime`` costs
+several proxy lookups and property calls per record. The snapshot is built once when
+the application is finalized and is available as ``current_oarepo_rdm.dispatch``;
+hot paths should fetch it once and then do plain dictionary lookups.
+
+Only immutable data is shared in the snapshot. The service schema wrapper and the links
+template are built for each use, as the services of invenio-records-resources do.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
+from oarepo_runtime import current_runtime
+
+from oarepo_rdm.utils import FrozenDict
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from flask_resources.serializers.base import BaseSerializer
+    from marshmallow import Schema
+    from invenio_rdm_records.services.services import RDMRecordService
+    from invenio_records_resources.records.api import Record
+    from invenio_records_resources.services.base.links import LinksTemplate
+    from oarepo_runtime.api import Model
+
+
+class ModelDispatch(NamedTuple):
+    """Everything needed to delegate work on a record to its RDM model."""
+
+    model: Model
+    service: RDMRecordService
+    record_cls: type[Record]
+    draft_cls: type[Record]
+    schema_cls: type[Schema]
+    """Marshmallow schema class of the model's service."""
+
+    exports: Mapping[str, BaseSerializer]
+    """Export serializers keyed by mimetype."""
+
+    @property
+    def schema(self) -> ServiceSchemaWrapper:
+        """Return a new wrapper of the model's service schema."""
+        return ServiceSchemaWrapper(self.service, schema=self.schema_cls)
+
+    @property
+    def links_item_tpl(self) -> LinksTemplate:
+        """Return a new links template of the model's service."""
+        return self.service.links_item_tpl
+
+
+class DispatchSnapshot(NamedTuple):
+    """Models keyed by the ``$schema`` of their records."""
+
+    rdm_models: Mapping[str, ModelDispatch]
+    """RDM models."""
+
+    record_classes: Mapping[str, type[Record]]
+    """Record classes of all the models, including non-RDM ones."""
+
+
+def build_dispatch_snapshot() -> DispatchSnapshot:
+    """Build the snapshot from the models registered in oarepo-runtime."""
+    rdm_models: dict[str, ModelDispatch] = {}
+    for schema, model in current_runtime.rdm_models_by_schema.items():
+        service = cast("RDMRecordService", model.service)
+        exports: dict[str, BaseSerializer] = {}
+        for export in model.exports:
+            exports.setdefault(export.mimetype, export.serializer)
+        rdm_models[schema] = ModelDispatch(
+            model=model,
+            service=service,
+            record_cls=service.record_cls,
+            draft_cls=service.draft_cls,
+            schema_cls=service.config.schema,
+            exports=FrozenDict(exports),
+        )
+    record_classes: dict[str, Any] = {
+        schema: model.record_cls for schema, model in current_runtime.models_by_schema.items()
+    }
+    return DispatchSnapshot(FrozenDict(rdm_models), FrozenDict(record_classes))
@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cache of the projections of search hits.
+
+Listing pages (recent uploads, community listings) show the same records over and
+over. :class:`MultiplexingResultList` loads each hit into a record, dumps it with the
+service schema and expands its links. With ``OAREPO_RDM_PROJECTION_CACHE`` enabled,
+the projections are kept in a per-process LRU cache.
+
+The projection depends on the indexed document and on the permissions of the
+identity, so the key consists of:
+
+* the ``$schema``, record uuid and publication status of the hit,
+* ``version_id`` of the record and of its parent, so that edits invalidate the entry,
+* the needs provided by the identity, so that permission-dependent fields stay correct,
+* whether links are expanded.
+
+Some changes of the indexed document, for example updated statistics, do not bump
+the version, so the entries also expire after ``OAREPO_RDM_PROJECTION_CACHE_TTL`` seconds.
+Hits with highlights or inner hits are never cached.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from invenio_rdm_records.utils import simple_deepcopy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from flask_principal import Identity
+
+
+class ProjectionCacheStats(NamedTuple):
+    """Counters of the projection cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    """Number of cached projections."""
+
+    max_size: int
+    """Maximum number of cached projections."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ProjectionCache:
+    """LRU cache of hit projections with a bounded number of entries and a time to live."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Create the cache.
+
+        :param max_size: maximum number of cached projections, the least recently used are evicted
+        :param ttl: number of seconds a projection is kept
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_project(self, key: Hashable | None, project: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return a copy of the cached projection, or project the hit and cache the result.
+
+        :param key: key from :func:`hit_cache_key`, None if the hit can not be cached
+        """
+        if key is None:
+            return project()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return simple_deepcopy(entry[1])
+            self._misses += 1
+
+        projection = project()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, simple_deepcopy(projection))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return projection
+
+    def clear(self) -> None:
+        """Drop all the cached projections, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ProjectionCacheStats:
+        """Return the counters of the cache."""
+        with self._lock:
+            return ProjectionCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.max_size)
+
+
+def identity_fingerprint(identity: Identity) -> Hashable:
+    """Return a hashable fingerprint of the permissions of the identity."""
+    return frozenset(identity.provides)
+
+
+def hit_cache_key(hit: Any, fingerprint: Hashable, with_links: bool) -> Hashable | None:
+    """Return the cache key of the search hit, None if the hit can not be cached."""
+    if hasattr(hit.meta, "highlight") or hasattr(hit.meta, "inner_hits"):
+        return None
+    record_id = hit.get("uuid") or hit.get("id")
+    version_id = hit.get("version_id")
+    if record_id is None or version_id is None:
+        return None
+    parent = hit.get("parent") or {}
+    return (
+        hit["$schema"],
+        record_id,
+        version_id,
+        parent.get("version_id"),
+        hit.get("publication_status", "published"),
+        fingerprint,
+        with_links,
+    )
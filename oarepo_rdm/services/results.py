@@ -10,15 +10,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from invenio_rdm_records.services.results import RDMRecordList
-from oarepo_runtime import current_runtime
+
+from oarepo_rdm.proxies import current_oarepo_rdm
+
+from .projection_cache import hit_cache_key, identity_fingerprint
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Mapping
 
-    from invenio_rdm_records.services.services import RDMRecordService
+    from .dispatch import ModelDispatch
 
 
 class MultiplexingResultList(RDMRecordList):
@@ -26,32 +30,49 @@ class MultiplexingResultList(RDMRecordList):
 
     @property
     def hits(self) -> Generator[dict[str, Any]]:
-        """Iterator over the hits."""
+        """Iterator over the hits.
+
+        If the projection cache is enabled, projections of unchanged records
+        are served from it, see :mod:`oarepo_rdm.services.projection_cache`.
+        """
+        rdm_models = current_oarepo_rdm.dispatch.rdm_models
+        projection_cache = current_oarepo_rdm.projection_cache
+        fingerprint = identity_fingerprint(self._identity) if projection_cache is not None else None
+        with_links = bool(self._links_item_tpl)
         for hit in self._results:
-            # Load dump
-            record_dict = hit.to_dict()
+            if projection_cache is None:
+                yield self._project_hit(rdm_models, hit)
+            else:
+                yield projection_cache.get_or_project(
+                    hit_cache_key(hit, fingerprint, with_links),
+                    partial(self._project_hit, rdm_models, hit),
+                )
 
-            schema = hit["$schema"]
-            publication_status = hit.get("publication_status", "published")
+    def _project_hit(self, rdm_models: Mapping[str, ModelDispatch], hit: Any) -> dict[str, Any]:
+        """Load the hit into a record of its model and project it."""
+        # Load dump
+        record_dict = hit.to_dict()
 
-            delegated_model = current_runtime.rdm_models_by_schema[schema]
-            delegated_service = cast("RDMRecordService", delegated_model.service)
+        schema = hit["$schema"]
+        publication_status = hit.get("publication_status", "published")
 
-            if publication_status == "draft":
-                record = delegated_service.draft_cls.loads(record_dict)
-            else:
-                record = delegated_service.record_cls.loads(record_dict)
-
-            # Project the record
-            projection = delegated_service.schema.dump(
-                record,
-                context={
-                    "identity": self._identity,
-                    "record": record,
-                    "meta": hit.meta,
-                },
-            )
-            if self._links_item_tpl:
-                projection["links"] = delegated_service.links_item_tpl.expand(self._identity, record)
-
-            yield projection
+        delegated_model = rdm_models[schema]
+
+        if publication_status == "draft":
+            record = delegated_model.draft_cls.loads(record_dict)
+        else:
+            record = delegated_model.record_cls.loads(record_dict)
+
+        # Project the record
+        projection = delegated_model.schema.dump(
+            record,
+            context={
+                "identity": self._identity,
+                "record": record,
+                "meta": hit.meta,
+            },
+        )
+        if self._links_item_tpl:
+            projection["links"] = delegated_model.links_item_tpl.expand(self._identity, record)
+
+        return projection
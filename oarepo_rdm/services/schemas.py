@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from marshmallow.utils import _Missing
 
 ui_serialized_record = ContextVar[Any]("ui_serialized_record")
+"""Record being serialized by the UI schema."""
 
 
 def make_affiliation_index(attr: str, _obj: Mapping[str, Any], *args: Any) -> Mapping[str, Any] | _Missing:
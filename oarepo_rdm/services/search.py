@@ -27,6 +27,9 @@ from invenio_records_resources.services.records.params import (
 from oarepo_runtime import current_runtime
 from oarepo_runtime.services.facets.params import GroupedFacetsParam
 
+from oarepo_rdm.records.discriminator import MODEL_FACET, discriminator_search_enabled, model_facet, model_filter
+from oarepo_rdm.utils import FrozenDict
+
 if TYPE_CHECKING:
     from invenio_access.permissions import Identity
     from invenio_search import RecordsSearchV2
@@ -66,9 +69,10 @@ class DelegatedQueryParam(ParamInterpreter):
         post_filter = {}
         sort = []
 
-        for pid_type, query_data in queries_list.items():
+        for jsonschema, query_data in queries_list.items():
             schema_query = query_data.get("query", {})
-            shoulds.append({"bool": {"must": [{"term": {"$schema": pid_type}}, schema_query]}})
+            # the model is selected in filter context, so it does not contribute to the score
+            shoulds.append({"bool": {"filter": [model_filter(jsonschema)], "must": [schema_query]}})
 
             if "aggs" in query_data:
                 aggs.update(query_data["aggs"])
@@ -95,7 +99,7 @@ def update_param_interpreters(
 
 
 class MultiplexedSearchOptions(SearchOptions):
-    """Search options."""
+    """Search options merged from the search options of all the RDM models."""
 
     params_interpreters_cls = update_param_interpreters(SearchOptions.params_interpreters_cls)
 
@@ -103,12 +107,18 @@ class MultiplexedSearchOptions(SearchOptions):
         """Initialize search options."""
         search_opts = self._search_opts(config_field)
 
+        facets = dict(search_opts.get("facets", {}))
+        if discriminator_search_enabled():
+            facets.setdefault(MODEL_FACET, model_facet())
+
         # TODO: we need to have a look at ClassVar typing !!!
-        self.facets = search_opts["facets"]  # type: ignore[assignment]
-        self.facet_groups = search_opts["facet_groups"]  # type: ignore[assignment]
-        self.sort_options = search_opts["sort_options"]  # type: ignore[assignment]
-        self.sort_default = search_opts["sort_default"]  # type: ignore[assignment]
-        self.sort_default_no_query = search_opts["sort_default_no_query"]  # type: ignore[assignment]
+        self.facets = FrozenDict(facets)  # type: ignore[assignment]
+        self.facet_groups = FrozenDict(search_opts.get("facet_groups", {}))  # type: ignore[assignment]
+        self.sort_options = FrozenDict(search_opts.get("sort_options", {}))  # type: ignore[assignment]
+        self.sort_default = search_opts.get("sort_default", SearchOptions.sort_default)  # type: ignore[assignment]
+        self.sort_default_no_query = search_opts.get(  # type: ignore[assignment]
+            "sort_default_no_query", SearchOptions.sort_default_no_query
+        )
 
     def _search_opts_from_search_obj(self, search: Any) -> dict[str, Any]:
         facets = copy.deepcopy(search.facets)
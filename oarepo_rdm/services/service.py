@@ -22,6 +22,8 @@ from oarepo_runtime.proxies import current_runtime
 from werkzeug.exceptions import Forbidden
 
 from oarepo_rdm.errors import UndefinedModelError
+from oarepo_rdm.proxies import current_oarepo_rdm
+from oarepo_rdm.records.resolver import find_pid_type
 
 from .config import MultiplexingLinks
 
@@ -179,7 +181,10 @@ class DelegationToSpecializedServiceMixin(InvenioService):
 
     def _get_specialized_service(self, pid_value: str) -> InvenioService:
         """Get a specialized service based on the pid_value of the record."""
-        pid_type = current_runtime.find_pid_type_from_pid(pid_value)
+        return self._get_specialized_service_by_pid_type(find_pid_type(pid_value))
+
+    def _get_specialized_service_by_pid_type(self, pid_type: str) -> InvenioService:
+        """Get a specialized service of the model with the given record pid type."""
         base_service = current_runtime.model_by_pid_type[pid_type].service
         return getattr(base_service, self.attribute_on_base_service) if self.attribute_on_base_service else base_service
 
@@ -324,14 +329,15 @@ class OARepoRDMService(DelegationToSpecializedServiceMixin, RDMRecordService):
         elif "RDM_PREFERRED_METADATA_SCHEMA" in current_app.config:
             schema = current_app.config["RDM_PREFERRED_METADATA_SCHEMA"]
 
+        rdm_models = current_oarepo_rdm.dispatch.rdm_models
         if schema is None:
-            if len(current_runtime.rdm_models_by_schema) > 1:
+            if len(rdm_models) > 1:
                 raise UndefinedModelError(
                     "Cannot create a draft without specifying its type. Please add top-level $schema property."
                 )
-            return next(iter(current_runtime.rdm_models_by_schema.values()))
-        if schema in current_runtime.rdm_models_by_schema:
-            return current_runtime.rdm_models_by_schema[schema]
+            return next(iter(rdm_models.values())).model
+        if schema in rdm_models:
+            return rdm_models[schema].model
         raise UndefinedModelError(f"Model for schema {schema} does not exist.")
 
     @override
@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+from ..prefetch import PrefetchComponent
 from .communities_memberships_dump import CommunitiesMembershipsComponent
 from .deposit_form_defaults import DepositFormDefaultsComponent
 from .doi_required import DoiRequiredComponent
@@ -26,6 +27,7 @@ __all__ = [
     "EmptyRecordPidsComponent",
     "FilesEnabledComponent",
     "InjectParentDoiComponent",
+    "PrefetchComponent",
     "RDMPIDsConfigComponent",
     "RDMVocabularyOptionsComponent",
 ]
@@ -12,10 +12,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from invenio_app_rdm.records_ui.views.deposits import get_user_communities_memberships
 from oarepo_ui.resources.components import UIResourceComponent
 
+from ..memberships import user_communities_memberships
+from ..prefetch import prefetched
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from flask_principal import Identity
     from invenio_records_resources.services.records.results import RecordItem
 
@@ -23,16 +27,28 @@ if TYPE_CHECKING:
 class CommunitiesMembershipsComponent(UIResourceComponent):
     """Pass current identity's community memberships to form config."""
 
+    def prefetch(self, action: str, **kwargs: Any) -> Mapping[str, Callable[[], Any]]:
+        """Declare the memberships of the identity as a data dependency of form_config."""
+        if action != "form_config":
+            return {}
+        identity = kwargs["identity"]
+        return {"user_communities_memberships": lambda: user_communities_memberships(identity)}
+
     def form_config(  # noqa: PLR0913  too many arguments
         self,
         *,
         api_record: RecordItem,  # noqa: ARG002
         record: dict,  # noqa: ARG002
-        identity: Identity,  # noqa: ARG002
+        identity: Identity,
         form_config: dict,
         ui_links: dict,  # noqa: ARG002
         extra_context: dict,  # noqa: ARG002
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
-        """Add current identity's community memberships to form config."""
-        form_config["user_communities_memberships"] = get_user_communities_memberships()
+        """Add current identity's community memberships to form config.
+
+        The memberships are cached per user, see :mod:`oarepo_rdm.ui.memberships`.
+        """
+        form_config["user_communities_memberships"] = prefetched(
+            "user_communities_memberships", lambda: user_communities_memberships(identity)
+        )
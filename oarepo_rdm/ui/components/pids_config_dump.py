@@ -15,7 +15,11 @@ from typing import TYPE_CHECKING, Any
 from invenio_app_rdm.records_ui.views.deposits import get_form_pids_config
 from oarepo_ui.resources.components import UIResourceComponent
 
+from ..prefetch import prefetched
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from flask_principal import Identity
     from invenio_records_resources.services.records.results import RecordItem
 
@@ -23,6 +27,13 @@ if TYPE_CHECKING:
 class RDMPIDsConfigComponent(UIResourceComponent):
     """Pass RDM PID configuration to form config."""
 
+    def prefetch(self, action: str, **kwargs: Any) -> Mapping[str, Callable[[], Any]]:
+        """Declare the PID configuration of the record as a data dependency of form_config."""
+        if action != "form_config":
+            return {}
+        record = kwargs["record"]
+        return {"pids_config": lambda: get_form_pids_config(record=record)}
+
     def form_config(  # noqa: PLR0913  too many arguments
         self,
         *,
@@ -35,4 +46,4 @@ class RDMPIDsConfigComponent(UIResourceComponent):
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
         """Add PID configuration to form config."""
-        form_config["pids"] = get_form_pids_config(record=record)
+        form_config["pids"] = prefetched("pids_config", lambda: get_form_pids_config(record=record))
@@ -12,12 +12,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from invenio_app_rdm.records_ui.views.deposits import (
-    VocabulariesOptions,
-)
 from oarepo_ui.resources.components import UIResourceComponent
 
+from ..prefetch import prefetched
+from ..vocabularies import vocabulary_options
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from flask_principal import Identity
     from invenio_records_resources.services.records.results import RecordItem
 
@@ -25,6 +27,10 @@ if TYPE_CHECKING:
 class RDMVocabularyOptionsComponent(UIResourceComponent):
     """Pass RDM vocabulary fixtures to form config."""
 
+    def prefetch(self, action: str, **kwargs: Any) -> Mapping[str, Callable[[], Any]]:  # noqa: ARG002
+        """Declare the vocabulary options as a data dependency of form_config."""
+        return {"vocabularies": vocabulary_options} if action == "form_config" else {}
+
     def form_config(  # noqa: PLR0913  too many arguments
         self,
         *,
@@ -36,5 +42,8 @@ class RDMVocabularyOptionsComponent(UIResourceComponent):
         extra_context: dict,  # noqa: ARG002
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
-        """Add smaller RDM vocabularies to form config."""
-        form_config["vocabularies"] = VocabulariesOptions().dump()  # pragma: no cover
+        """Add smaller RDM vocabularies to form config.
+
+        The options are cached per locale, see :mod:`oarepo_rdm.ui.vocabularies`.
+        """
+        form_config["vocabularies"] = prefetched("vocabularies", vocabulary_options)
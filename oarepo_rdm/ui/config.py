@@ -30,6 +30,7 @@ from oarepo_rdm.ui.components import (
     EmptyRecordPidsComponent,
     FilesEnabledComponent,
     InjectParentDoiComponent,
+    PrefetchComponent,
     RDMPIDsConfigComponent,
     RDMVocabularyOptionsComponent,
 )
@@ -58,6 +59,7 @@ class RDMRecordsUIResourceConfig(RecordsUIResourceConfig):
     """
 
     components = (
+        PrefetchComponent,
         AllowedHtmlTagsComponent,
         BabelComponent,
         PermissionsComponent,
@@ -80,6 +82,7 @@ class RDMRecordsUIResourceConfig(RecordsUIResourceConfig):
     # Default components for RDM UI resources.
     #
     # These components handle common functionality like:
+    # - PrefetchComponent: Loads data declared by the other components (must be the first one)
     # - AllowedHtmlTagsComponent: Sanitizes HTML tags in record content
     # - BabelComponent: Provides internationalization support
     # - PermissionsComponent: Handles permission checks
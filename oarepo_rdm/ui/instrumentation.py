@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Timing of the work done by UI resource components.
+
+`RDMRecordsUIResource` measures each component hook listed in
+`OAREPO_RDM_UI_TIMED_HOOKS` - the duration and the number of SQL statements it
+executed. Prefetched data dependencies (see :mod:`oarepo_rdm.ui.prefetch`) are
+measured the same way.
+
+The measurements of the current request are available through
+:func:`component_timings`. Each of them is also sent as the
+:data:`ui_component_timed` signal, which can be connected to a metrics backend
+(for example to observe a prometheus histogram labelled by the component), and
+in debug mode (or if `OAREPO_RDM_UI_SERVER_TIMING` is set) the measurements
+are returned to the browser in the `Server-Timing` response header.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from blinker import Namespace
+from flask import current_app, g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from flask import Response
+
+log = logging.getLogger(__name__)
+
+_signals = Namespace()
+
+ui_component_timed = _signals.signal("oarepo-rdm-ui-component-timed")
+"""Sent with the current app as the sender and `timing` (a ComponentTiming) keyword argument."""
+
+
+class ComponentTiming(NamedTuple):
+    """Measurement of a piece of work done by a UI component."""
+
+    label: str
+    """Name of the component and of the hook or data dependency, such as "FilesComponent.form_config"."""
+
+    duration: float
+    """Duration in seconds."""
+
+    queries: int
+    """Number of SQL statements executed."""
+
+
+def component_timings() -> list[ComponentTiming]:
+    """Return measurements of the component work done in the current request."""
+    if "oarepo_rdm_component_timings" not in g:
+        g.oarepo_rdm_component_timings = []
+    return g.oarepo_rdm_component_timings  # type: ignore[no-any-return]
+
+
+def record_component_timing(label: str, duration: float, queries: int = 0) -> None:
+    """Record a measurement of a piece of component work in the current request."""
+    timing = ComponentTiming(label, duration, queries)
+    component_timings().append(timing)
+    log.debug("UI component %s took %.2f ms and %s queries", label, duration * 1000, queries)
+    ui_component_timed.send(current_app._get_current_object(), timing=timing)  # type: ignore[attr-defined] # noqa: SLF001
+
+
+def executed_queries() -> int:
+    """Return number of SQL statements executed in the current app context so far.
+
+    Statements are counted only after :func:`register_query_counter` has been called.
+    """
+    return g.get("oarepo_rdm_executed_queries", 0)  # type: ignore[no-any-return]
+
+
+@contextmanager
+def measure_component(label: str) -> Iterator[None]:
+    """Measure duration and number of SQL statements of the block and record them."""
+    queries = executed_queries()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_component_timing(label, time.perf_counter() - start, executed_queries() - queries)
+
+
+def register_query_counter() -> None:
+    """Count SQL statements executed in app contexts."""
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+
+def _count_query(*_args: Any, **_kwargs: Any) -> None:
+    if has_app_context():
+        g.oarepo_rdm_executed_queries = g.get("oarepo_rdm_executed_queries", 0) + 1
+
+
+def add_server_timing_header(response: Response) -> Response:
+    """Add the component measurements of the request to the Server-Timing header."""
+    timings = g.get("oarepo_rdm_component_timings")
+    if not timings:
+        return response
+    server_timing = current_app.config.get("OAREPO_RDM_UI_SERVER_TIMING")
+    if server_timing is None:
+        server_timing = current_app.debug
+    if server_timing:
+        for label, duration, queries in timings:
+            response.headers.add("Server-Timing", f'{label};dur={duration * 1000:.2f};desc="{queries} queries"')
+    return response
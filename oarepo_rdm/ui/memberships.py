@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cache of community memberships passed to the deposit form.
+
+The memberships of a user are stored in the shared invenio cache for
+`OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE_TIMEOUT` seconds. The entry is removed after
+a transaction adding, changing or removing a membership of the user commits
+(see :mod:`oarepo_rdm.cache_invalidation`).
+Memberships gained through a group are not tracked and are picked up when
+the entry expires.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_communities.proxies import current_communities
+
+from oarepo_rdm.cache_invalidation import (
+    invalidate_user_communities_memberships,
+    memberships_cache_enabled,
+    memberships_cache_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from flask_principal import Identity
+
+__all__ = ["invalidate_user_communities_memberships", "user_communities_memberships", "users_communities_memberships"]
+
+
+def _read_memberships(identity: Identity) -> dict[str, str]:
+    memberships = current_communities.service.members.read_memberships(identity)
+    return {community_id: role for (community_id, role) in memberships["memberships"]}
+
+
+def user_communities_memberships(identity: Identity) -> dict[str, str]:
+    """Return community memberships (community id => role) of the identity."""
+    return users_communities_memberships([identity])[0]
+
+
+def users_communities_memberships(identities: Sequence[Identity]) -> list[dict[str, str]]:
+    """Return community memberships of each of the identities.
+
+    Cached memberships are fetched from the cache in one request, the missing ones
+    are read from the database and stored.
+    """
+    cacheable = [identity.id is not None and memberships_cache_enabled() for identity in identities]
+    keys = [
+        memberships_cache_key(identity.id)
+        for identity, can_cache in zip(identities, cacheable, strict=True)
+        if can_cache
+    ]
+    cached = dict(zip(keys, current_cache.get_many(*keys), strict=True)) if keys else {}
+
+    ret: list[dict[str, str]] = []
+    to_store: dict[str, dict[str, str]] = {}
+    for identity, can_cache in zip(identities, cacheable, strict=True):
+        memberships = cached.get(memberships_cache_key(identity.id)) if can_cache else None
+        if memberships is None:
+            memberships = _read_memberships(identity)
+            if can_cache:
+                to_store[memberships_cache_key(identity.id)] = memberships
+        ret.append(memberships)
+
+    if to_store:
+        current_cache.set_many(
+            to_store, timeout=current_app.config.get("OAREPO_RDM_COMMUNITY_MEMBERSHIPS_CACHE_TIMEOUT", 60)
+        )
+    return ret
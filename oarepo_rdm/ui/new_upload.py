@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cache of the model chooser shown on the new upload page.
+
+The models, their deposit urls and the rendered list of model cards depend only on
+the registered models, the locale and the community the upload is created in, so
+they are computed once and kept in a process-wide LRU cache. Only the surrounding page,
+which depends on the logged-in user, is rendered on each visit. With a single model,
+nothing is cached: the user is redirected to its deposit page, which costs one ``url_for``.
+
+The community comes from the query string, so the choosers are cached only for
+existing communities, keyed by their id and current slug. Choosers for unknown
+communities are built on each visit.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from flask import current_app, render_template, request, url_for
+from invenio_communities.proxies import current_communities
+from invenio_i18n.proxies import current_i18n
+from invenio_pidstore.errors import PIDDeletedError, PIDDoesNotExistError
+from markupsafe import Markup
+from oarepo_runtime.proxies import current_runtime
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from oarepo_runtime.api import Model
+
+MAX_CACHED_CHOOSERS = 1024
+"""Maximum number of cached choosers, the least recently used are evicted."""
+
+_choosers: OrderedDict[Hashable, ModelChooser | None] = OrderedDict()
+_choosers_lock = threading.Lock()
+
+
+class ModelChooser(NamedTuple):
+    """Content of the new upload page."""
+
+    redirect_url: str | None
+    """Url of the deposit page of the only model, None if the user chooses from more models."""
+
+    models: list[dict[str, Any]]
+    """Serialized models (name, description and deposit url)."""
+
+    models_html: Markup
+    """Rendered list of model cards."""
+
+
+def model_chooser(community_slug: str | None) -> ModelChooser | None:
+    """Return content of the new upload page, None if the only model does not have a UI."""
+    models = list(current_runtime.rdm_models)
+    if len(models) == 1 or not current_app.config.get("OAREPO_RDM_NEW_UPLOAD_PAGE_CACHE", True):
+        # a single model is redirected to with the slug from the request, without looking up the community
+        return _build_model_chooser(models, community_slug)
+
+    community_key: tuple[str, str] | None = None
+    if community_slug:
+        community_key = _resolve_community(community_slug)
+        if community_key is None:
+            # unknown community, do not let arbitrary query arguments fill the cache
+            return _build_model_chooser(models, community_slug)
+
+    key = (
+        str(current_i18n.locale),
+        request.script_root,
+        community_key,
+        tuple((model.code, model.ui_blueprint_name) for model in models),
+    )
+    with _choosers_lock:
+        if key in _choosers:
+            _choosers.move_to_end(key)
+            return _choosers[key]
+
+    chooser = _build_model_chooser(models, community_key[1] if community_key else None)
+    with _choosers_lock:
+        _choosers[key] = chooser
+        _choosers.move_to_end(key)
+        while len(_choosers) > MAX_CACHED_CHOOSERS:
+            _choosers.popitem(last=False)
+    return chooser
+
+
+def clear_model_choosers() -> None:
+    """Drop the cached choosers."""
+    with _choosers_lock:
+        _choosers.clear()
+
+
+def _resolve_community(community_slug: str) -> tuple[str, str] | None:
+    """Return id and slug of the community given by its slug or id, None if it does not exist."""
+    try:
+        community = current_communities.service.record_cls.pid.resolve(community_slug)
+    except (PIDDoesNotExistError, PIDDeletedError):
+        return None
+    return str(community.id), community.slug
+
+
+def _build_model_chooser(models: list[Model], community_slug: str | None) -> ModelChooser | None:
+    def get_deposit_url(model: Model) -> str:
+        if community_slug:
+            return cast(
+                "str",
+                url_for(
+                    f"{model.ui_blueprint_name}.deposit_create",
+                    community=community_slug,
+                ),
+            )
+        return cast("str", url_for(f"{model.ui_blueprint_name}.deposit_create"))
+
+    if len(models) == 1:
+        model = models[0]
+        if not model.ui_blueprint_name:
+            return None
+        return ModelChooser(get_deposit_url(model), [], Markup(""))
+
+    serialized_models = [
+        {
+            "name": model.name,
+            "description": model.description,
+            "url": get_deposit_url(model),
+        }
+        for model in models
+    ]
+    models_html = render_template(
+        current_app.config.get("OAREPO_RDM_NEW_UPLOAD_MODELS_TEMPLATE", "oarepo_rdm/new_upload_page_models.html"),
+        models=serialized_models,
+    )
+    return ModelChooser(None, serialized_models, Markup(models_html))  # noqa: S704 # rendered by jinja
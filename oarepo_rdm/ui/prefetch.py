@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Prefetching of the data needed by UI resource components.
+
+UI resource components run one after another and several of them load independent
+data (vocabularies, community memberships, PID configuration, ...). A component can
+declare these data dependencies by implementing
+
+```
+def prefetch(self, action: str, **kwargs) -> Mapping[str, Callable[[], Any]]:
+    if action == "form_config":
+        return {"vocabularies": vocabulary_options}
+    return {}
+```
+
+receiving the same keyword arguments as the hook it prefetches for, and then
+use `prefetched("vocabularies", vocabulary_options)` inside the hook.
+
+`PrefetchComponent`, which must be the first component of the resource, collects
+the loaders of all the components and runs them before the hooks - concurrently in
+a thread pool of `OAREPO_RDM_UI_PREFETCH_WORKERS` threads, or one by one if it is 0.
+A loader declared under the same name by more components runs only once. Without
+`PrefetchComponent`, `prefetched` simply calls the loader.
+
+Duration and number of SQL statements of each loader are recorded together with
+the component that declared it, see :mod:`oarepo_rdm.ui.instrumentation`.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar, override
+
+from flask import copy_current_request_context, current_app, g, has_request_context
+from oarepo_ui.resources.components import UIResourceComponent
+
+from .instrumentation import executed_queries, record_component_timing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+
+def prefetched(name: str, loader: Callable[[], _T]) -> _T:
+    """Return the prefetched data dependency, loading it if it has not been prefetched.
+
+    If the prefetch failed, the exception is raised here, in the component needing the data.
+    """
+    results = g.get("oarepo_rdm_prefetched") if has_request_context() else None
+    if results is None or name not in results:
+        return loader()
+    result = results.pop(name)
+    if isinstance(result, _PrefetchError):
+        raise result.exception
+    return result  # type: ignore[no-any-return]
+
+
+class _PrefetchError:
+    """Wrapper of an exception raised by a loader."""
+
+    def __init__(self, exception: Exception) -> None:
+        self.exception = exception
+
+
+def _timed_loader(loader: Callable[[], Any]) -> Callable[[], tuple[Any, float, int]]:
+    def run() -> tuple[Any, float, int]:
+        queries = executed_queries()
+        start = time.perf_counter()
+        try:
+            result = loader()
+        except Exception as e:  # noqa: BLE001 # re-raised in the component that needs the data
+            result = _PrefetchError(e)
+        return result, time.perf_counter() - start, executed_queries() - queries
+
+    return run
+
+
+class PrefetchComponent(UIResourceComponent):
+    """Loads data dependencies declared by the other components of the resource.
+
+    Must be the first component in the list of components.
+    """
+
+    def _prefetch(self, action: str, kwargs: dict[str, Any]) -> None:
+        loaders: dict[str, tuple[str, Callable[[], Any]]] = {}
+        for component in self.resource.components:
+            prefetch = getattr(component, "prefetch", None)
+            if prefetch is None:
+                continue
+            for name, loader in prefetch(action, **kwargs).items():
+                loaders.setdefault(name, (f"{type(component).__name__}.{name}", loader))
+        if not loaders:
+            return
+
+        workers = current_app.config.get("OAREPO_RDM_UI_PREFETCH_WORKERS", 0)
+        timed = {name: (label, _timed_loader(loader)) for name, (label, loader) in loaders.items()}
+        if workers and len(timed) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(timed))) as executor:
+                futures = {
+                    name: executor.submit(_in_request_context(run)) for name, (_label, run) in timed.items()
+                }
+                outcomes = {name: future.result() for name, future in futures.items()}
+        else:
+            outcomes = {name: run() for name, (_label, run) in timed.items()}
+
+        results = g.setdefault("oarepo_rdm_prefetched", {})
+        for name, (result, duration, queries) in outcomes.items():
+            results[name] = result
+            record_component_timing(timed[name][0], duration, queries)
+
+    @override
+    def form_config(self, **kwargs: Any) -> None:
+        """Prefetch data needed by the form_config hooks."""
+        self._prefetch("form_config", kwargs)
+
+    @override
+    def before_ui_detail(self, **kwargs: Any) -> None:
+        """Prefetch data needed by the before_ui_detail hooks."""
+        self._prefetch("before_ui_detail", kwargs)
+
+    @override
+    def before_ui_edit(self, **kwargs: Any) -> None:
+        """Prefetch data needed by the before_ui_edit hooks."""
+        self._prefetch("before_ui_edit", kwargs)
+
+    @override
+    def before_ui_create(self, **kwargs: Any) -> None:
+        """Prefetch data needed by the before_ui_create hooks."""
+        self._prefetch("before_ui_create", kwargs)
+
+
+def _in_request_context(fn: Callable[[], _T]) -> Callable[[], _T]:
+    """Run fn in a worker thread with a copy of the current request context and of flask.g."""
+    app = current_app._get_current_object()  # type: ignore[attr-defined] # noqa: SLF001
+    g_values = dict(vars(g))
+    request_context_fn = copy_current_request_context(fn)
+
+    def run() -> _T:
+        # the request context pushes a new app context with an empty g if there is none,
+        # so push our own one first and fill it with the values of the calling thread
+        with app.app_context():
+            vars(g).update(g_values)
+            return request_context_fn()
+
+    return run
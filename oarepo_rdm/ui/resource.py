@@ -10,8 +10,27 @@
 
 from __future__ import annotations
 
+from typing import Any, override
+
+from flask import current_app
 from oarepo_ui.resources.records.resource import RecordsUIResource
 
+from .instrumentation import measure_component
+
 
 class RDMRecordsUIResource(RecordsUIResource):
     """Base configuration for RDM UI resources."""
+
+    @override
+    def run_components(self, action: str, *args: Any, **kwargs: Any) -> None:
+        """Run components for a given action, measuring each of them if the action is timed.
+
+        See `OAREPO_RDM_UI_TIMED_HOOKS` and :mod:`oarepo_rdm.ui.instrumentation`.
+        """
+        if action not in current_app.config.get("OAREPO_RDM_UI_TIMED_HOOKS", ()):
+            super().run_components(action, *args, **kwargs)
+            return
+        for component in self.components:
+            if hasattr(component, action):
+                with measure_component(f"{type(component).__name__}.{action}"):
+                    getattr(component, action)(*args, **kwargs)
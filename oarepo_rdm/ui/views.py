@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast
 
-from flask import Blueprint, Flask, abort, current_app, render_template, request, url_for
+from flask import Blueprint, Flask, abort, current_app, render_template, request
 from flask_security import login_required
 from invenio_access.permissions import system_identity
 from invenio_app_rdm.records_ui.searchapp import search_app_context
@@ -56,22 +56,27 @@ from invenio_pidstore.errors import (
     PIDDoesNotExistError,
     PIDUnregistered,
 )
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
 from invenio_rdm_records.services.errors import RecordDeletedException
 from invenio_records_resources.proxies import current_service_registry
+from invenio_records_resources.services.base.links import LinksTemplate
 from invenio_records_resources.services.errors import (
     FileKeyNotFoundError,
     PermissionDeniedError,
     RecordPermissionDeniedError,
 )
-from oarepo_runtime.proxies import current_runtime
 from oarepo_ui.utils import append_query_params
 from sqlalchemy.exc import NoResultFound
 from werkzeug.utils import redirect
 
+from oarepo_rdm.proxies import current_oarepo_rdm
+
+from .new_upload import model_chooser
+
 if TYPE_CHECKING:
     from flask.typing import ResponseReturnValue
     from invenio_rdm_records.services.services import RDMRecordService
-    from oarepo_runtime.api import Model
+    from invenio_records_resources.records.api import Record
     from werkzeug import Response
 
 
@@ -193,35 +198,59 @@ def create_records_blueprint(app: Flask) -> Blueprint:
     return blueprint
 
 
+def record_html_link(record: Record, link_name: str) -> str:
+    """Expand a single link of the record by the service of its model, without serializing the record.
+
+    :raises KeyError: if the model does not define the link or it is not rendered for the record
+    """
+    model = current_oarepo_rdm.dispatch.rdm_models[record["$schema"]]
+    single_link_tpl = LinksTemplate(
+        {link_name: model.service.config.links_item[link_name]},
+        context=model.links_item_tpl.context,
+    )
+    return cast("str", single_link_tpl.expand(system_identity, record)[link_name])
+
+
+def _redirect_to_link(record: Record, link_name: str) -> Response:
+    return redirect(append_query_params(record_html_link(record, link_name), request.args))
+
+
 @pass_include_deleted
 @pass_is_preview
 def record_detail(pid_value: str, include_deleted: bool = False, is_preview: bool = False) -> Response:
-    """Redirect to the record detail page."""
+    """Redirect to the record detail page.
+
+    Live records and drafts are resolved to their model and redirected to without
+    being serialized. Deleted records and parent ids go through the service.
+    """
     service = cast("RDMRecordService", current_service_registry.get("records"))
     if is_preview:
+        draft = RDMDraft.pid.resolve(pid_value, registered_only=False)
+        if not draft.is_published:
+            return _redirect_to_link(draft, "preview_html")
         rec = service.read_draft(system_identity, pid_value)
     else:
         try:
-            rec = service.read(system_identity, pid_value, include_deleted=include_deleted)
-        except NoResultFound:
+            record = RDMRecord.pid.resolve(pid_value, registered_only=True)
+        except (NoResultFound, PIDDoesNotExistError):
+            # not a record id, might be a parent id of a record
             rec = service.read_latest(system_identity, pid_value)
-            data = rec.to_dict()
-            url = data["links"]["latest_html"]
-            url_with_params = append_query_params(url, request.args)
-            return redirect(url_with_params)
-    data = rec.to_dict()
-    url = data["links"]["preview_html"] if is_preview else data["links"]["self_html"]
-    url_with_params = append_query_params(url, request.args)
-    return redirect(url_with_params)
+            return _redirect_to_link(rec._record, "latest_html")  # noqa: SLF001
+        if not record.deletion_status.is_deleted:
+            return _redirect_to_link(record, "self_html")
+        rec = service.read(system_identity, pid_value, include_deleted=include_deleted)
+    return _redirect_to_link(rec._record, "preview_html" if is_preview else "self_html")  # noqa: SLF001
 
 
 def deposit_edit(pid_value: str) -> Response:
     """Redirect to the deposit edit page."""
+    draft = RDMDraft.pid.resolve(pid_value, registered_only=False)
+    if not draft.is_published:
+        return _redirect_to_link(draft, "self_html")
+    # the published record might be deleted, let the service check it
     service = cast("RDMRecordService", current_service_registry.get("records"))
-    draft = service.read_draft(system_identity, pid_value)
-    data = draft.to_dict()
-    self_html = append_query_params(data["links"]["self_html"], request.args)
-    return redirect(self_html)
+    rec = service.read_draft(system_identity, pid_value)
+    return _redirect_to_link(rec._record, "self_html")  # noqa: SLF001
 
 
 @login_required
@@ -231,37 +260,16 @@ def deposit_create() -> ResponseReturnValue:
     If only one model is available, redirects directly to that model's deposit create page.
     If multiple models are available, renders a selection page with model cards.
     Preserves community parameter from query string when redirecting.
+    The model list is cached, see :mod:`oarepo_rdm.ui.new_upload`.
     """
-    models = list(current_runtime.rdm_models)
-    community_slug = request.args.get("community")
-
-    def get_deposit_url(model: Model) -> str:
-        if community_slug:
-            return cast(
-                "str",
-                url_for(
-                    f"{model.ui_blueprint_name}.deposit_create",
-                    community=community_slug,
-                ),
-            )
-        return cast("str", url_for(f"{model.ui_blueprint_name}.deposit_create"))
-
-    if len(models) == 1:
-        model = models[0]
-        if not model.ui_blueprint_name:
-            abort(404)
-        return redirect(get_deposit_url(model))
-
-    serialized_models = [
-        {
-            "name": model.name,
-            "description": model.description,
-            "url": get_deposit_url(model),
-        }
-        for model in models
-    ]
+    chooser = model_chooser(request.args.get("community"))
+    if chooser is None:
+        abort(404)
+    if chooser.redirect_url is not None:
+        return redirect(chooser.redirect_url)
 
     return render_template(
         current_app.config.get("OAREPO_RDM_NEW_UPLOAD_PAGE_TEMPLATE", "oarepo_rdm/new_upload_page.html"),
-        models=serialized_models,
+        models=chooser.models,
+        models_html=chooser.models_html,
     )
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cache of the vocabulary options passed to the deposit form.
+
+Dumping `VocabulariesOptions` runs a search for each of the vocabularies (resource
+types, title types, creator roles, ...). The options are the same for all users
+and change only when vocabularies are changed, so the dump is kept in a process-wide
+cache keyed by locale.
+
+Each process keeps its own copy. To invalidate all of them, a version token is stored
+in the shared invenio cache and replaced whenever a transaction changing vocabulary
+items or schemes commits (see :mod:`oarepo_rdm.cache_invalidation`). Entries also expire after
+`OAREPO_RDM_VOCABULARY_OPTIONS_CACHE_TIMEOUT` seconds, which covers vocabularies
+changed without going through the database session (for example by raw SQL).
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app, g
+from invenio_access.permissions import system_identity
+from invenio_app_rdm.records_ui.views.deposits import VocabulariesOptions
+from invenio_i18n.proxies import current_i18n
+
+from oarepo_rdm.cache_invalidation import bump_vocabularies_version, vocabularies_version
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+log = logging.getLogger(__name__)
+
+_options_cache: dict[str, tuple[Any, float, dict[str, Any]]] = {}
+"""locale => (vocabularies version, expiration time, dumped options)"""
+
+_options_cache_lock = threading.Lock()
+
+
+def vocabulary_options() -> dict[str, Any]:
+    """Return the deposit form vocabulary options for the current locale."""
+    if not current_app.config.get("OAREPO_RDM_VOCABULARY_OPTIONS_CACHE", True):
+        return VocabulariesOptions().dump()  # type: ignore[no-any-return]
+
+    locale = str(current_i18n.locale)
+    version = vocabularies_version()
+    cached = _options_cache.get(locale)
+    if cached is not None and cached[0] == version and cached[1] > time.monotonic():
+        return copy.deepcopy(cached[2])
+
+    options = VocabulariesOptions().dump()
+    timeout = current_app.config.get("OAREPO_RDM_VOCABULARY_OPTIONS_CACHE_TIMEOUT", 3600)
+    with _options_cache_lock:
+        _options_cache[locale] = (version, time.monotonic() + timeout, options)
+    return copy.deepcopy(options)
+
+
+def invalidate_vocabulary_options() -> None:
+    """Drop the cached options in this and (through the shared version token) all other processes."""
+    with _options_cache_lock:
+        _options_cache.clear()
+    bump_vocabularies_version()
+
+
+def warm_vocabulary_options(app: Flask) -> None:
+    """Fill the cache for all the configured locales."""
+    from flask_babel import force_locale
+
+    locales = {str(app.config.get("BABEL_DEFAULT_LOCALE", "en"))}
+    locales.update(language for language, _title in app.config.get("I18N_LANGUAGES", []))
+    for locale in sorted(locales):
+        try:
+            with app.test_request_context(), force_locale(locale):
+                g.identity = system_identity
+                vocabulary_options()
+        except Exception:
+            log.exception("Could not pre-warm vocabulary options for locale %s", locale)
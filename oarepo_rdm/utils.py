@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Read-only containers for the values built once at application finalization."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Never, Self, override
+
+
+class FrozenDict(dict):
+    """Dictionary that can not be modified after it has been created.
+
+    Copies are plain dictionaries, so code that copies the value to customize it can modify the copy.
+    """
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> Never:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[Any, Any]:
+        ret: dict[Any, Any] = {}
+        memo[id(self)] = ret
+        for key, value in self.items():
+            ret[copy.deepcopy(key, memo)] = copy.deepcopy(value, memo)
+        return ret
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[dict[Any, Any]]]:
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """List that can not be modified after it has been created.
+
+    Copies are plain lists, so code that copies the value to customize it can modify the copy.
+    """
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> Never:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        ret: list[Any] = []
+        memo[id(self)] = ret
+        ret.extend(copy.deepcopy(value, memo) for value in self)
+        return ret
+
+    @override
+    def __reduce__(self) -> tuple[type[Self], tuple[list[Any]]]:
+        return type(self), (list(self),)
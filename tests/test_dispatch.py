@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the model dispatch snapshot."""
+
+from __future__ import annotations
+
+import os
+import timeit
+
+import pytest
+from oarepo_runtime import current_runtime
+
+from oarepo_rdm.proxies import current_oarepo_rdm
+
+from .models import modelb
+
+modelb_service = modelb.proxies.current_service
+
+
+def test_dispatch_snapshot_matches_runtime(app):
+    """The snapshot is built at finalize time and holds the same models as the runtime."""
+    assert "dispatch" in vars(app.extensions["oarepo-rdm"])
+    dispatch = current_oarepo_rdm.dispatch
+
+    assert set(dispatch.rdm_models) == set(current_runtime.rdm_models_by_schema)
+    for schema, model in current_runtime.rdm_models_by_schema.items():
+        entry = dispatch.rdm_models[schema]
+        assert entry.model is model
+        assert entry.service is model.service
+        assert entry.record_cls is model.service.record_cls
+        assert entry.draft_cls is model.service.draft_cls
+        assert entry.schema_cls is model.service.config.schema
+        # per-call objects are not shared between threads
+        assert entry.schema is not entry.schema
+        assert entry.links_item_tpl is not entry.links_item_tpl
+        for export in model.exports:
+            assert export.mimetype in entry.exports
+    for schema, model in current_runtime.models_by_schema.items():
+        assert dispatch.record_classes[schema] is model.record_cls
+
+    with pytest.raises(TypeError):
+        dispatch.rdm_models["unknown"] = None  # type: ignore[index]
+
+
+def test_dispatch_snapshot_lookup_matches_runtime_lookup(db, identity_simple, required_rdm_metadata, search_clear):
+    """Dispatching a record through the snapshot gives the same result as the runtime lookup."""
+    draft = modelb_service.create(
+        identity_simple,
+        {"metadata": {**required_rdm_metadata, "title": "blah"}, "files": {"enabled": False}},
+    )
+    record = draft._record  # noqa: SLF001
+    schema = record["$schema"]
+
+    entry = current_oarepo_rdm.dispatch.rdm_models[schema]
+    model = current_runtime.rdm_models_by_schema[schema]
+    assert entry.service is model.service
+    assert entry.links_item_tpl.expand(identity_simple, record) == model.service.links_item_tpl.expand(
+        identity_simple, record
+    )
+    context = {"identity": identity_simple, "record": record}
+    assert entry.schema.dump(record, context=context) == model.service.schema.dump(record, context=context)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get("OAREPO_RDM_BENCHMARK"), reason="timing benchmark, set OAREPO_RDM_BENCHMARK=1")
+def test_dispatch_snapshot_is_faster_than_runtime_lookup(app):
+    """Benchmark the lookup of the record classes and service of a record: runtime proxies against the snapshot."""
+    schema = next(iter(current_runtime.rdm_models_by_schema))
+
+    def runtime_lookup():
+        service = current_runtime.rdm_models_by_schema[schema].service
+        return service, service.record_cls, service.draft_cls
+
+    def snapshot_lookup():
+        entry = current_oarepo_rdm.dispatch.rdm_models[schema]
+        return entry.service, entry.record_cls, entry.draft_cls
+
+    runtime_time = min(timeit.repeat(runtime_lookup, number=1000, repeat=5))
+    snapshot_time = min(timeit.repeat(snapshot_lookup, number=1000, repeat=5))
+
+    assert snapshot_time < runtime_time, f"snapshot: {snapshot_time:.4f}s, runtime: {runtime_time:.4f}s"
@@ -15,6 +15,9 @@ config keys plus a round-trip filter through rdm_records_service.
 
 from __future__ import annotations
 
+import copy
+
+import pytest
 from invenio_records_resources.services.records.facets import TermsFacet
 
 from .models import modela, modelb, modelc
@@ -55,6 +58,48 @@ def test_per_view_facets_lists_match_merged_options(app):
     assert app.config["COMMUNITIES_RECORDS_SEARCH"]["facets"] == published
 
 
+def test_search_config_is_merged_at_finalize_app(app):
+    """The merged search options are built once, at app boot, and copies of them can be customized."""
+    ext = app.extensions["oarepo-rdm"]
+    assert "search_options" in vars(ext)
+    assert "draft_search_options" in vars(ext)
+    assert app.config["RDM_FACETS"] is ext.dynamic_rdm_facets
+    assert app.config["RDM_SEARCH"] is ext.dynamic_rdm_search
+    assert app.config["RDM_SEARCH_DRAFTS"] is ext.dynamic_rdm_search_drafts
+    assert isinstance(app.config["RDM_SEARCH"]["sort"], list)
+    assert app.config["RDM_SEARCH"]["sort"][0] == "bestmatch"
+
+    with pytest.raises(TypeError):
+        ext.search_options.facets.pop("metadata_adescription")
+    with pytest.raises(TypeError):
+        app.config["RDM_FACETS"]["metadata_adescription"] = {}
+    with pytest.raises(TypeError):
+        app.config["RDM_FACETS"]["metadata_adescription"]["ui"]["field"] = "other"
+    with pytest.raises(TypeError):
+        app.config["RDM_SEARCH"]["sort"].append("title")
+    with pytest.raises(TypeError):
+        app.config["RDM_SEARCH_DRAFTS"]["facets"].remove("metadata_adescription")
+
+    facets = copy.deepcopy(ext.search_options.facets)
+    facets.pop("metadata_adescription")
+    assert "metadata_adescription" in ext.search_options.facets
+    search = copy.deepcopy(app.config["RDM_SEARCH"])
+    search["sort"].append("title")
+    assert "title" not in app.config["RDM_SEARCH"]["sort"]
+
+
+def test_search_config_defaults_before_finalize_app(app):
+    """Before finalize_app the defaults are lazy proxies to the merged values, usable by any reader."""
+    from oarepo_rdm import initial_config
+
+    assert not isinstance(initial_config.RDM_FACETS, str)
+    with app.app_context():
+        assert initial_config.RDM_FACETS == app.config["RDM_FACETS"]
+        assert initial_config.RDM_SEARCH["sort"] == app.config["RDM_SEARCH"]["sort"]
+        assert initial_config.COMMUNITIES_RECORDS_SEARCH["facets"] == app.config["RDM_SEARCH"]["facets"]
+        assert isinstance(initial_config.RDM_SEARCH_DRAFTS["facets"], list)
+
+
 def test_per_view_lists_are_subset_of_pool(app):
     """Every per-view selection must exist in the RDM_FACETS pool."""
     pool = set(app.config["RDM_FACETS"].keys())
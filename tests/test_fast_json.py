@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests and benchmark of the orjson-backed JSON serializer."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import timeit
+import uuid
+from decimal import Decimal
+
+import pytest
+from flask_resources.serializers.json import JSONSerializer
+from invenio_i18n import lazy_gettext as _
+
+from oarepo_rdm.resources.records.fast_json import FastJSONSerializer
+
+pytest.importorskip("orjson")
+
+
+def _search_page(size: int = 100) -> dict:
+    """Return a page of search results resembling an RDM search response."""
+    hits = []
+    for idx in range(size):
+        hits.append(
+            {
+                "id": f"abcde-{idx:05d}",
+                "$schema": "local://modela-v1.0.0.json",
+                "created": datetime.datetime(2025, 1, 1, 12, idx % 60, tzinfo=datetime.UTC),
+                "updated": "2025-01-02T10:00:00+00:00",
+                "revision_id": idx,
+                "metadata": {
+                    "title": f"Record číslo {idx}",
+                    "description": "Lorem ipsum dolor sit amet. " * 40,
+                    "publication_date": "2025-01-01",
+                    "resource_type": {"id": "dataset", "title": {"en": "Dataset", "cs": "Datová sada"}},
+                    "creators": [
+                        {
+                            "person_or_org": {"name": f"Author {c}", "type": "personal"},
+                            "affiliations": [{"id": "01ggx4157", "name": "CERN"}],
+                        }
+                        for c in range(10)
+                    ],
+                    "subjects": [{"subject": f"subject {s}"} for s in range(20)],
+                    "size": Decimal("12.5"),
+                },
+                "links": {"self": f"https://127.0.0.1:5000/api/records/abcde-{idx:05d}"},
+                "ui": {"access_status": {"title_l10n": _("Open")}},
+                "uuid": uuid.UUID(int=idx),
+            }
+        )
+    return {
+        "hits": {"hits": hits, "total": size},
+        "aggregations": {"resource_type": {"buckets": [{"key": "dataset", "doc_count": size}]}},
+        "sortBy": "newest",
+        "links": {"self": "https://127.0.0.1:5000/api/records?page=1&size=100"},
+    }
+
+
+def test_fast_json_produces_the_same_data(app):
+    """The fast serializer encodes lazy strings, dates, decimals and uuids as the default one."""
+    page = _search_page(3)
+    with app.test_request_context():
+        fast = FastJSONSerializer().serialize_object_list(page)
+        default = JSONSerializer().serialize_object_list(page)
+
+    assert json.loads(fast) == json.loads(default)
+
+
+def test_fast_json_falls_back_for_unsupported_values(app):
+    """Values orjson can not encode are encoded by the json module."""
+    data = {"big": 2**70, 1: "non-string key"}
+    with app.test_request_context():
+        assert json.loads(FastJSONSerializer().serialize_object(data)) == {"big": 2**70, "1": "non-string key"}
+
+
+def test_fast_json_prettyprint(app):
+    """Pretty printing is supported."""
+    with app.test_request_context("/?prettyprint=1"):
+        serialized = FastJSONSerializer().serialize_object({"b": 1, "a": 2})
+    assert serialized == '{\n  "a": 2,\n  "b": 1\n}'
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get("OAREPO_RDM_BENCHMARK"), reason="timing benchmark, set OAREPO_RDM_BENCHMARK=1")
+def test_fast_json_is_faster_than_default(app):
+    """Benchmark the encoders on a page of 100 records."""
+    page = _search_page()
+    fast, default = FastJSONSerializer(), JSONSerializer()
+    with app.test_request_context():
+        fast_time = min(timeit.repeat(lambda: fast.serialize_object_list(page), number=5, repeat=5))
+        default_time = min(timeit.repeat(lambda: default.serialize_object_list(page), number=5, repeat=5))
+
+    assert fast_time < default_time, f"orjson: {fast_time:.4f}s, json: {default_time:.4f}s"
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests that the modules loaded by API processes do not import the UI stack.
+
+The modules are imported in a fresh interpreter, so that the UI modules imported
+by the other tests are not in ``sys.modules``.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+API_MODULES = (
+    "oarepo_rdm.ext",
+    "oarepo_rdm.cache_invalidation",
+    "oarepo_rdm.records.missing_pids",
+    "oarepo_rdm.oai.serializer",
+    "oarepo_rdm.services.delegating",
+)
+"""Modules imported when the API application is created and finalized."""
+
+UI_MODULES = ("oarepo_rdm.ui", "invenio_app_rdm.records_ui", "oarepo_ui")
+
+
+def _modules_loaded_by(modules: tuple[str, ...]) -> set[str]:
+    """Import the modules in a fresh interpreter and return the names of all loaded modules."""
+    code = (
+        "import importlib, json, sys\n"
+        f"for module in {list(modules)!r}:\n"
+        "    importlib.import_module(module)\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(  # noqa: S603 # running the current interpreter
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_api_modules_do_not_import_ui():
+    """API processes must not load the UI stack."""
+    loaded = _modules_loaded_by(API_MODULES)
+
+    assert "oarepo_ui" not in loaded
+    ui_modules = sorted(
+        module for module in loaded if any(module == ui or module.startswith(f"{ui}.") for ui in UI_MODULES)
+    )
+    assert not ui_modules, f"API modules import the UI stack: {ui_modules}"
@@ -12,6 +12,16 @@ from __future__ import annotations
 
 import json
 
+import pytest
+from invenio_search import current_search_client
+from invenio_search.utils import build_alias_name
+
+from oarepo_rdm.model.presets.rdm.records.rdm_index_settings import index_settings_patch
+from oarepo_rdm.records import reindex
+from oarepo_rdm.records.reindex import model_index_names, reindex_with_current_settings
+
+from .models import modela
+
 
 def test_mapping_rdm_complete(app, model_c):
     """Check that RDM mapping contains all expected fields."""
@@ -42,3 +52,89 @@ def test_mapping_rdm_complete(app, model_c):
         "funding",
         "references",
     }
+
+
+def test_index_settings_patch():
+    """Index settings from the model configuration are converted to a mapping patch."""
+    configuration = {
+        "number_of_shards": 2,
+        "refresh_interval": "5s",
+        "codec": "best_compression",
+        "sort": [("created", "desc")],
+        "eager_global_ordinals": ["metadata.resource_type.id", "parent.communities.ids"],
+        "drafts": {"sort": "updated", "refresh_interval": "1s"},
+    }
+
+    assert index_settings_patch(configuration) == {
+        "settings": {
+            "index": {
+                "number_of_shards": 2,
+                "refresh_interval": "5s",
+                "codec": "best_compression",
+                "sort.field": ["created"],
+                "sort.order": ["desc"],
+            }
+        },
+        "mappings": {
+            "properties": {
+                "metadata": {"properties": {"resource_type": {"properties": {"id": {"eager_global_ordinals": True}}}}},
+                "parent": {"properties": {"communities": {"properties": {"ids": {"eager_global_ordinals": True}}}}},
+            }
+        },
+    }
+    draft_settings = index_settings_patch(configuration, draft=True)["settings"]["index"]
+    assert draft_settings["refresh_interval"] == "1s"
+    assert draft_settings["sort.field"] == ["updated"]
+    assert index_settings_patch({}) == {}
+
+
+def test_index_settings_patch_checks_eager_global_ordinals():
+    """Paths of eager_global_ordinals must point to fields mapped in the mapping file."""
+    mapping = {"mappings": {"properties": {"metadata": {"properties": {"title": {"type": "keyword"}}}}}}
+
+    patch = index_settings_patch({"eager_global_ordinals": ["metadata.title"]}, mapping=mapping)
+    assert patch["mappings"]["properties"]["metadata"]["properties"]["title"] == {"eager_global_ordinals": True}
+
+    for path in ("metadata.titel", "metadata", "metadata.title.id"):
+        with pytest.raises(ValueError, match=path):
+            index_settings_patch({"eager_global_ordinals": [path]}, mapping=mapping)
+
+
+def test_reindex_with_current_settings(app, db, identity_simple, search_clear):
+    """Documents and aliases are moved to a new index created from the mapping file."""
+    service = modela.proxies.current_service
+    service.create(
+        identity_simple,
+        {"metadata": {"title": "reindexed", "adescription": "desc"}, "files": {"enabled": False}},
+    )
+    service.draft_indexer.refresh()
+
+    index_name = service.draft_cls.index._name  # noqa: SLF001
+    assert index_name in model_index_names(["modela"])
+    alias = build_alias_name(index_name)
+    old_indices = set(current_search_client.indices.get_alias(name=alias))
+
+    new_index = reindex_with_current_settings(index_name)
+
+    assert set(current_search_client.indices.get_alias(name=alias)) == {new_index}
+    assert not any(current_search_client.indices.exists(index=old_index) for old_index in old_indices)
+    assert current_search_client.count(index=alias)["count"] == 1
+
+
+def test_reindex_failure_deletes_new_index(app, db, identity_simple, search_clear, monkeypatch):
+    """If the reindex task fails, the new index is deleted and the aliases stay on the old index."""
+    service = modela.proxies.current_service
+    index_name = service.record_cls.index._name  # noqa: SLF001
+    alias = build_alias_name(index_name)
+    old_indices = set(current_search_client.indices.get_alias(name=alias))
+    all_indices = set(current_search_client.indices.get(index="*"))
+
+    def failed_task(task_id, poll_interval):  # noqa: ARG001
+        raise RuntimeError(f"Reindex task {task_id} failed")
+
+    monkeypatch.setattr(reindex, "_wait_for_task", failed_task)
+    with pytest.raises(RuntimeError):
+        reindex_with_current_settings(index_name)
+
+    assert set(current_search_client.indices.get_alias(name=alias)) == old_indices
+    assert set(current_search_client.indices.get(index="*")) == all_indices
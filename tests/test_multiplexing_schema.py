@@ -114,3 +114,56 @@ def test_multiplexing_schema_dump_many(db, identity_simple, search_clear):
     assert len(result) == 2
     assert result[0]["$schema"] == "local://modela-v1.0.0.json"
     assert result[1]["$schema"] == "local://modelb-v1.0.0.json"
+
+
+def test_multiplexing_schema_load_many_mixed_models(db, identity_simple, search_clear):
+    """Records of different models are loaded per model and returned in the input order."""
+    data_list = [
+        {
+            "$schema": "local://modela-v1.0.0.json",
+            "metadata": {"title": "Test A1", "adescription": "desc a1"},
+        },
+        {
+            "$schema": "local://modelb-v1.0.0.json",
+            "metadata": {"title": "Test B1", "bdescription": "desc b1"},
+        },
+        {
+            "$schema": "local://modela-v1.0.0.json",
+            "metadata": {"title": "Test A2", "adescription": "desc a2"},
+        },
+    ]
+
+    schema = MultiplexingSchema(context={"identity": identity_simple})
+    result = schema.load(data_list, many=True)
+
+    titles = [loaded["metadata"]["title"] for loaded, _errors in result]
+    assert titles == ["Test A1", "Test B1", "Test A2"]
+    assert result[1][0]["metadata"]["bdescription"] == "desc b1"
+
+
+def test_multiplexing_schema_dump_many_mixed_models(db, identity_simple, search_clear):
+    """Records of different models are dumped by their model and returned in the input order."""
+    drafts = [
+        modela.proxies.current_service.create(
+            identity_simple,
+            {"metadata": {"title": "Test A1", "adescription": "desc a1"}, "files": {"enabled": False}},
+        ),
+        modelb.proxies.current_service.create(
+            identity_simple,
+            {"metadata": {"title": "Test B1", "bdescription": "desc b1"}, "files": {"enabled": False}},
+        ),
+        modela.proxies.current_service.create(
+            identity_simple,
+            {"metadata": {"title": "Test A2", "adescription": "desc a2"}, "files": {"enabled": False}},
+        ),
+    ]
+
+    schema = MultiplexingSchema(context={"identity": identity_simple})
+    result = schema.dump([draft._record for draft in drafts], many=True)  # noqa: SLF001
+
+    assert [item["metadata"]["title"] for item in result] == ["Test A1", "Test B1", "Test A2"]
+    assert [item["$schema"] for item in result] == [
+        "local://modela-v1.0.0.json",
+        "local://modelb-v1.0.0.json",
+        "local://modela-v1.0.0.json",
+    ]
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the slim percolator mapping."""
+
+from __future__ import annotations
+
+import pytest
+
+from oarepo_rdm.oai.percolator_mapping import UnsupportedQueryError, prune_mapping, query_field_paths
+
+FULL_MAPPING = {
+    "mappings": {
+        "dynamic": "strict",
+        "dynamic_templates": [{"pids": {"path_match": "pids.*", "mapping": {"type": "keyword"}}}],
+        "properties": {
+            "created": {"type": "date"},
+            "metadata": {
+                "dynamic": "strict",
+                "properties": {
+                    "title": {
+                        "type": "text",
+                        "analyzer": "title_analyzer",
+                        "fields": {"keyword": {"type": "keyword"}},
+                    },
+                    "description": {"type": "text"},
+                }
+            },
+        },
+    },
+    "settings": {
+        "analysis": {
+            "analyzer": {
+                "title_analyzer": {"tokenizer": "standard", "filter": ["ascii"]},
+                "unused_analyzer": {"tokenizer": "standard"},
+            },
+            "filter": {"ascii": {"type": "asciifolding"}},
+        }
+    },
+}
+
+
+def test_query_field_paths():
+    assert query_field_paths({"query_string": {"query": 'metadata.title:abc AND (created:[2020 TO *] OR "x:y")'}}) == {
+        "metadata.title",
+        "created",
+    }
+    assert query_field_paths({"bool": {"must": [{"term": {"metadata.title.keyword": "abc"}}]}}) == {
+        "metadata.title.keyword"
+    }
+
+    with pytest.raises(UnsupportedQueryError):
+        query_field_paths({"query_string": {"query": "abc"}})
+
+
+def test_prune_mapping():
+    slim = prune_mapping(FULL_MAPPING, {"metadata.title.keyword"})
+    assert slim["mappings"]["properties"] == {
+        "metadata": {"properties": {"title": FULL_MAPPING["mappings"]["properties"]["metadata"]["properties"]["title"]}}
+    }
+    # documents with fields missing in the slim mapping can be percolated
+    assert slim["mappings"]["dynamic"] is False
+    assert "dynamic_templates" not in slim["mappings"]
+    assert prune_mapping(FULL_MAPPING, {"metadata"})["mappings"]["properties"]["metadata"] == {
+        "properties": FULL_MAPPING["mappings"]["properties"]["metadata"]["properties"]
+    }
+    assert slim["settings"]["analysis"] == {
+        "analyzer": {"title_analyzer": {"tokenizer": "standard", "filter": ["ascii"]}},
+        "filter": {"ascii": {"type": "asciifolding"}},
+    }
+
+    with pytest.raises(UnsupportedQueryError):
+        prune_mapping(FULL_MAPPING, {"metadata.unknown"})
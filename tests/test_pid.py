@@ -13,10 +13,17 @@ from typing import Any, override
 import pytest
 from invenio_access.permissions import system_identity
 from invenio_drafts_resources.records.api import DraftRecordIdProviderV2
-from invenio_pidstore.errors import PIDAlreadyExists
-from invenio_rdm_records.records.api import RDMDraft
+from invenio_pidstore.errors import PIDAlreadyExists, PIDDoesNotExistError, PIDRedirectedError, PIDUnregistered
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+from invenio_rdm_records.services.pids.service import PIDsService
 from invenio_records.systemfields.base import SystemFieldsExt
 from oarepo_runtime.records.pid_providers import UniversalPIDMixin
+from sqlalchemy.orm.exc import NoResultFound
+
+from oarepo_rdm.records.missing_pids import check_missing_pid
+
+from .utils import count_queries
 
 FAKE_PID = "xavsd-8adfd"
 
@@ -64,6 +71,187 @@ def test_pid(model_c, search_clear):
     assert isinstance(draft, model_c.Draft)
 
 
+def test_pid_resolve_fetches_pid_once(model_c, search_clear):
+    modelc_record = model_c.proxies.current_service.create(
+        system_identity,
+        {"metadata": {"title": "blah", "cdescription": "kch"}},
+    )
+    with count_queries() as statements:
+        draft = RDMDraft.pid.resolve(modelc_record["id"])
+    assert draft.pid.pid_value == modelc_record["id"]
+    # the pid and the draft are fetched in a single joined query
+    draft_table = model_c.Draft.model_cls.__tablename__
+    queries = [statement for statement in statements if "pidstore_pid" in statement or draft_table in statement]
+    assert len(queries) == 1
+    assert "pidstore_pid" in queries[0]
+    assert draft_table in queries[0]
+
+    with pytest.raises(PIDDoesNotExistError):
+        RDMDraft.pid.resolve("non-existing-pid")
+
+
+def test_pid_resolve_errors_match_pidstore_resolver(model_c, search_clear):
+    """Pids of live, unpublished and redirected records raise the errors of the pidstore resolver."""
+    service = model_c.proxies.current_service
+    first = service.create(system_identity, {"metadata": {"title": "first", "cdescription": "kch"}})
+    second = service.create(system_identity, {"metadata": {"title": "second", "cdescription": "kch"}})
+
+    # the draft has no published record
+    with pytest.raises(NoResultFound):
+        RDMRecord.pid.resolve(first["id"])
+    with pytest.raises(PIDUnregistered):
+        RDMRecord.pid.resolve(first["id"], registered_only=True)
+
+    first_pid = RDMDraft.pid.resolve(first["id"]).pid
+    second_pid = RDMDraft.pid.resolve(second["id"]).pid
+    first_pid.register()
+    second_pid.register()
+    first_pid.redirect(second_pid)
+    with pytest.raises(PIDRedirectedError):
+        RDMDraft.pid.resolve(first["id"])
+    assert isinstance(RDMDraft.pid.resolve_many([first["id"]])[0], PIDRedirectedError)
+
+
+def test_missing_pid_cache(model_c, search_clear):
+    with pytest.raises(PIDDoesNotExistError):
+        RDMDraft.pid.resolve("missing-pid")
+
+    with count_queries() as statements, pytest.raises(PIDDoesNotExistError):
+        RDMDraft.pid.resolve("missing-pid")
+    assert not [statement for statement in statements if "pidstore_pid" in statement]
+
+    with pytest.raises(PIDDoesNotExistError):
+        RDMDraft.pid.resolve("x" * 300)
+
+    # creating the pid invalidates the cache
+    PersistentIdentifier.create("modelc", "missing-pid", status=PIDStatus.NEW)
+    check_missing_pid("missing-pid")
+
+
+def test_missing_pid_cache_is_scoped_by_pid_types(model_c, search_clear):
+    from oarepo_rdm.records.resolver import find_record_pid
+
+    modelc_record = model_c.proxies.current_service.create(
+        system_identity,
+        {"metadata": {"title": "blah", "cdescription": "kch"}},
+    )
+    with pytest.raises(PIDDoesNotExistError):
+        find_record_pid(modelc_record["id"], ["modela"])
+    with pytest.raises(PIDDoesNotExistError):
+        check_missing_pid(modelc_record["id"], ["modela"])
+
+    # a miss in other pid types is not a miss in the pid type of the record
+    check_missing_pid(modelc_record["id"], ["modelc"])
+    check_missing_pid(modelc_record["id"])
+    assert find_record_pid(modelc_record["id"], ["modelc"]).pid_type == "modelc"
+
+
+def test_resolve_many(model_a, model_b, rdm_records_service, identity_simple, required_rdm_metadata, search_clear):
+    recorda = rdm_records_service.create(
+        identity_simple,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    recordb = rdm_records_service.create(
+        identity_simple,
+        data={
+            "$schema": "local://modelb-v1.0.0.json",
+            "metadata": required_rdm_metadata,
+            "files": {"enabled": False},
+        },
+    )
+    rdm_records_service.publish(identity_simple, recorda["id"])
+
+    drafts = RDMDraft.pid.resolve_many([recordb["id"], "non-existing-pid", recorda["id"]])
+    assert isinstance(drafts[0], model_b.Draft)
+    assert drafts[0].pid.pid_value == recordb["id"]
+    assert isinstance(drafts[1], PIDDoesNotExistError)
+    assert isinstance(drafts[2], model_a.Draft)
+
+    records = RDMRecord.pid.resolve_many([recorda["id"], recordb["id"]])
+    assert isinstance(records[0], model_a.Record)
+    assert isinstance(records[1], PIDDoesNotExistError)
+
+    pid_type = records[0].pid.pid_type
+    items = rdm_records_service.pids.resolve_many(
+        identity_simple, [(pid_type, "non-existing-pid"), (pid_type, recorda["id"])]
+    )
+    assert isinstance(items[0], PIDDoesNotExistError)
+    assert items[1].id == recorda["id"]
+
+
+def test_pids_service_resolve_query_count(model_a, rdm_records_service, identity_simple, search_clear):
+    draft = rdm_records_service.create(
+        identity_simple,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    rdm_records_service.publish(identity_simple, draft["id"])
+    pid_type = RDMRecord.pid.resolve(draft["id"]).pid.pid_type
+
+    with count_queries() as statements:
+        item = rdm_records_service.pids.resolve(identity_simple, draft["id"], pid_type)
+    assert item.id == draft["id"]
+    # the pid (joined with the record pid) and the record are fetched only once
+    assert len([statement for statement in statements if "pidstore_pid" in statement]) == 1
+    record_table = model_a.Record.model_cls.__tablename__
+    assert len([statement for statement in statements if f"FROM {record_table}" in statement]) == 1
+
+    with pytest.raises(PIDDoesNotExistError):
+        rdm_records_service.pids.resolve(identity_simple, "non-existing-pid", pid_type)
+
+
+def test_pids_service_resolve_many_unregistered_pids(model_a, rdm_records_service, identity_simple, search_clear):
+    draft = rdm_records_service.create(
+        identity_simple,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    rdm_records_service.publish(identity_simple, draft["id"])
+    record = RDMRecord.pid.resolve(draft["id"])
+    pid_type = record.pid.pid_type
+
+    pairs = [("doi", "10.1234/reserved"), ("doi", "10.1234/deleted"), (pid_type, draft["id"])]
+    PersistentIdentifier.create(
+        "doi", "10.1234/reserved", object_type="rec", object_uuid=record.id, status=PIDStatus.RESERVED
+    )
+    PersistentIdentifier.create(
+        "doi", "10.1234/deleted", object_type="rec", object_uuid=record.id, status=PIDStatus.DELETED
+    )
+
+    # PIDs that are not registered are resolved one by one, with the same result as resolve
+    items = rdm_records_service.pids.resolve_many(identity_simple, pairs)
+    for (scheme, value), item in zip(pairs, items, strict=True):
+        try:
+            expected = rdm_records_service.pids.resolve(identity_simple, value, scheme)
+        except Exception as e:  # noqa: BLE001 # compare whatever resolve does
+            assert type(item) is type(e)
+        else:
+            assert item.id == expected.id
+
+
+def test_pids_service_resolve_uses_overridden_resolve(
+    model_a, rdm_records_service, identity_simple, search_clear, monkeypatch
+):
+    draft = rdm_records_service.create(
+        identity_simple,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    rdm_records_service.publish(identity_simple, draft["id"])
+    pid_type = RDMRecord.pid.resolve(draft["id"]).pid.pid_type
+
+    specialized_service = model_a.proxies.current_service.pids
+    resolved = []
+
+    def resolve(identity, id_, scheme, expand=False):
+        resolved.append((scheme, id_))
+        return PIDsService.resolve(specialized_service, identity, id_, scheme, expand=expand)
+
+    monkeypatch.setattr(specialized_service, "resolve", resolve)
+
+    assert rdm_records_service.pids.resolve(identity_simple, draft["id"], pid_type).id == draft["id"]
+    (item,) = rdm_records_service.pids.resolve_many(identity_simple, [(pid_type, draft["id"])])
+    assert item.id == draft["id"]
+    assert resolved == [(pid_type, draft["id"])] * 2
+
+
 def monkeypatch_pid_provider(cls, provider, monkeypatch):
     monkeypatch.setattr(cls.pid.field, "_provider", provider)
     for extension in cls._extensions:
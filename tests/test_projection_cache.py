@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests of the cache of search hit projections."""
+
+from __future__ import annotations
+
+import time
+
+from oarepo_rdm.proxies import current_oarepo_rdm
+from oarepo_rdm.services.projection_cache import ProjectionCache
+
+from .models import modela
+
+modela_service = modela.proxies.current_service
+
+
+def test_projection_cache_lru_and_stats():
+    """The least recently used projections are evicted and lookups are counted."""
+    cache = ProjectionCache(max_size=2, ttl=60)
+    projected = []
+
+    def project(value):
+        def run():
+            projected.append(value)
+            return {"value": value, "nested": {"list": [value]}}
+
+        return run
+
+    assert cache.get_or_project("a", project("a"))["value"] == "a"
+    cache.get_or_project("b", project("b"))
+    cached = cache.get_or_project("a", project("a"))
+    cache.get_or_project("c", project("c"))  # evicts b
+    cache.get_or_project("b", project("b"))
+    assert projected == ["a", "b", "c", "b"]
+
+    # returned projections are copies, modifying them does not change the cache
+    cached["nested"]["list"].append("modified")
+    assert cache.get_or_project("b", project("b"))["nested"]["list"] == ["b"]
+
+    # hits without a key are not cached
+    cache.get_or_project(None, project("x"))
+    cache.get_or_project(None, project("x"))
+    assert projected == ["a", "b", "c", "b", "x", "x"]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.max_size) == (2, 4, 2, 2, 2)
+    assert stats.hit_rate == 2 / 6
+
+
+def test_projection_cache_ttl():
+    """Expired projections are projected again."""
+    cache = ProjectionCache(max_size=10, ttl=0.01)
+    cache.get_or_project("a", lambda: {"value": 1})
+    time.sleep(0.02)
+    assert cache.get_or_project("a", lambda: {"value": 2}) == {"value": 2}
+
+
+def test_search_uses_projection_cache(app, db, rdm_records_service, identity_simple, search_clear):
+    """Repeated searches serve unchanged records from the cache, edited records are projected again."""
+    app.config["OAREPO_RDM_PROJECTION_CACHE"] = True
+    app.extensions["oarepo-rdm"].__dict__.pop("projection_cache", None)
+    try:
+        draft = modela_service.create(
+            identity_simple,
+            {"metadata": {"title": "cached", "adescription": "first"}, "files": {"enabled": False}},
+        )
+        modela_service.draft_indexer.refresh()
+
+        first = rdm_records_service.search_drafts(identity_simple, {"q": "cached"}).to_dict()
+        second = rdm_records_service.search_drafts(identity_simple, {"q": "cached"}).to_dict()
+        assert first["hits"]["hits"] == second["hits"]["hits"]
+        assert current_oarepo_rdm.projection_cache.stats().hits == 1
+
+        modela_service.update_draft(
+            identity_simple,
+            draft["id"],
+            {"metadata": {"title": "cached", "adescription": "second"}, "files": {"enabled": False}},
+        )
+        modela_service.draft_indexer.refresh()
+        third = rdm_records_service.search_drafts(identity_simple, {"q": "cached"}).to_dict()
+        assert third["hits"]["hits"][0]["metadata"]["adescription"] == "second"
+    finally:
+        app.config["OAREPO_RDM_PROJECTION_CACHE"] = False
+        app.extensions["oarepo-rdm"].__dict__.pop("projection_cache", None)
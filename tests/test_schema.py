@@ -41,3 +41,35 @@ def test_rdm_complete_metadata():
 
     assert set(rdm_fields.items()) <= set(model_fields.items())
     assert "cdescription" in model_fields
+
+
+def test_ui_schema_dumps_many(app, rdm_records_service, identity_simple, required_rdm_metadata, search_clear):
+    """Each record of a list is dumped with itself in the context, as if it was dumped alone."""
+    projections = []
+    for name in ("CERN", "Technische Universität Wien"):
+        draft = rdm_records_service.create(
+            identity_simple,
+            data={
+                "$schema": "local://modelc-v1.0.0.json",
+                "files": {"enabled": False},
+                "metadata": {
+                    **required_rdm_metadata,
+                    "creators": [
+                        {
+                            "person_or_org": {"type": "personal", "given_name": "A", "family_name": "B"},
+                            "affiliations": [{"name": name}],
+                        }
+                    ],
+                },
+            },
+        )
+        projections.append(rdm_records_service.publish(identity_simple, draft["id"]).to_dict())
+
+    schema = modelc.RecordUISchema()
+    with app.test_request_context():
+        dumped = schema.dump(projections, many=True)
+        assert dumped == [schema.dump(projection) for projection in projections]
+    assert [item["ui"]["creators"]["affiliations"] for item in dumped] == [
+        [[1, "CERN", None]],
+        [[1, "Technische Universität Wien", None]],
+    ]
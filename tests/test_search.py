@@ -8,6 +8,11 @@
 #
 from __future__ import annotations
 
+from invenio_indexer.signals import before_record_index
+from invenio_search import current_search_client
+
+from oarepo_rdm.records.discriminator import MODEL_FACET, MODEL_FIELD, add_model_discriminator_before_index
+
 from .models import modela, modelb, modelc
 
 modela_service = modela.proxies.current_service
@@ -377,3 +382,40 @@ def test_search_eligible_services_permissions(rdm_records_service, identity_simp
     )
     assert "local://modela-v1.0.0.json" in eligible_services
     assert len(eligible_services) == 1
+
+
+def test_search_with_model_discriminator(app, db, rdm_records_service, identity_simple, search_clear, monkeypatch):
+    """Documents carry the model code, the multiplexed search filters on it and has a model facet."""
+    before_record_index.connect(add_model_discriminator_before_index)
+    app.config["OAREPO_RDM_MODEL_DISCRIMINATOR_SEARCH"] = True
+    # the merged search options are built at finalize_app, rebuild them with the model facet
+    monkeypatch.delitem(vars(app.extensions["oarepo-rdm"]), "draft_search_options")
+    try:
+        draft_a = modela_service.create(
+            identity_simple,
+            {"metadata": {"title": "discriminated", "adescription": "a"}, "files": {"enabled": False}},
+        )
+        draft_b = modelb_service.create(
+            identity_simple,
+            {"metadata": {"title": "discriminated", "bdescription": "b"}, "files": {"enabled": False}},
+        )
+        modela_service.draft_indexer.refresh()
+        modelb_service.draft_indexer.refresh()
+
+        raw = current_search_client.search(
+            index=modela_service.draft_cls.index.search_alias,
+            body={"query": {"term": {MODEL_FIELD: "modela"}}},
+        )
+        assert [hit["_source"]["id"] for hit in raw["hits"]["hits"]] == [draft_a["id"]]
+        # the discriminator is dropped whoever loads the record from the index
+        assert MODEL_FIELD not in modela_service.draft_cls.loads(raw["hits"]["hits"][0]["_source"])
+
+        result = rdm_records_service.search_drafts(identity_simple, {"q": "discriminated"}).to_dict()
+        assert {hit["id"] for hit in result["hits"]["hits"]} == {draft_a["id"], draft_b["id"]}
+        assert all(MODEL_FIELD not in hit for hit in result["hits"]["hits"])
+        assert {
+            bucket["key"]: bucket["doc_count"] for bucket in result["aggregations"][MODEL_FACET]["buckets"]
+        } == {"modela": 1, "modelb": 1}
+    finally:
+        app.config["OAREPO_RDM_MODEL_DISCRIMINATOR_SEARCH"] = False
+        before_record_index.disconnect(add_model_discriminator_before_index)
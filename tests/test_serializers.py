@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-rdm (see https://github.com/oarepo/oarepo-rdm).
+#
+# oarepo-rdm is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for lazily constructed, shared serializers."""
+
+from __future__ import annotations
+
+from flask_resources.serializers.base import BaseSerializer
+from invenio_rdm_records.resources.serializers import BibtexSerializer
+
+from oarepo_rdm.resources.records.serializers import LazySerializer, lazy_serializer, resolve_serializer
+
+constructed = []
+
+
+class ReprSerializer(BaseSerializer):
+    """Serializer returning repr of the serialized objects."""
+
+    def serialize_object(self, obj):
+        return repr(obj)
+
+    def serialize_object_list(self, obj_list):
+        return repr(obj_list)
+
+
+def counting_serializer(**kwargs):
+    constructed.append(kwargs)
+    return ReprSerializer()
+
+
+def test_lazy_serializer_is_constructed_on_first_use():
+    """The serializer is created when it is used for the first time, and only once."""
+    constructed.clear()
+    handle = LazySerializer(counting_serializer, indent=2)
+    assert constructed == []
+
+    assert handle.serialize_object({"a": 1}) == "{'a': 1}"
+    assert handle.serialize_object_list([1]) == "[1]"
+    assert constructed == [{"indent": 2}]
+    assert isinstance(resolve_serializer(handle), ReprSerializer)
+
+
+def test_lazy_serializers_are_shared():
+    """Handles with the same configuration are shared, other handles are not."""
+    first = lazy_serializer("invenio_rdm_records.resources.serializers:BibtexSerializer")
+    second = lazy_serializer("invenio_rdm_records.resources.serializers:BibtexSerializer")
+    assert first is second
+    assert isinstance(resolve_serializer(first), BibtexSerializer)
+
+    fields = lazy_serializer(counting_serializer, fields=["id", "created"])
+    assert fields is lazy_serializer(counting_serializer, fields=["id", "created"])
+    assert fields is not lazy_serializer(counting_serializer, fields=["id"])
+
+
+def test_resolve_plain_serializer():
+    """Serializers that are not lazy are returned as they are."""
+    serializer = ReprSerializer()
+    assert resolve_serializer(serializer) is serializer
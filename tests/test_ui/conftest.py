@@ -55,3 +55,15 @@ def modelb_ui_resource(app, modelb_ui_resource_config):
     from oarepo_rdm.ui.resource import RDMRecordsUIResource
 
     return RDMRecordsUIResource(modelb_ui_resource_config)
+
+
+@pytest.fixture
+def timed_ui_hooks(set_app_config_fn_scoped):
+    """Measure the form_config, empty_record and before_ui_detail hooks of the UI components.
+
+    Only the tests of the instrumentation use it, the other tests run with the default ``()``.
+    """
+    from oarepo_rdm.ui.instrumentation import register_query_counter
+
+    set_app_config_fn_scoped({"OAREPO_RDM_UI_TIMED_HOOKS": ("form_config", "empty_record", "before_ui_detail")})
+    register_query_counter()
@@ -778,3 +778,514 @@ def test_search_pattern_change_percolators(
 
         assert sets_before_change == [["test2"], []]
         assert sets_after_change == [[], ["test2"]]
+
+
+def test_serialize_oai_page_keeps_order(
+    db,
+    app,
+    rdm_records_service,
+    identity_simple,
+    vocab_fixtures,
+    required_rdm_metadata,
+    search_clear,
+    percolators,
+):
+    from flask import g
+
+    from oarepo_rdm.oai.serializer import (
+        collect_oai_page,
+        multiplexing_oai_serializer,
+        serialize_oai_page,
+    )
+
+    for schema in ("local://modela-v1.0.0.json", "local://modelb-v1.0.0.json") * 2:
+        draft = rdm_records_service.create(
+            identity_simple,
+            data={
+                "$schema": schema,
+                "metadata": required_rdm_metadata,
+                "files": {"enabled": False},
+            },
+        )
+        rdm_records_service.publish(identity_simple, draft["id"])
+
+    modela_service.indexer.refresh()
+    modelb_service.indexer.refresh()
+
+    with app.test_request_context():
+        hits = [item["json"] for item in get_records(metadataPrefix="oai_dc").items]
+        assert len({hit["_source"]["$schema"] for hit in hits}) == 2
+
+        serializer_kwargs = app.config["OAISERVER_METADATA_FORMATS"]["oai_dc"]["serializer"][1]
+        batched = serialize_oai_page(hits, **serializer_kwargs)
+        single = [multiplexing_oai_serializer(None, hit, **serializer_kwargs) for hit in hits]
+
+        assert [etree.tostring(x) for x in batched] == [etree.tostring(x) for x in single]
+
+        # the page is serialized on the first call, deleted records are left
+        # to the serialization of a single record
+        sources = [hit["_source"] for hit in hits]
+        sources[0] = {**sources[0], "is_deleted": True}
+        collect_oai_page(sources)
+        page = [multiplexing_oai_serializer(None, {"_source": source}, **serializer_kwargs) for source in sources[1:]]
+        assert id(sources[0]) not in g.oarepo_rdm_oai_page._elements  # noqa: SLF001
+        page.insert(0, multiplexing_oai_serializer(None, {"_source": sources[0]}, **serializer_kwargs))
+        assert [etree.tostring(x) for x in page] == [etree.tostring(x) for x in single]
+
+
+def test_list_records_serializes_page_at_once(
+    app,
+    rdm_records_service,
+    identity_simple,
+    vocab_fixtures,
+    required_rdm_metadata,
+    search_clear,
+    percolators,
+    monkeypatch,
+):
+    from oarepo_rdm.oai import serializer
+
+    for schema in ("local://modela-v1.0.0.json", "local://modelb-v1.0.0.json") * 3:
+        draft = rdm_records_service.create(
+            identity_simple,
+            data={
+                "$schema": schema,
+                "metadata": required_rdm_metadata,
+                "files": {"enabled": False},
+            },
+        )
+        rdm_records_service.publish(identity_simple, draft["id"])
+
+    modela_service.indexer.refresh()
+    modelb_service.indexer.refresh()
+
+    page_sizes = []
+    serialize_oai_page = serializer.serialize_oai_page
+
+    def counting_serialize_oai_page(records, model_serializers):
+        records = list(records)
+        page_sizes.append(len(records))
+        return serialize_oai_page(records, model_serializers)
+
+    monkeypatch.setattr(serializer, "serialize_oai_page", counting_serialize_oai_page)
+
+    with app.test_client() as client:
+        result = client.get("/oai2d?verb=ListRecords&metadataPrefix=oai_dc")
+    assert result.status_code == 200
+
+    tree = etree.fromstring(result.data)
+    records = tree.xpath("/x:OAI-PMH/x:ListRecords/x:record", namespaces=NAMESPACES)
+    assert len(records) == 6
+    assert all(record.xpath("x:metadata/*", namespaces=NAMESPACES) for record in records)
+    # the whole page is serialized by the first call of the serializer, no record on its own
+    assert page_sizes == [6]
+
+    # without the batch serialization, each record is serialized on its own
+    page_sizes.clear()
+    monkeypatch.setitem(app.config, "OAREPO_RDM_OAI_BATCH_SERIALIZATION", False)
+    with app.test_client() as client:
+        result = client.get("/oai2d?verb=ListRecords&metadataPrefix=oai_dc")
+    assert result.status_code == 200
+    assert page_sizes == [1] * 6
+
+
+def test_page_vocabulary_lookups():
+    from oarepo_rdm.oai.serializer import _PageMemoizingVocabularyService, page_vocabulary_lookups
+
+    calls = []
+
+    class VocabularyService:
+        def read_all(self, identity, fields, type, **kwargs):  # noqa: A002
+            calls.append((type, kwargs))
+            return object()
+
+    service = _PageMemoizingVocabularyService(VocabularyService())
+
+    with page_vocabulary_lookups():
+        first = service.read_all(None, ["id"], "resourcetypes", extra_filter={"term": {"id": "dataset"}})
+        second = service.read_all(None, ["id"], "resourcetypes", extra_filter={"term": {"id": "dataset"}})
+        service.read_all(None, ["id"], "resourcetypes", extra_filter={"term": {"id": "image"}})
+    assert first is second
+    assert len(calls) == 2
+
+    # outside of a page, every lookup goes to the service
+    service.read_all(None, ["id"], "resourcetypes", extra_filter={"term": {"id": "dataset"}})
+    assert len(calls) == 3
+
+
+def test_rebuild_percolators_keeps_sets(db, app, search_clear, percolators):
+    from oarepo_rdm.cli import rebuild_oai_percolators
+
+    percolator_alias = _build_percolator_index_name(app.config["OAISERVER_RECORD_INDEX"])
+
+    oaiset = OAISet(
+        spec="rebuilt",
+        name="rebuilt",
+        description="set surviving percolator rebuild",
+        search_pattern="metadata.title:lalala",
+        system_created=False,
+    )
+    db.session.add(oaiset)
+    db.session.commit()
+
+    previous_indices = set(current_search_client.indices.get_alias(name=percolator_alias))
+
+    result = app.test_cli_runner().invoke(rebuild_oai_percolators)
+    assert result.exit_code == 0, result.output
+
+    current_indices = set(current_search_client.indices.get_alias(name=percolator_alias))
+    assert len(current_indices) == 1
+    assert not current_indices & previous_indices
+    assert not any(current_search_client.indices.exists(index=index) for index in previous_indices)
+
+    current_search_client.indices.refresh(index=percolator_alias)
+    assert current_search_client.exists(index=percolator_alias, id="oaiset-rebuilt")
+
+    # queries of sets deleted while the index was being filled are removed
+    from oarepo_rdm.oai.percolator import _sync_oai_set_queries
+
+    (current_index,) = current_indices
+    current_search_client.index(
+        index=current_index, id="oaiset-deleted", body={"query": {"match_all": {}}}, refresh=True
+    )
+    _sync_oai_set_queries(current_index)
+    assert not current_search_client.exists(index=percolator_alias, id="oaiset-deleted")
+    assert current_search_client.exists(index=percolator_alias, id="oaiset-rebuilt")
+
+    # percolator index of a previous version has the name of the alias
+    current_search_client.indices.delete(index=current_index)
+    current_search_client.indices.create(index=percolator_alias)
+    result = app.test_cli_runner().invoke(rebuild_oai_percolators)
+    assert result.exit_code == 0, result.output
+    assert current_search_client.indices.exists_alias(name=percolator_alias)
+    assert current_search_client.exists(index=percolator_alias, id="oaiset-rebuilt")
+
+
+def test_percolator_lookup_does_not_put_mapping(db, app, search_clear, percolators, monkeypatch):
+    from invenio_oaiserver import percolator as oaiserver_percolator
+
+    from oarepo_rdm.oai.percolator import percolator_index_name
+
+    def put_mapping(*args, **kwargs):
+        raise AssertionError("put_mapping must not be called when the percolator index is looked up")
+
+    monkeypatch.setattr(current_search_client.indices, "put_mapping", put_mapping)
+
+    record_index = app.config["OAISERVER_RECORD_INDEX"]
+    assert oaiserver_percolator._build_percolator_index_name(record_index) == percolator_index_name()  # noqa: SLF001
+    assert oaiserver_percolator._build_percolator_index_name(f"{record_index}-percolators") == (  # noqa: SLF001
+        percolator_index_name()
+    )
+
+    # registering the query of a new set and percolating records look the index up as well
+    db.session.add(
+        OAISet(
+            spec="no-put-mapping",
+            name="no-put-mapping",
+            description="set registered without putting the mapping",
+            search_pattern="metadata.title:lalala",
+            system_created=False,
+        )
+    )
+    db.session.commit()
+    current_search_client.indices.refresh(index=percolator_index_name())
+    assert oaiserver_percolator.sets_search_all([{"metadata": {"title": "lalala"}}]) == [["no-put-mapping"]]
+
+
+def test_index_time_oai_sets(
+    db,
+    app,
+    rdm_records_service,
+    identity_simple,
+    search_clear,
+    percolators,
+):
+    from oarepo_rdm.oai.sets import percolate_oai_sets, record_list_sets_fetcher
+
+    record = rdm_records_service.create(
+        identity_simple,
+        data={
+            "$schema": "local://modela-v1.0.0.json",
+            "metadata": {"title": "indexed", "adescription": "bbbb"},
+            "files": {"enabled": False},
+        },
+    )
+    record = rdm_records_service.publish(identity_simple, record["id"])
+
+    oaiset = OAISet(
+        spec="indexed",
+        name="indexed",
+        description="set stored at index time",
+        search_pattern="metadata.title:indexed",
+        system_created=False,
+    )
+    db.session.add(oaiset)
+    db.session.commit()
+    current_search_client.indices.refresh(index=_build_percolator_index_name(app.config["OAISERVER_RECORD_INDEX"]))
+
+    dump = record._record.dumps()  # noqa: SLF001
+    assert percolate_oai_sets([dump]) == [["indexed"]]
+
+    # stored sets are used without percolation, missing ones are percolated
+    assert record_list_sets_fetcher([{**dump, "oai_sets": ["stored"]}, dump]) == [["stored"], ["indexed"]]
+
+
+def test_list_verbs_use_index_time_oai_sets(
+    db,
+    app,
+    rdm_records_service,
+    identity_simple,
+    search_clear,
+    percolators,
+    monkeypatch,
+):
+    from invenio_indexer.signals import before_record_index
+
+    from oarepo_rdm.oai import response, sets
+
+    db.session.add(
+        OAISet(
+            spec="stored",
+            name="stored",
+            description="set stored at index time",
+            search_pattern="metadata.title:stored",
+            system_created=False,
+        )
+    )
+    db.session.commit()
+
+    before_record_index.connect(sets.add_oai_sets_before_index)
+    try:
+        record = rdm_records_service.create(
+            identity_simple,
+            data={
+                "$schema": "local://modela-v1.0.0.json",
+                "metadata": {"title": "stored", "adescription": "bbbb"},
+                "files": {"enabled": False},
+            },
+        )
+        rdm_records_service.publish(identity_simple, record["id"])
+    finally:
+        before_record_index.disconnect(sets.add_oai_sets_before_index)
+    modela_service.indexer.refresh()
+
+    monkeypatch.setitem(app.config, "OAREPO_RDM_OAI_INDEX_TIME_SETS", True)
+    monkeypatch.setitem(app.config, "OAISERVER_RECORD_SETS_FETCHER", sets.record_sets_fetcher)
+    monkeypatch.setitem(app.config, "OAISERVER_SET_RECORDS_QUERY_FETCHER", sets.set_records_query)
+
+    def no_percolation(*args, **kwargs):
+        raise AssertionError("records must not be percolated")
+
+    monkeypatch.setattr(response, "sets_search_all", no_percolation)
+    monkeypatch.setattr(sets, "percolate_oai_sets", no_percolation)
+
+    with app.test_client() as client:
+        for query in (
+            "verb=ListIdentifiers&metadataPrefix=oai_dc",
+            "verb=ListRecords&metadataPrefix=oai_dc",
+            "verb=ListIdentifiers&metadataPrefix=oai_dc&set=stored",
+        ):
+            result = client.get(f"/oai2d?{query}")
+            assert result.status_code == 200, query
+
+            tree = etree.fromstring(result.data)
+            set_specs = tree.xpath("//x:header/x:setSpec/text()", namespaces=NAMESPACES)
+            assert set_specs == ["stored"], query
+
+
+def test_oai_set_percolators_updated_after_commit(db, app, search_clear, percolators, monkeypatch):
+    from oarepo_rdm.oai import percolator
+
+    updates = []
+    monkeypatch.setattr(percolator, "update_oai_set_percolators", lambda patterns: updates.append(dict(patterns)))
+
+    # rolled back changes do not reach the percolators
+    db.session.add(OAISet(spec="rolled-back", name="rolled-back", search_pattern="title:x", system_created=False))
+    db.session.flush()
+    assert updates == []
+    db.session.rollback()
+    assert updates == []
+
+    oaiset = OAISet(spec="committed", name="committed", search_pattern="title:x", system_created=False)
+    db.session.add(oaiset)
+    db.session.flush()
+    assert updates == []
+    db.session.commit()
+    assert updates == [{"committed": "title:x"}]
+
+    oaiset.search_pattern = "title:y"
+    db.session.commit()
+    assert updates[-1] == {"committed": "title:y"}
+
+    db.session.delete(oaiset)
+    db.session.commit()
+    assert updates[-1] == {"committed": None}
+
+
+def test_slim_percolator_mapping(
+    db,
+    app,
+    rdm_records_service,
+    identity_simple,
+    search_clear,
+    monkeypatch,
+):
+    from oarepo_rdm.oai import tasks
+    from oarepo_rdm.oai.percolator import init_percolators
+    from oarepo_rdm.oai.percolator_mapping import create_slim_percolator_mapping
+    from oarepo_rdm.oai.sets import percolate_oai_sets
+
+    monkeypatch.setitem(app.config, "OAREPO_PERCOLATOR_MAPPING", create_slim_percolator_mapping)
+    db.session.add(
+        OAISet(
+            spec="slim-title",
+            name="slim-title",
+            description="set querying the title",
+            search_pattern="metadata.title:slim",
+            system_created=False,
+        )
+    )
+    db.session.commit()
+    init_percolators()
+
+    percolator_alias = _build_percolator_index_name(app.config["OAISERVER_RECORD_INDEX"])
+    (mapping,) = current_search_client.indices.get_mapping(index=percolator_alias).values()
+    assert "adescription" not in mapping["mappings"]["properties"]["metadata"]["properties"]
+
+    record = rdm_records_service.create(
+        identity_simple,
+        data={
+            "$schema": "local://modela-v1.0.0.json",
+            "metadata": {"title": "slim", "adescription": "bbbb"},
+            "files": {"enabled": False},
+        },
+    )
+    record = rdm_records_service.publish(identity_simple, record["id"])
+
+    # the whole document is percolated, including fields that are not in the slim mapping
+    dump = record._record.dumps()  # noqa: SLF001
+    assert percolate_oai_sets([dump]) == [["slim-title"]]
+
+    # a set querying a field that is not in the slim mapping queues a rebuild of the percolator index
+    queued = []
+    monkeypatch.setattr(tasks.rebuild_oai_percolators, "delay", lambda: queued.append("rebuild"))
+    db.session.add(
+        OAISet(
+            spec="slim-description",
+            name="slim-description",
+            description="set querying the description",
+            search_pattern="metadata.adescription:bbbb",
+            system_created=False,
+        )
+    )
+    db.session.commit()
+    assert queued == ["rebuild"]
+
+    tasks.rebuild_oai_percolators()
+    assert percolate_oai_sets([dump]) == [["slim-description", "slim-title"]]
+
+
+def test_reconcile_oai_set_membership(
+    db,
+    app,
+    rdm_records_service,
+    identity_simple,
+    search_clear,
+    percolators,
+    monkeypatch,
+):
+    from invenio_indexer.signals import before_record_index
+    from invenio_search.engine import dsl
+    from invenio_search.utils import build_index_name
+
+    from oarepo_rdm.oai import tasks
+    from oarepo_rdm.oai.sets import (
+        add_oai_sets_before_index,
+        percolate_oai_sets,
+        register_oai_set_change_listeners,
+        set_records_query,
+    )
+
+    register_oai_set_change_listeners()
+    queued = []
+    monkeypatch.setattr(tasks.reconcile_oai_set_membership, "delay", queued.append)
+    before_record_index.connect(add_oai_sets_before_index)
+    try:
+        record = rdm_records_service.create(
+            identity_simple,
+            data={
+                "$schema": "local://modela-v1.0.0.json",
+                "metadata": {"title": "reconciled", "adescription": "bbbb"},
+                "files": {"enabled": False},
+            },
+        )
+        record = rdm_records_service.publish(identity_simple, record["id"])
+        modela_service.indexer.refresh()
+
+        records_search = dsl.Search(
+            using=current_search_client,
+            index=build_index_name(app.config["OAISERVER_RECORD_INDEX"], suffix="", app=app),
+        ).query(set_records_query("reconciled"))
+        assert records_search.count() == 0
+
+        db.session.add(
+            OAISet(
+                spec="reconciled",
+                name="reconciled",
+                description="set reconciled after commit",
+                search_pattern="metadata.title:reconciled",
+                system_created=False,
+            )
+        )
+        db.session.commit()
+
+        # the task is queued after commit, with the set query already searchable
+        assert queued == [["reconciled"]]
+        assert percolate_oai_sets([record._record.dumps()]) == [["reconciled"]]  # noqa: SLF001
+
+        tasks.reconcile_oai_set_membership(queued[0])
+        modela_service.indexer.process_bulk_queue()
+        modela_service.indexer.refresh()
+        assert records_search.count() == 1
+
+        # rolled back changes are not reconciled
+        db.session.add(OAISet(spec="rolled-back", name="rolled-back", system_created=False))
+        db.session.flush()
+        db.session.rollback()
+        assert queued == [["reconciled"]]
+    finally:
+        before_record_index.disconnect(add_oai_sets_before_index)
+
+
+def test_get_percolated_mappings(app, search_clear):
+    from invenio_search.utils import build_index_name
+
+    from oarepo_rdm.oai.percolator import _get_percolated_mappings
+
+    oaiserver_record_index = str(app.config["OAISERVER_RECORD_INDEX"])
+    prefixed_oaiserver_record_index = build_index_name(oaiserver_record_index, suffix="", app=app)
+
+    aliased = [f"{prefixed_oaiserver_record_index}-percolated-{name}" for name in ("a", "b", "c")]
+    not_aliased = f"{prefixed_oaiserver_record_index}-not-percolated"
+    try:
+        for index_name in aliased:
+            current_search_client.indices.create(
+                index=index_name,
+                body={
+                    "aliases": {prefixed_oaiserver_record_index: {}},
+                    "mappings": {"properties": {index_name.rsplit("-", 1)[-1]: {"type": "keyword"}}},
+                },
+            )
+        current_search_client.indices.create(index=not_aliased, body={"mappings": {"properties": {}}})
+
+        mappings = _get_percolated_mappings(oaiserver_record_index, prefixed_oaiserver_record_index)
+
+        assert set(aliased) <= set(mappings)
+        assert not_aliased not in mappings
+        for index_name in aliased:
+            field = index_name.rsplit("-", 1)[-1]
+            assert mappings[index_name]["mappings"]["properties"][field] == {"type": "keyword"}
+            assert prefixed_oaiserver_record_index in mappings[index_name]["aliases"]
+    finally:
+        for index_name in [*aliased, not_aliased]:
+            current_search_client.indices.delete(index=index_name, ignore=[404])
@@ -13,11 +13,24 @@ from __future__ import annotations
 import json
 
 import idutils
+import pytest
 from flask import g
+from invenio_access.permissions import system_identity
+from invenio_app_rdm.records_ui.views.deposits import VocabulariesOptions
 from invenio_i18n import lazy_gettext as _
 from invenio_rdm_records.services.pids import providers
-
+from invenio_vocabularies.proxies import current_service as current_vocabularies_service
+from invenio_vocabularies.records.api import Vocabulary
+
+from oarepo_rdm.ui import memberships
+from oarepo_rdm.ui.components import (
+    communities_memberships_dump,
+    pids_config_dump,
+    rdm_vocabularies_dump,
+)
 from oarepo_rdm.ui.config import RDMRecordsUIResourceConfig
+from oarepo_rdm.ui.instrumentation import add_server_timing_header, component_timings, record_component_timing
+from oarepo_rdm.ui.vocabularies import invalidate_vocabulary_options, vocabulary_options
 
 
 def make_pid_providers():
@@ -111,6 +124,158 @@ def test_form_config_contains_communities_memberships_and_vocabularies(
     assert "type" in vocabularies["dates"]
 
 
+def test_vocabulary_options_are_cached(app, db, vocab_fixtures, monkeypatch):
+    """Test that vocabulary options are dumped once and refreshed when a vocabulary changes."""
+    dumps = []
+    original_dump = VocabulariesOptions.dump
+
+    def counting_dump(self):
+        dumps.append(self)
+        return original_dump(self)
+
+    monkeypatch.setattr(VocabulariesOptions, "dump", counting_dump)
+    invalidate_vocabulary_options()
+
+    with app.test_request_context():
+        g.identity = system_identity
+        first = vocabulary_options()
+        second = vocabulary_options()
+        assert first == second
+        assert len(dumps) == 1
+
+        current_vocabularies_service.create(
+            system_identity,
+            {"type": "titletypes", "id": "cached-title-type", "title": {"en": "Cached"}},
+        )
+        Vocabulary.index.refresh()
+
+        third = vocabulary_options()
+        assert len(dumps) == 2
+        assert any(option["value"] == "cached-title-type" for option in third["titles"]["type"])
+
+
+def test_community_memberships_are_cached(app, db, users, monkeypatch):
+    """Test that memberships are read once per user until invalidated."""
+    reads = []
+
+    def read_memberships(identity):
+        reads.append(identity.id)
+        return {f"community-{identity.id}": "owner"}
+
+    monkeypatch.setattr(memberships, "_read_memberships", read_memberships)
+    first, second = users[0], users[1]
+    memberships.invalidate_user_communities_memberships({first.id, second.id})
+
+    assert memberships.user_communities_memberships(first.identity) == {f"community-{first.id}": "owner"}
+    assert memberships.users_communities_memberships([first.identity, second.identity]) == [
+        {f"community-{first.id}": "owner"},
+        {f"community-{second.id}": "owner"},
+    ]
+    assert reads == [first.id, second.id]
+
+    memberships.invalidate_user_communities_memberships({first.id})
+    memberships.user_communities_memberships(first.identity)
+    assert reads == [first.id, second.id, first.id]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_prefetch_component_loads_dependencies_once(
+    app, db, modela_ui_resource_config, modela_ui_resource, set_app_config_fn_scoped, monkeypatch, workers
+):
+    """Test that data declared by components is loaded once, before the form_config hooks run."""
+    set_app_config_fn_scoped({"OAREPO_RDM_UI_PREFETCH_WORKERS": workers})
+    loads = []
+
+    def loader(name, value):
+        def load(*_args, **_kwargs):
+            loads.append(name)
+            return value
+
+        return load
+
+    monkeypatch.setattr(rdm_vocabularies_dump, "vocabulary_options", loader("vocabularies", {"v": 1}))
+    monkeypatch.setattr(
+        communities_memberships_dump, "user_communities_memberships", loader("memberships", {"c": "owner"})
+    )
+    monkeypatch.setattr(pids_config_dump, "get_form_pids_config", loader("pids", [{"scheme": "doi"}]))
+
+    fc = modela_ui_resource_config.form_config()
+    with app.test_request_context():
+        g.identity = system_identity
+        modela_ui_resource.run_components(
+            "form_config",
+            form_config=fc,
+            layout="",
+            resource=modela_ui_resource,
+            api_record=None,
+            record={},
+            data={},
+            identity=system_identity,
+            extra_context={},
+            ui_links={},
+        )
+        timings = [timing.label for timing in component_timings() if not timing.label.startswith("Prefetch")]
+
+    assert sorted(loads) == ["memberships", "pids", "vocabularies"]
+    assert fc["vocabularies"] == {"v": 1}
+    assert fc["user_communities_memberships"] == {"c": "owner"}
+    assert fc["pids"] == [{"scheme": "doi"}]
+    assert sorted(timings) == [
+        "CommunitiesMembershipsComponent.user_communities_memberships",
+        "RDMPIDsConfigComponent.pids_config",
+        "RDMVocabularyOptionsComponent.vocabularies",
+    ]
+
+
+def _form_config_timings(app, resource_config, resource):
+    """Run the form_config hooks of the resource and return the measurements taken in the request."""
+    with app.test_request_context():
+        g.identity = system_identity
+        resource.run_components(
+            "form_config",
+            form_config=resource_config.form_config(),
+            layout="",
+            resource=resource,
+            api_record=None,
+            record={},
+            data={},
+            identity=system_identity,
+            extra_context={},
+            ui_links={},
+        )
+        return {timing.label: timing for timing in component_timings()}
+
+
+def test_component_hooks_are_timed(app, db, modelb_ui_resource_config, modelb_ui_resource, timed_ui_hooks):
+    """Test that each component running a timed hook is measured."""
+    timings = _form_config_timings(app, modelb_ui_resource_config, modelb_ui_resource)
+
+    assert "RDMVocabularyOptionsComponent.form_config" in timings
+    assert "FilesQuotaAndTransferComponent.form_config" in timings
+    assert all(timing.duration >= 0 and timing.queries >= 0 for timing in timings.values())
+
+
+def test_component_hooks_are_not_timed_by_default(app, db, modelb_ui_resource_config, modelb_ui_resource):
+    """Test that the hooks run without instrumentation with the default configuration."""
+    assert app.config["OAREPO_RDM_UI_TIMED_HOOKS"] == ()
+
+    timings = _form_config_timings(app, modelb_ui_resource_config, modelb_ui_resource)
+
+    assert not any(label.endswith(".form_config") for label in timings)
+
+
+def test_server_timing_header(app, set_app_config_fn_scoped):
+    """Test that the measurements are returned in the Server-Timing header only if enabled."""
+    with app.test_request_context():
+        record_component_timing("FilesComponent.form_config", 0.0125, 3)
+        set_app_config_fn_scoped({"OAREPO_RDM_UI_SERVER_TIMING": False})
+        assert "Server-Timing" not in add_server_timing_header(app.response_class()).headers
+
+        set_app_config_fn_scoped({"OAREPO_RDM_UI_SERVER_TIMING": True})
+        response = add_server_timing_header(app.response_class())
+        assert response.headers.getlist("Server-Timing") == ['FilesComponent.form_config;dur=12.50;desc="3 queries"']
+
+
 def test_modelb_uses_rdm_records_ui_resource_config(modelb_ui_resource_config):
     """Test that ModelbUIResourceConfig inherits from RDMRecordsUIResourceConfig."""
     assert isinstance(modelb_ui_resource_config, RDMRecordsUIResourceConfig)
@@ -34,17 +34,26 @@ def test_uploads_new_single_model_redirect(app, logged_client, users, extra_entr
 
 
 def test_uploads_new_single_model_with_community(app, logged_client, users, extra_entry_points, monkeypatch):
-    """Test that /uploads/new preserves the community query parameter when redirecting."""
+    """Test that /uploads/new preserves the community query parameter when redirecting, without resolving it."""
+    from oarepo_rdm.ui import new_upload
+
     monkeypatch.setitem(
         app.config,
         "OAREPO_MODELS",
         {"modelb": app.config["OAREPO_MODELS"]["modelb"]},
     )
+
+    def resolve_community(slug):
+        raise AssertionError(f"community {slug} should not be looked up")
+
+    monkeypatch.setattr(new_upload, "_resolve_community", resolve_community)
+    new_upload.clear_model_choosers()
     client = logged_client(users[0])
     with client.get("/uploads/new?community=test-community") as resp:
         assert resp.status_code == 302
         assert "/modelb/uploads/new" in resp.location
         assert "community=test-community" in resp.location
+    assert not new_upload._choosers  # noqa: SLF001
 
 
 def test_uploads_new_multiple_models_renders_selection(app, logged_client, users, extra_entry_points, monkeypatch):
@@ -96,3 +105,66 @@ def test_uploads_new_single_model_without_ui_blueprint_name(app, logged_client,
     client = logged_client(users[0])
     with client.get("/uploads/new") as resp:
         assert resp.status_code == 404
+
+
+def test_uploads_new_model_list_is_cached(app, logged_client, users, extra_entry_points, monkeypatch):
+    """Test that the model cards are rendered once per community and then served from the cache."""
+    from oarepo_rdm.ui import new_upload
+
+    monkeypatch.setitem(
+        app.config,
+        "OAREPO_MODELS",
+        {
+            "modelb": app.config["OAREPO_MODELS"]["modelb"],
+            "modelc": app.config["OAREPO_MODELS"]["modelc"],
+        },
+    )
+    rendered = []
+    original_render_template = new_upload.render_template
+
+    def render_template(template, **kwargs):
+        rendered.append(template)
+        return original_render_template(template, **kwargs)
+
+    monkeypatch.setattr(new_upload, "render_template", render_template)
+    new_upload.clear_model_choosers()
+    client = logged_client(users[0])
+
+    for _ in range(2):
+        with client.get("/uploads/new") as resp:
+            assert resp.status_code == 200
+            assert "/modelc/uploads/new" in resp.data.decode()
+    assert rendered == ["oarepo_rdm/new_upload_page_models.html"]
+
+    # unknown communities are not cached, so arbitrary query arguments do not fill the cache
+    for _ in range(2):
+        with client.get("/uploads/new?community=test-community") as resp:
+            assert resp.status_code == 200
+            assert "community=test-community" in resp.data.decode()
+    assert len(rendered) == 3
+    assert len(new_upload._choosers) == 1  # noqa: SLF001
+
+
+def test_uploads_new_model_list_cache_evicts_least_recently_used(
+    app, logged_client, users, extra_entry_points, monkeypatch
+):
+    """The least recently used chooser is evicted when the cache is full."""
+    from oarepo_rdm.ui import new_upload
+
+    monkeypatch.setitem(
+        app.config,
+        "OAREPO_MODELS",
+        {
+            "modelb": app.config["OAREPO_MODELS"]["modelb"],
+            "modelc": app.config["OAREPO_MODELS"]["modelc"],
+        },
+    )
+    monkeypatch.setattr(new_upload, "MAX_CACHED_CHOOSERS", 2)
+    monkeypatch.setattr(new_upload, "_resolve_community", lambda slug: (f"id-{slug}", slug))
+    new_upload.clear_model_choosers()
+    client = logged_client(users[0])
+
+    for community in ("a", "b", "a", "c"):
+        with client.get(f"/uploads/new?community={community}") as resp:
+            assert resp.status_code == 200
+    assert [key[2] for key in new_upload._choosers] == [("id-a", "a"), ("id-c", "c")]  # noqa: SLF001
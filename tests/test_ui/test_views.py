@@ -10,6 +10,12 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_records_resources.services.records.results import RecordItem
+
+from oarepo_rdm.ui import views
 from tests.models import modela
 
 modela_service = modela.proxies.current_service
@@ -141,3 +147,55 @@ def test_record_detail_parent_pid_redirects_to_latest(app, search_clear, rdm_rec
     response = client.get(f"/records/{parent_id}")
     assert response.status_code == 302
     assert "latest" in response.location
+
+
+def test_record_detail_parent_pid_of_other_pid_type_redirects_to_latest(
+    app, search_clear, rdm_records_service, users, client, monkeypatch
+):
+    """Test that the parent id is redirected to the latest version when the resolver does not know its pid type."""
+    user = users[0]
+    draft = rdm_records_service.create(
+        user.identity,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    published = rdm_records_service.publish(user.identity, draft["id"])
+    parent_id = published.to_dict()["parent"]["id"]
+
+    modela_service.indexer.refresh()
+
+    def resolve(pid_value, **_kwargs):
+        raise PIDDoesNotExistError("recid", pid_value)
+
+    # the view resolves the pid of the record itself, the service then resolves the parent id
+    monkeypatch.setattr(views, "RDMRecord", SimpleNamespace(pid=SimpleNamespace(resolve=resolve)))
+
+    response = client.get(f"/records/{parent_id}")
+    assert response.status_code == 302
+    assert "latest" in response.location
+
+
+def test_redirects_do_not_serialize_record(app, search_clear, rdm_records_service, users, client, monkeypatch):
+    """Test that live records and drafts are redirected to without dumping them through the service schema."""
+    user = users[0]
+    draft = rdm_records_service.create(
+        user.identity,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    other_draft = rdm_records_service.create(
+        user.identity,
+        data={"$schema": "local://modela-v1.0.0.json", "files": {"enabled": False}},
+    )
+    published = rdm_records_service.publish(user.identity, draft["id"])
+
+    def fail_to_dict(*_args, **_kwargs):
+        raise AssertionError("record should not be serialized")
+
+    monkeypatch.setattr(RecordItem, "to_dict", fail_to_dict)
+
+    response = client.get(f"/records/{published['id']}")
+    assert response.status_code == 302
+    assert response.location.endswith(f"/modela_ui/record_detail/{published['id']}")
+
+    response = client.get(f"/uploads/{other_draft['id']}")
+    assert response.status_code == 302
+    assert response.location.endswith(f"/modela_ui/deposit_edit/{other_draft['id']}")
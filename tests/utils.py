@@ -8,9 +8,15 @@
 #
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from invenio_db import db
+from sqlalchemy import event
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from invenio_records_resources.records.api import Record
     from invenio_records_resources.services.records.results import RecordItem
 
@@ -18,3 +24,18 @@ if TYPE_CHECKING:
 def record_from_result(result: RecordItem) -> Record:
     """Convert a service result to a record."""
     return result._record  # type: ignore[no-any-return]  # noqa SLF001 access private member
+
+
+@contextmanager
+def count_queries() -> Iterator[list[str]]:
+    """Collect SQL statements executed inside the block."""
+    statements: list[str] = []
+
+    def before_cursor_execute(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)